@@ -52,17 +52,14 @@ def demo_automated_trading():
     recommendations = []
     lang_config = LanguageConfig("en")
 
-    for symbol in portfolio_symbols:
+    # Fetch data for all symbols with one batched download
+    print(f"   📡 Fetching data for {len(portfolio_symbols)} symbols...")
+    analyzers = StockAnalyzer.bulk_fetch(portfolio_symbols, "1y", lang_config)
+
+    for symbol, analyzer in analyzers.items():
         try:
             print(f"\\n🔍 Analyzing {symbol}...")
 
-            # Create analyzer for the stock
-            analyzer = StockAnalyzer(symbol)
-
-            # Fetch data first
-            print(f"   📡 Fetching data for {symbol}...")
-            analyzer.fetch_data()
-
             # Create recommendation engine
             recommendation_engine = RecommendationEngine(analyzer, lang_config)
 
@@ -15,31 +15,37 @@ Usage:
 
 import sys
 import os
+import functools
 from datetime import datetime
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.portfolio import PortfolioManager, PortfolioAnalyzer, StrategyType
+from src.portfolio import PortfolioManager, PortfolioAnalyzer, StrategyType, PortfolioNotFoundError
+
+
+def write_lines(lines):
+    """Write a block of lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_header(title: str):
     """Print formatted section header."""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}")
+    write_lines([f"\n{'='*60}", f"  {title}", f"{'='*60}"])
 
 
 def print_portfolio_info(portfolio):
     """Print detailed portfolio information."""
-    print(f"\n📊 Portfolio: {portfolio.name}")
-    print(f"   Strategy: {portfolio.strategy_type.value}")
-    print(f"   Description: {portfolio.description}")
-    print(f"   Holdings: {len(portfolio.holdings)}")
-    print(f"   Total Weight: {portfolio.total_weight:.1%}")
+    lines = [
+        f"\n📊 Portfolio: {portfolio.name}",
+        f"   Strategy: {portfolio.strategy_type.value}",
+        f"   Description: {portfolio.description}",
+        f"   Holdings: {len(portfolio.holdings)}",
+        f"   Total Weight: {portfolio.total_weight:.1%}",
+    ]
     
     if portfolio.holdings:
-        print(f"\n   📈 Holdings:")
+        lines.append(f"\n   📈 Holdings:")
         for holding in portfolio.holdings:
             target_info = f" → {holding.target_weight:.1%}" if holding.target_weight else ""
             deviation_info = ""
@@ -48,31 +54,44 @@ def print_portfolio_info(portfolio):
                 if deviation:
                     deviation_info = f" ({deviation:+.1%})"
             
-            print(f"     {holding.symbol}: {holding.weight:.1%}{target_info}{deviation_info}")
+            lines.append(f"     {holding.symbol}: {holding.weight:.1%}{target_info}{deviation_info}")
             if holding.notes:
-                print(f"       Notes: {holding.notes}")
+                lines.append(f"       Notes: {holding.notes}")
+    
+    write_lines(lines)
+
+
+def find_portfolio(manager, name: str):
+    """Look up a portfolio by name, returning None if it does not exist."""
+    try:
+        return manager.get_portfolio(name)
+    except PortfolioNotFoundError:
+        return None
 
 
 def print_analysis_summary(analysis_results):
     """Print portfolio analysis summary."""
-    print(f"\n🔍 Analysis Summary:")
-    
     overall = analysis_results['overall_recommendation']
     metrics = analysis_results['portfolio_metrics']
     risk = analysis_results['risk_assessment']
     
-    print(f"   Recommendation: {overall['strength']} ({overall['confidence']:.0%} confidence)")
-    print(f"   Expected Return: {metrics['expected_return']:.1%}")
-    print(f"   Risk Level: {risk['risk_level']} (Score: {risk['risk_score']:.2f})")
-    print(f"   Diversification: {metrics['diversification_score']:.0%}")
-    print(f"   Reason: {overall['reason']}")
+    lines = [
+        f"\n🔍 Analysis Summary:",
+        f"   Recommendation: {overall['strength']} ({overall['confidence']:.0%} confidence)",
+        f"   Expected Return: {metrics['expected_return']:.1%}",
+        f"   Risk Level: {risk['risk_level']} (Score: {risk['risk_score']:.2f})",
+        f"   Diversification: {metrics['diversification_score']:.0%}",
+        f"   Reason: {overall['reason']}",
+    ]
     
     if risk['risk_factors']:
-        print(f"   Risk Factors: {', '.join(risk['risk_factors'])}")
+        lines.append(f"   Risk Factors: {', '.join(risk['risk_factors'])}")
     
     rebalance_suggestions = analysis_results.get('rebalance_suggestions', [])
     if rebalance_suggestions:
-        print(f"   Rebalancing: {len(rebalance_suggestions)} suggestions available")
+        lines.append(f"   Rebalancing: {len(rebalance_suggestions)} suggestions available")
+    
+    write_lines(lines)
 
 
 def demo_portfolio_creation():
@@ -83,10 +102,7 @@ def demo_portfolio_creation():
     
     # Clean up any existing demo portfolios first
     print("🧹 Cleaning up any existing demo portfolios...")
-    existing_demos = []
-    for portfolio in manager.list_portfolios():
-        if "Demo" in portfolio.name:
-            existing_demos.append(portfolio.name)
+    existing_demos = [name for name in manager.portfolios if "Demo" in name]
     
     for demo_name in existing_demos:
         try:
@@ -105,10 +121,11 @@ def demo_portfolio_creation():
         strategy_type=StrategyType.AGGRESSIVE
     )
     
-    manager.add_stock("Demo Tech Growth", "AAPL", 0.30, target_weight=0.25, notes="iPhone growth story")
-    manager.add_stock("Demo Tech Growth", "MSFT", 0.25, target_weight=0.25, notes="Cloud computing leader")
-    manager.add_stock("Demo Tech Growth", "GOOGL", 0.25, target_weight=0.25, notes="AI and search dominance")
-    manager.add_stock("Demo Tech Growth", "TSLA", 0.20, target_weight=0.25, notes="EV market leader")
+    with manager.batched_saves():
+        manager.add_stock("Demo Tech Growth", "AAPL", 0.30, target_weight=0.25, notes="iPhone growth story")
+        manager.add_stock("Demo Tech Growth", "MSFT", 0.25, target_weight=0.25, notes="Cloud computing leader")
+        manager.add_stock("Demo Tech Growth", "GOOGL", 0.25, target_weight=0.25, notes="AI and search dominance")
+        manager.add_stock("Demo Tech Growth", "TSLA", 0.20, target_weight=0.25, notes="EV market leader")
     
     # Balanced conservative portfolio
     balanced_portfolio = manager.create_portfolio(
@@ -117,22 +134,30 @@ def demo_portfolio_creation():
         strategy_type=StrategyType.CONSERVATIVE
     )
     
-    manager.add_stock("Demo Balanced", "VTI", 0.40, target_weight=0.35, notes="US total market")
-    manager.add_stock("Demo Balanced", "BND", 0.25, target_weight=0.30, notes="Bond exposure")
-    manager.add_stock("Demo Balanced", "VEA", 0.20, target_weight=0.20, notes="International developed")
-    manager.add_stock("Demo Balanced", "VWO", 0.15, target_weight=0.15, notes="Emerging markets")
+    with manager.batched_saves():
+        manager.add_stock("Demo Balanced", "VTI", 0.40, target_weight=0.35, notes="US total market")
+        manager.add_stock("Demo Balanced", "BND", 0.25, target_weight=0.30, notes="Bond exposure")
+        manager.add_stock("Demo Balanced", "VEA", 0.20, target_weight=0.20, notes="International developed")
+        manager.add_stock("Demo Balanced", "VWO", 0.15, target_weight=0.15, notes="Emerging markets")
     
     print("✅ Sample portfolios created successfully!")
     
     return manager, tech_portfolio, balanced_portfolio
 
 
+@functools.lru_cache(maxsize=None)
+def _get_fixture():
+    """Build the shared demo manager, portfolios and analyzer once."""
+    manager, tech_portfolio, balanced_portfolio = demo_portfolio_creation()
+    analyzer = PortfolioAnalyzer(language='en')
+    return manager, tech_portfolio, balanced_portfolio, analyzer
+
+
 def demo_portfolio_analysis():
     """Demonstrate portfolio analysis functionality."""
     print_header("Portfolio Analysis")
     
-    manager, tech_portfolio, balanced_portfolio = demo_portfolio_creation()
-    analyzer = PortfolioAnalyzer(language='en')
+    _, tech_portfolio, balanced_portfolio, analyzer = _get_fixture()
     
     # Analyze each portfolio
     for portfolio in [tech_portfolio, balanced_portfolio]:
@@ -149,15 +174,13 @@ def demo_portfolio_analysis():
             print(f"     {symbol}: {stock_analysis['recommendation']} "
                   f"({stock_analysis['confidence']:.0%} confidence, "
                   f"Risk: {stock_analysis['risk_score']:.2f})")
-    
-    return manager, analyzer, tech_portfolio, balanced_portfolio
 
 
 def demo_portfolio_comparison():
     """Demonstrate portfolio comparison functionality."""
     print_header("Portfolio Comparison")
     
-    manager, analyzer, tech_portfolio, balanced_portfolio = demo_portfolio_analysis()
+    _, tech_portfolio, balanced_portfolio, analyzer = _get_fixture()
     
     print(f"🔄 Comparing portfolios...")
     comparison = analyzer.compare_portfolios(tech_portfolio, balanced_portfolio)
@@ -174,24 +197,16 @@ def demo_portfolio_comparison():
     print(f"     Confidence: {comp_metrics['confidence_diff']:+.1%}")
     
     print(f"\n   💡 Recommendation: {comparison['recommendation']}")
-    
-    return manager, analyzer
 
 
 def demo_rebalancing():
     """Demonstrate portfolio rebalancing functionality."""
     print_header("Portfolio Rebalancing")
     
-    manager, analyzer = demo_portfolio_comparison()
+    manager = _get_fixture()[0]
     
     # Get a portfolio that needs rebalancing
-    portfolios = manager.list_portfolios()
-    demo_portfolio = None
-    
-    for portfolio in portfolios:
-        if "Demo Tech Growth" in portfolio.name:
-            demo_portfolio = portfolio
-            break
+    demo_portfolio = find_portfolio(manager, "Demo Tech Growth")
     
     if demo_portfolio:
         print_portfolio_info(demo_portfolio)
@@ -210,15 +225,13 @@ def demo_rebalancing():
         
         print(f"✅ Portfolio rebalanced!")
         print_portfolio_info(demo_portfolio)
-    
-    return manager
 
 
 def demo_batch_operations():
     """Demonstrate batch operations."""
     print_header("Batch Operations")
     
-    manager = demo_rebalancing()
+    manager = _get_fixture()[0]
     
     # Demonstrate batch stock addition
     print("📦 Adding multiple stocks to portfolio...")
@@ -229,46 +242,33 @@ def demo_batch_operations():
         ("INTC", 0.07, 0.05, "Semiconductor recovery play")
     ]
     
-    demo_portfolio_name = None
-    for portfolio in manager.list_portfolios():
-        if "Demo Tech Growth" in portfolio.name:
-            demo_portfolio_name = portfolio.name
-            break
+    portfolio = find_portfolio(manager, "Demo Tech Growth")
     
-    if demo_portfolio_name:
-        for symbol, weight, target, notes in batch_stocks:
-            manager.add_stock(demo_portfolio_name, symbol, weight, target_weight=target, notes=notes)
+    if portfolio:
+        manager.add_stocks_batch(portfolio.name, batch_stocks)
         
-        portfolio = manager.get_portfolio(demo_portfolio_name)
         print_portfolio_info(portfolio)
         
         # Show validation
         is_valid, total = portfolio.validate_weights()
         print(f"\n✅ Validation: {'Valid' if is_valid else 'Invalid'} (Total: {total:.1%})")
-    
-    return manager
 
 
 def demo_persistence():
     """Demonstrate file persistence functionality."""
     print_header("File Persistence")
     
-    manager = demo_batch_operations()
+    manager = _get_fixture()[0]
     
     print("💾 Saving portfolios to disk...")
-    saved_portfolios = []
-    
-    for portfolio in manager.list_portfolios():
-        if "Demo" in portfolio.name:
-            manager.save_portfolio(portfolio.name)
-            saved_portfolios.append(portfolio.name)
+    saved_portfolios = [name for name in manager.portfolios if "Demo" in name]
+    saved_files = manager.save_portfolios(saved_portfolios)
     
     print(f"✅ Saved {len(saved_portfolios)} portfolios")
     
     # Show file locations
     print(f"\n📁 Portfolio files:")
-    for portfolio_name in saved_portfolios:
-        filename = manager._get_portfolio_filename(portfolio_name)
+    for portfolio_name, filename in zip(saved_portfolios, saved_files):
         if os.path.exists(filename):
             size = os.path.getsize(filename)
             print(f"   {portfolio_name}: {filename} ({size} bytes)")
@@ -281,17 +281,15 @@ def demo_persistence():
     print(f"   Cleared {original_count} portfolios from memory")
     
     # Reload
-    manager.load_all_portfolios()
+    manager._load_existing_portfolios()
     print(f"   Reloaded {len(manager.portfolios)} portfolios from disk")
-    
-    return manager
 
 
 def demo_error_handling():
     """Demonstrate error handling."""
     print_header("Error Handling")
     
-    manager = demo_persistence()
+    manager = _get_fixture()[0]
     
     test_cases = [
         ("Creating duplicate portfolio", lambda: manager.create_portfolio("Demo Tech Growth", strategy_type=StrategyType.BALANCED)),
@@ -314,33 +312,30 @@ def demo_multilanguage():
     """Demonstrate multi-language support."""
     print_header("Multi-language Support")
     
-    manager = demo_persistence()
+    manager, _, _, analyzer = _get_fixture()
     
     # Get a portfolio for analysis
-    portfolio = None
-    for p in manager.list_portfolios():
-        if "Demo Balanced" in p.name:
-            portfolio = p
-            break
+    portfolio = find_portfolio(manager, "Demo Balanced")
     
     if portfolio:
         print(f"📊 Analyzing portfolio in different languages...")
         
+        # Analyze once, then render the same result in each language
+        analysis = analyzer.analyze_portfolio(portfolio)
+        
         # English analysis
-        en_analyzer = PortfolioAnalyzer(language='en')
-        en_analysis = en_analyzer.analyze_portfolio(portfolio)
+        en_analysis = analyzer.render(analysis, 'en')
         
         print(f"\n🇺🇸 English Analysis:")
         print(f"   Risk Level: {en_analysis['risk_assessment']['risk_level']}")
-        print(f"   Recommendation: {en_analysis['overall_recommendation']['recommendation']}")
+        print(f"   Recommendation: {en_analysis['overall_recommendation']['recommendation_label']}")
         
         # Chinese analysis
-        zh_analyzer = PortfolioAnalyzer(language='zh')
-        zh_analysis = zh_analyzer.analyze_portfolio(portfolio)
+        zh_analysis = analyzer.render(analysis, 'zh')
         
         print(f"\n🇨🇳 中文分析:")
         print(f"   风险等级: {zh_analysis['risk_assessment']['risk_level']}")
-        print(f"   推荐: {zh_analysis['overall_recommendation']['recommendation']}")
+        print(f"   推荐: {zh_analysis['overall_recommendation']['recommendation_label']}")
 
 
 def cleanup_demo_portfolios():
@@ -349,10 +344,7 @@ def cleanup_demo_portfolios():
     
     manager = PortfolioManager()
     
-    demo_portfolios = []
-    for portfolio in manager.list_portfolios():
-        if "Demo" in portfolio.name:
-            demo_portfolios.append(portfolio.name)
+    demo_portfolios = [name for name in manager.portfolios if "Demo" in name]
     
     print(f"🗑️  Cleaning up {len(demo_portfolios)} demo portfolios...")
     
@@ -370,8 +362,10 @@ def main():
     print("This demonstration shows the complete functionality of the portfolio management system.")
     
     try:
-        # Run all demonstrations
-        demo_portfolio_creation()
+        # Build the shared fixture first so the creation walkthrough prints under its own header
+        _get_fixture()
+        
+        # Run all demonstrations against the shared fixture
         demo_portfolio_analysis()
         demo_portfolio_comparison()
         demo_rebalancing()
@@ -17,21 +17,27 @@ Run with: streamlit run portfolio_app.py
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import sys
 import os
+import hmac
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 # Import portfolio management components
 try:
-    from src.portfolio import PortfolioManager, PortfolioAnalyzer, StrategyType
+    from src.portfolio import Portfolio, PortfolioManager, PortfolioAnalyzer, StrategyType
     from src.portfolio.exceptions import PortfolioError
     from src.utils.stock_selector import create_dynamic_stock_selector, create_stock_weight_input
     from src.utils.stock_info_manager import get_stock_manager
@@ -62,7 +68,7 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -102,17 +108,50 @@ st.markdown("""
         border: 1px solid #f5c6cb;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.html(CUSTOM_CSS)
+
+
+# Shared resources, built once per server process
+@st.cache_resource
+def get_portfolio_manager() -> PortfolioManager:
+    """Get the portfolio manager shared by all sessions."""
+    return PortfolioManager()
+
+
+@st.cache_resource
+def _get_portfolio_analyzer(language: str) -> PortfolioAnalyzer:
+    """Get the shared portfolio analyzer for a language."""
+    return PortfolioAnalyzer(language=language)
+
+
+def get_portfolio_analyzer() -> PortfolioAnalyzer:
+    """Get the shared portfolio analyzer for this session's analysis language."""
+    return _get_portfolio_analyzer(st.session_state.get('analysis_language', 'en'))
+
+
+# Worker threads shared by all sessions for concurrent dashboard analysis
+WORKER_POOL_SIZE = 8
+
+
+@st.cache_resource
+def get_worker_executor() -> ThreadPoolExecutor:
+    """Get the worker pool shared by all sessions for short concurrent tasks."""
+    return ThreadPoolExecutor(max_workers=WORKER_POOL_SIZE, thread_name_prefix="worker")
+
+
+def call_in_script_ctx(script_run_ctx, fn, *args):
+    """Call ``fn`` on a pool thread under the submitting session's script context."""
+    # Pool threads outlive sessions, so the context is attached per task rather than per thread
+    add_script_run_ctx(None, script_run_ctx)
+    return fn(*args)
 
 
 # Initialize session state
 def init_session_state():
     """Initialize session state variables."""
-    if 'portfolio_manager' not in st.session_state:
-        st.session_state.portfolio_manager = PortfolioManager()
-    
-    if 'portfolio_analyzer' not in st.session_state:
-        st.session_state.portfolio_analyzer = PortfolioAnalyzer(language='en')
+    if 'analysis_language' not in st.session_state:
+        st.session_state.analysis_language = 'en'
     
     if 'selected_portfolio' not in st.session_state:
         st.session_state.selected_portfolio = None
@@ -123,58 +162,247 @@ def init_session_state():
     # Initialize stock information cache for future K-line and other features
     if 'portfolio_stock_cache' not in st.session_state:
         st.session_state.portfolio_stock_cache = {}
+
+
+def format_portfolio_option(portfolio_name: str) -> str:
+    """Label a portfolio selectbox option with its holding count."""
+    portfolio = get_portfolio_manager().get_portfolio(portfolio_name)
+    return f"{portfolio_name} ({len(portfolio.holdings)} stocks)"
+
+
+def queue_toast(message: str, icon: str = "✅"):
+    """Queue a toast to show on the next run, so it survives a following st.rerun()."""
+    st.session_state.queued_toasts = st.session_state.get('queued_toasts', []) + [(message, icon)]
+
+
+def show_queued_toasts():
+    """Show and clear the toasts queued by the previous run."""
+    for message, icon in st.session_state.pop('queued_toasts', []):
+        st.toast(message, icon=icon)
+
+
+def init_simulation_state():
+    """
+    Initialize simulation components on first use.
     
-    # Initialize stock manager cache
-    if 'stock_manager' not in st.session_state:
-        st.session_state.stock_manager = get_stock_manager()
+    Called by the pages that trade, so sessions that never visit them skip
+    loading the simulation accounts and transactions from disk.
+    """
+    if 'simulation_manager' not in st.session_state:
+        st.session_state.simulation_manager = SimulationAccountManager()
+    if 'virtual_trader' not in st.session_state:
+        st.session_state.virtual_trader = VirtualTrader(st.session_state.simulation_manager)
+    if 'backtest_engine' not in st.session_state:
+        st.session_state.backtest_engine = BacktestEngine()
+    if 'automated_trader' not in st.session_state:
+        st.session_state.automated_trader = AutomatedTrader(
+            st.session_state.simulation_manager,
+            st.session_state.virtual_trader
+        )
 
 
 # Utility functions
+# Display color for each strategy, keyed by strategy value
+STRATEGY_COLORS = {
+    StrategyType.CONSERVATIVE.value: "#28a745",
+    StrategyType.BALANCED.value: "#ffc107",
+    StrategyType.AGGRESSIVE.value: "#dc3545",
+    StrategyType.CUSTOM.value: "#6c757d"
+}
+
+
 def get_strategy_color(strategy_type: StrategyType) -> str:
     """Get color for strategy type."""
-    colors = {
-        StrategyType.CONSERVATIVE: "#28a745",
-        StrategyType.BALANCED: "#ffc107", 
-        StrategyType.AGGRESSIVE: "#dc3545",
-        StrategyType.CUSTOM: "#6c757d"
-    }
-    return colors.get(strategy_type, "#6c757d")
+    return STRATEGY_COLORS.get(strategy_type.value, "#6c757d")
+
+
+def get_portfolio_key(portfolio) -> tuple:
+    """Build a hashable key identifying the analyzable content of a portfolio."""
+    return (
+        portfolio.name,
+        portfolio.updated_time.isoformat(),
+        portfolio.strategy_type.value,
+        portfolio.cash_weight,
+        tuple((h.symbol, h.weight, h.target_weight) for h in portfolio.holdings)
+    )
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_analyze_portfolio(portfolio_key: tuple, language: str, _analyzer, _portfolio) -> Dict:
+    """Analyze a portfolio, memoized by its content key and analysis language."""
+    return _analyzer.analyze_portfolio(_portfolio)
+
+
+def analyze_portfolio_cached(portfolio, force_refresh: bool = False) -> Dict:
+    """Analyze a portfolio through the shared cache, recomputing it when forced."""
+    analyzer = get_portfolio_analyzer()
+    portfolio_key = get_portfolio_key(portfolio)
+    if force_refresh:
+        _cached_analyze_portfolio.clear(portfolio_key, analyzer.language, analyzer, portfolio)
+        return analyzer.analyze_portfolio(portfolio, force_refresh=True)
+    return _cached_analyze_portfolio(portfolio_key, analyzer.language, analyzer, portfolio)
+
+
+def evict_cached_symbols(portfolios, symbols: List[str]) -> int:
+    """Drop cached analyses of portfolios holding any of the symbols, keeping all other entries."""
+    analyzer = get_portfolio_analyzer()
+    symbols = set(symbols)
+    affected = [p for p in portfolios if any(h.symbol in symbols for h in p.holdings)]
+    for portfolio in affected:
+        _cached_analyze_portfolio.clear(get_portfolio_key(portfolio), analyzer.language, analyzer, portfolio)
+    if affected:
+        # Comparison results and the dashboard rollup span portfolios, so rebuild them
+        _cached_compare_portfolios.clear()
+        st.session_state.analysis_cache.pop('dashboard_overview', None)
+    PortfolioAnalyzer.evict_symbols(list(symbols))
+    return len(affected)
 
 
-def format_percentage(value: float, decimals: int = 1) -> str:
-    """Format percentage with proper styling."""
-    return f"{value:.{decimals}f}%"
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_compare_portfolios(portfolio_keys: tuple, language: str, _analyzer, _portfolio1, _portfolio2) -> Dict:
+    """Compare two portfolios, memoized by both content keys and analysis language."""
+    return _analyzer.compare_portfolios(_portfolio1, _portfolio2)
 
 
-def format_currency(value: float) -> str:
-    """Format currency value."""
-    return f"${value:,.2f}"
+def compare_portfolios_cached(portfolio1, portfolio2) -> Dict:
+    """Compare two portfolios through the shared cache."""
+    analyzer = get_portfolio_analyzer()
+    portfolio_keys = (get_portfolio_key(portfolio1), get_portfolio_key(portfolio2))
+    return _cached_compare_portfolios(portfolio_keys, analyzer.language, analyzer, portfolio1, portfolio2)
 
 
+def _analyze_dashboard_row(analyzer, portfolio) -> tuple:
+    """Analyze one portfolio into (ret, risk, div, risk_level, recommendation)."""
+    if not analyzer.can_analyze(portfolio):
+        return (None, None, None, 'Unknown', 'N/A')
+    try:
+        analysis = _cached_analyze_portfolio(get_portfolio_key(portfolio), analyzer.language, analyzer, portfolio)
+        metrics = analysis.get('portfolio_metrics', {})
+        return (
+            metrics.get('expected_return', 0),
+            metrics.get('risk_score', 0.5),
+            metrics.get('diversification_score'),
+            analysis.get('risk_assessment', {}).get('risk_level', 'Unknown'),
+            analysis.get('overall_recommendation', {}).get('recommendation', 'N/A')
+        )
+    except PortfolioError:
+        return (None, None, None, 'Unknown', 'Error')
+
+
+def build_dashboard_frame(portfolios) -> pd.DataFrame:
+    """
+    Aggregate each portfolio into one row of dashboard scalars.
+    
+    Portfolios are analyzed concurrently; those that cannot be analyzed keep
+    NaN metrics so aggregates skip them.
+    """
+    analyzer = get_portfolio_analyzer()
+    analyze_row = partial(call_in_script_ctx, get_script_run_ctx(), _analyze_dashboard_row, analyzer)
+    rows = list(get_worker_executor().map(analyze_row, portfolios))
+    
+    columns = dict(zip(('ret', 'risk', 'div', 'risk_level', 'recommendation'), zip(*rows))) if rows else {}
+    
+    return pd.DataFrame({
+        'name': [p.name for p in portfolios],
+        'strategy': [p.strategy_type.value for p in portfolios],
+        'holdings': [len(p.holdings) for p in portfolios],
+        'total_weight': [p.total_weight for p in portfolios],
+        'ret': pd.Series(columns.get('ret', ()), dtype=float),
+        'risk': pd.Series(columns.get('risk', ()), dtype=float),
+        'div': pd.Series(columns.get('div', ()), dtype=float),
+        'risk_level': list(columns.get('risk_level', ())),
+        'recommendation': list(columns.get('recommendation', ()))
+    })
+
+
+def get_holdings_frame(portfolio) -> pd.DataFrame:
+    """Build a column-oriented frame of a portfolio's holdings (NaN targets where unset)."""
+    return portfolio.to_frame()
+
+
+# Per-holding analysis columns shown in the analysis page, with their display names
+INDIVIDUAL_COLUMNS = {
+    'weight': 'Weight',
+    'recommendation': 'Recommendation',
+    'confidence': 'Confidence',
+    'risk_score': 'Risk Score',
+    'current_price': 'Current Price'
+}
+
+# Rebalancing suggestion columns shown in the analysis page, with their display names
+SUGGESTION_COLUMNS = {
+    'symbol': 'Stock',
+    'action': 'Action',
+    'current_weight': 'Current Weight',
+    'target_weight': 'Target Weight',
+    'deviation': 'Deviation',
+    'priority': 'Priority'
+}
+
+
+def get_individual_frame(individual: Dict[str, Dict]) -> pd.DataFrame:
+    """Build the per-holding analysis table with one row per symbol."""
+    frame = pd.DataFrame.from_dict(individual, orient='index').reindex(columns=list(INDIVIDUAL_COLUMNS))
+    frame = frame.rename(columns=INDIVIDUAL_COLUMNS).rename_axis('Symbol').reset_index()
+    frame['Current Price'] = pd.to_numeric(frame['Current Price'], errors='coerce').where(lambda v: v != 0)
+    return frame
+
+
+# Strategy choices offered by the portfolio forms, with each option's position
+STRATEGY_OPTIONS = (StrategyType.CONSERVATIVE, StrategyType.BALANCED, StrategyType.AGGRESSIVE, StrategyType.CUSTOM)
+STRATEGY_INDEX = {strategy: index for index, strategy in enumerate(STRATEGY_OPTIONS)}
+
+
+# Rows of the detailed comparison table as (metric, analysis section, key, format spec)
+COMPARISON_METRICS = (
+    ('Expected Return', 'portfolio_metrics', 'expected_return', '{:.1%}'.format),
+    ('Risk Score', 'portfolio_metrics', 'risk_score', '{:.2f}'.format),
+    ('Diversification', 'portfolio_metrics', 'diversification_score', '{:.1%}'.format),
+    ('Risk Level', 'risk_assessment', 'risk_level', str),
+    ('Recommendation', 'overall_recommendation', 'recommendation', str),
+    ('Confidence', 'overall_recommendation', 'confidence', '{:.1%}'.format)
+)
+
+
+def _format_metric(formatter, value) -> str:
+    """Apply a pre-bound metric formatter, rendering missing or non-numeric values as N/A."""
+    if value is None:
+        return "N/A"
+    try:
+        return formatter(value)
+    except (TypeError, ValueError):
+        return "N/A"
+
+
+def build_comparison_table(analysis1: Dict, analysis2: Dict, name1: str, name2: str) -> pd.DataFrame:
+    """Build the metric-by-metric comparison of two analyses."""
+    return pd.DataFrame.from_records(
+        [(metric,
+          _format_metric(formatter, analysis1[section].get(key)),
+          _format_metric(formatter, analysis2[section].get(key)))
+         for metric, section, key, formatter in COMPARISON_METRICS],
+        columns=['Metric', name1, name2]
+    )
+
+
+@st.cache_data(show_spinner=False, hash_funcs={Portfolio: get_portfolio_key})
 def create_portfolio_overview_chart(portfolio):
     """Create portfolio holdings overview chart."""
     if not portfolio.holdings:
         return None
     
-    # Prepare data
-    symbols = [h.symbol for h in portfolio.holdings]
-    weights = [h.weight for h in portfolio.holdings]
-    
     # Create pie chart
-    fig = px.pie(
-        values=weights,
-        names=symbols,
-        title=f"{portfolio.name} - Holdings Distribution",
-        color_discrete_sequence=px.colors.qualitative.Set3
-    )
-    
-    fig.update_traces(
+    fig = go.Figure(go.Pie(
+        labels=portfolio.symbols_array,
+        values=portfolio.weights,
+        marker=dict(colors=px.colors.qualitative.Set3),
         textposition='inside',
         textinfo='percent+label',
         hovertemplate='<b>%{label}</b><br>Weight: %{percent}<br>Value: %{value:.1f}%<extra></extra>'
-    )
+    ))
     
     fig.update_layout(
+        title=f"{portfolio.name} - Holdings Distribution",
         height=400,
         showlegend=True,
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
@@ -183,97 +411,79 @@ def create_portfolio_overview_chart(portfolio):
     return fig
 
 
-def create_risk_return_chart(portfolios_analysis: List[Dict]):
-    """Create risk-return scatter plot for portfolio comparison."""
-    if not portfolios_analysis:
-        return None
-    
-    # Prepare data
-    names = []
-    returns = []
-    risks = []
-    strategies = []
-    
-    for analysis in portfolios_analysis:
-        portfolio_info = analysis.get('portfolio_info', {})
-        metrics = analysis.get('portfolio_metrics', {})
-        
-        names.append(portfolio_info.get('name', 'Unknown'))
-        returns.append(metrics.get('expected_return', 0) * 100)
-        risks.append(metrics.get('risk_score', 0.5) * 100)
-        strategies.append(portfolio_info.get('strategy', 'balanced'))
-    
-    # Create scatter plot
-    fig = px.scatter(
-        x=risks,
-        y=returns,
-        text=names,
-        color=strategies,
-        title="Portfolio Risk vs Expected Return",
-        labels={
-            'x': 'Risk Score (%)',
-            'y': 'Expected Return (%)',
-            'color': 'Strategy'
-        },
-        color_discrete_map={
-            'conservative': '#28a745',
-            'balanced': '#ffc107',
-            'aggressive': '#dc3545'
-        }
+def get_risk_return_points(portfolios_analysis: List[Dict]) -> pd.DataFrame:
+    """Reduce analysis results to one (name, strategy, risk, ret) row per portfolio, in percent."""
+    infos = pd.DataFrame.from_records(
+        [analysis.get('portfolio_info', {}) for analysis in portfolios_analysis],
+        columns=['name', 'strategy']
     )
+    metrics = pd.DataFrame.from_records(
+        [analysis.get('portfolio_metrics', {}) for analysis in portfolios_analysis],
+        columns=['risk_score', 'expected_return']
+    ).astype(float)
+    return pd.DataFrame({
+        'name': infos['name'].fillna('Unknown'),
+        'strategy': infos['strategy'].fillna('balanced'),
+        'risk': metrics['risk_score'].fillna(0.5) * 100,
+        'ret': metrics['expected_return'].fillna(0) * 100
+    })
+
+
+@st.cache_data(show_spinner=False)
+def create_risk_return_chart(points: pd.DataFrame):
+    """Create risk-return scatter plot from per-portfolio risk/return points."""
+    if points.empty:
+        return None
     
-    fig.update_traces(
-        textposition="top center",
-        marker=dict(size=12)
-    )
+    # Create scatter plot, one trace per strategy legend entry
+    fig = go.Figure()
+    for strategy, group in points.groupby('strategy', sort=False):
+        fig.add_trace(go.Scattergl(
+            x=group['risk'],
+            y=group['ret'],
+            text=group['name'],
+            name=strategy,
+            mode='markers+text',
+            textposition="top center",
+            marker=dict(size=12, color=STRATEGY_COLORS.get(strategy))
+        ))
     
     fig.update_layout(
+        title="Portfolio Risk vs Expected Return",
         height=500,
         xaxis_title="Risk Score (%)",
-        yaxis_title="Expected Return (%)"
+        yaxis_title="Expected Return (%)",
+        legend_title_text="Strategy"
     )
     
     return fig
 
 
+@st.cache_data(show_spinner=False, hash_funcs={Portfolio: get_portfolio_key})
 def create_holdings_comparison_chart(portfolio):
     """Create current vs target weights comparison chart."""
     if not portfolio.holdings:
         return None
     
-    # Prepare data
-    symbols = []
-    current_weights = []
-    target_weights = []
-    
-    for holding in portfolio.holdings:
-        symbols.append(holding.symbol)
-        current_weights.append(holding.weight)
-        target_weights.append(holding.target_weight if holding.target_weight else holding.weight)
-    
-    # Create grouped bar chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Bar(
-        name='Current Weight',
-        x=symbols,
-        y=current_weights,
-        marker_color='lightblue'
-    ))
-    
-    fig.add_trace(go.Bar(
-        name='Target Weight', 
-        x=symbols,
-        y=target_weights,
-        marker_color='darkblue'
-    ))
-    
-    fig.update_layout(
-        title=f"{portfolio.name} - Current vs Target Weights",
-        xaxis_title="Stock Symbol",
-        yaxis_title="Weight (%)",
-        barmode='group',
-        height=400
+    # Prepare data, falling back to the current weight where no target is set
+    holdings = get_holdings_frame(portfolio)
+    symbols = holdings['symbol']
+    current_weights = holdings['weight']
+    target_weights = holdings['target'].where(holdings['target'] > 0, holdings['weight'])
+    
+    # Create grouped bar chart with its data and layout in one pass
+    fig = go.Figure(
+        data=[
+            go.Bar(name='Current Weight', x=symbols, y=current_weights, marker_color='lightblue'),
+            go.Bar(name='Target Weight', x=symbols, y=target_weights, marker_color='darkblue')
+        ],
+        layout=go.Layout(
+            title=f"{portfolio.name} - Current vs Target Weights",
+            xaxis_title="Stock Symbol",
+            yaxis_title="Weight (%)",
+            barmode='group',
+            height=400
+        )
     )
     
     return fig
@@ -284,8 +494,7 @@ def show_dashboard():
     """Show main dashboard page."""
     st.markdown('<h1 class="main-header">📊 Portfolio Management Dashboard</h1>', unsafe_allow_html=True)
     
-    manager = st.session_state.portfolio_manager
-    analyzer = st.session_state.portfolio_analyzer
+    manager = get_portfolio_manager()
     
     # Get all portfolios
     portfolios = manager.list_portfolios()
@@ -294,99 +503,259 @@ def show_dashboard():
         st.info("🎯 Welcome! Create your first portfolio to get started.")
         return
     
+    # Aggregate every portfolio into one row of scalars, reused until a portfolio changes
+    overview_key = (get_portfolio_analyzer().language, tuple(get_portfolio_key(p) for p in portfolios))
+    cached_key, overview = st.session_state.analysis_cache.get('dashboard_overview', (None, None))
+    if cached_key != overview_key:
+        overview = build_dashboard_frame(portfolios)
+        st.session_state.analysis_cache['dashboard_overview'] = (overview_key, overview)
+    
     # Portfolio overview metrics
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.metric("Total Portfolios", len(portfolios))
+        st.metric("Total Portfolios", len(overview))
     
     with col2:
-        total_holdings = sum(len(p.holdings) for p in portfolios)
-        st.metric("Total Holdings", total_holdings)
+        st.metric("Total Holdings", int(overview['holdings'].sum()))
     
     with col3:
-        strategy_counts = {}
-        for p in portfolios:
-            strategy = p.strategy_type.value
-            strategy_counts[strategy] = strategy_counts.get(strategy, 0) + 1
-        most_common = max(strategy_counts.items(), key=lambda x: x[1]) if strategy_counts else ("None", 0)
-        st.metric("Most Common Strategy", most_common[0].title())
+        most_common, _ = Counter(overview['strategy']).most_common(1)[0]
+        st.metric("Most Common Strategy", most_common.title())
     
     with col4:
-        # Calculate average diversification
-        total_div = 0
-        valid_portfolios = 0
-        for p in portfolios:
-            if p.holdings:
-                try:
-                    analysis = analyzer.analyze_portfolio(p)
-                    total_div += analysis['portfolio_metrics']['diversification_score']
-                    valid_portfolios += 1
-                except:
-                    pass
-        avg_div = total_div / valid_portfolios if valid_portfolios > 0 else 0
+        # Average diversification over portfolios that could be analyzed
+        avg_div = overview['div'].mean()
+        if pd.isna(avg_div):
+            avg_div = 0
         st.metric("Avg Diversification", f"{avg_div:.1%}")
     
     # Recent portfolios section
     st.subheader("📈 Portfolio Overview")
     
-    # Create portfolio summary table
-    portfolio_data = []
-    for portfolio in portfolios[:5]:  # Show top 5 portfolios
-        try:
-            analysis = analyzer.analyze_portfolio(portfolio)
-            expected_return = analysis.get('portfolio_metrics', {}).get('expected_return', 0)
-            risk_level = analysis.get('risk_assessment', {}).get('risk_level', 'Unknown')
-            recommendation = analysis.get('overall_recommendation', {}).get('recommendation', 'N/A')
-            
-            portfolio_data.append({
-                'Name': portfolio.name,
-                'Strategy': portfolio.strategy_type.value.title(),
-                'Holdings': len(portfolio.holdings),
-                'Total Weight': f"{portfolio.total_weight:.1%}",
-                'Expected Return': f"{expected_return:.1%}" if expected_return is not None else "N/A",
-                'Risk Level': risk_level,
-                'Recommendation': recommendation
-            })
-        except Exception as e:
-            portfolio_data.append({
-                'Name': portfolio.name,
-                'Strategy': portfolio.strategy_type.value.title(),
-                'Holdings': len(portfolio.holdings),
-                'Total Weight': f"{portfolio.total_weight:.1%}",
-                'Expected Return': 'N/A',
-                'Risk Level': 'Unknown',
-                'Recommendation': 'Error'
-            })
-    
-    if portfolio_data:
-        df = pd.DataFrame(portfolio_data)
-        st.dataframe(df, use_container_width=True)
+    # Create portfolio summary table for the top 5 portfolios
+    top = overview.head(5)
+    df = pd.DataFrame({
+        'Name': top['name'],
+        'Strategy': top['strategy'].str.title(),
+        'Holdings': top['holdings'],
+        'Total Weight': top['total_weight'].map('{:.1%}'.format),
+        'Expected Return': top['ret'].map(lambda v: "N/A" if pd.isna(v) else f"{v:.1%}"),
+        'Risk Level': top['risk_level'],
+        'Recommendation': top['recommendation']
+    })
+    st.dataframe(df, use_container_width=True)
     
     # Portfolio performance comparison
     if len(portfolios) > 1:
         st.subheader("🔄 Portfolio Comparison")
         
-        # Analyze all portfolios for comparison
-        analyses = []
-        for portfolio in portfolios:
-            try:
-                analysis = analyzer.analyze_portfolio(portfolio)
-                analyses.append(analysis)
-            except:
-                continue
-        
-        if len(analyses) > 1:
-            fig = create_risk_return_chart(analyses)
+        # Plot only the aggregated risk/return point of each analyzed portfolio
+        analyzed = overview[overview['risk'].notna()]
+        if len(analyzed) > 1:
+            points = pd.DataFrame({
+                'name': analyzed['name'],
+                'strategy': analyzed['strategy'],
+                'risk': analyzed['risk'] * 100,
+                'ret': analyzed['ret'].fillna(0) * 100
+            })
+            fig = create_risk_return_chart(points)
             if fig:
                 st.plotly_chart(fig, use_container_width=True)
 
 
+@st.fragment
+def _add_stock_fragment(portfolio_name: str):
+    """Render the add-stock search and form, rerunning only this section on input."""
+    manager = get_portfolio_manager()
+    
+    # Use dynamic stock selector
+    selected_symbol, stock_info = create_dynamic_stock_selector(
+        key=f"add_stock_{portfolio_name}",
+        placeholder="Search stock symbol or company name... (e.g. AAPL, Apple)",
+        help_text="Enter stock symbol or company name for real-time search"
+    )
+    
+    # If stock is selected, show weight settings and add button
+    if selected_symbol and stock_info:
+        st.markdown("---")
+        
+        with st.form(f"add_stock_form_{selected_symbol}"):
+            st.markdown(f"### 🎯 Add **{selected_symbol}** to Portfolio")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                weight = st.number_input(
+                    "Weight (%)", 
+                    min_value=0.1, 
+                    max_value=100.0, 
+                    value=10.0, 
+                    step=0.1,
+                    help="Weight percentage of this stock in the portfolio"
+                )
+            
+            with col2:
+                target_weight = st.number_input(
+                    "Target Weight (%)", 
+                    min_value=0.1, 
+                    max_value=100.0, 
+                    value=weight, 
+                    step=0.1,
+                    help="Ideal target weight (optional)"
+                )
+            
+            notes = st.text_area(
+                "Investment Notes (optional)", 
+                placeholder="Record investment rationale or analysis...",
+                help="You can record reasons for selecting this stock"
+            )
+            
+            # Display current stock price information
+            if stock_info.get("current_price"):
+                st.info(f"💰 Current Price: ${stock_info['current_price']:.2f} | "
+                       f"📊 Weight: {weight}% | "
+                       f"🏢 Sector: {stock_info.get('sector', 'Unknown')}")
+            
+            col1, col2, col3 = st.columns([1, 1, 1])
+            
+            with col2:
+                add_stock_submit = st.form_submit_button(
+                    f"✅ Add {selected_symbol}", 
+                    help=f"Add {selected_symbol} to portfolio",
+                    use_container_width=True
+                )
+            
+            if add_stock_submit:
+                try:
+                    # Save stock information to cache (prepare for future K-line and other features)
+                    if 'portfolio_stock_cache' not in st.session_state:
+                        st.session_state.portfolio_stock_cache = {}
+                    st.session_state.portfolio_stock_cache[selected_symbol] = stock_info
+                    
+                    # Add stock to portfolio
+                    manager.add_stock(
+                        portfolio_name,
+                        selected_symbol,
+                        weight / 100,
+                        target_weight=target_weight / 100 if target_weight != weight else None,
+                        notes=notes if notes else None
+                    )
+                    
+                    st.success(f"🎉 Successfully added {selected_symbol} ({stock_info['name']}) to portfolio!")
+                    st.balloons()  # Add some celebration effects
+                    
+                    # Clean selection state, prepare to add next stock
+                    if f"add_stock_{portfolio_name}_selected" in st.session_state:
+                        del st.session_state[f"add_stock_{portfolio_name}_selected"]
+                    
+                    st.rerun()
+                
+                except Exception as e:
+                    st.error(f"❌ Error adding stock: {e}")
+    else:
+        st.info("👆 Please search and select a stock to add first")
+
+
+# Stock information fields shown in the holdings details table, with their display names
+STOCK_DETAIL_COLUMNS = {
+    'current_price': 'Current Price',
+    'sector': 'Sector',
+    'industry': 'Industry',
+    'market_cap': 'Market Cap',
+    'pe_ratio': 'P/E Ratio',
+    'dividend_yield': 'Dividend Yield',
+    'beta': 'Beta Coefficient'
+}
+
+
+@st.fragment
+def _holdings_details_fragment(portfolio):
+    """Render the holdings details table and descriptions, rerunning only this section on interaction."""
+    # Prefetch uncached stock information in one concurrent wave
+    stock_cache = st.session_state.portfolio_stock_cache
+    missing_symbols = [h.symbol for h in portfolio.holdings if h.symbol not in stock_cache]
+    if missing_symbols:
+        with st.spinner(f"Getting information for {len(missing_symbols)} stocks..."):
+            stock_cache.update(
+                get_stock_manager().get_stock_info_batch(missing_symbols)
+            )
+    
+    # Render every holding's key figures as one table
+    symbols = [holding.symbol for holding in portfolio.holdings]
+    stock_infos = pd.DataFrame.from_records(
+        [stock_cache.get(symbol) or {} for symbol in symbols],
+        columns=list(STOCK_DETAIL_COLUMNS)
+    ).rename(columns=STOCK_DETAIL_COLUMNS)
+    stock_infos.insert(0, 'Symbol', symbols)
+    stock_infos['Market Cap'] = pd.to_numeric(stock_infos['Market Cap'], errors='coerce') / 1e9
+    st.dataframe(
+        stock_infos.style.format({
+            'Current Price': '${:.2f}',
+            'Market Cap': '${:.1f}B',
+            'P/E Ratio': '{:.2f}',
+            'Dividend Yield': '{:.2%}',
+            'Beta Coefficient': '{:.2f}'
+        }, na_rep="N/A"),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    unavailable = [symbol for symbol in symbols if not stock_cache.get(symbol)]
+    if unavailable:
+        st.error(f"Unable to retrieve information for: {', '.join(unavailable)}")
+    
+    # Collapsible narrative company descriptions; the toggle's session_state flag gates the body
+    for symbol in symbols:
+        description = (stock_cache.get(symbol) or {}).get('description')
+        if description and st.toggle(f"📈 {symbol} Details", key=f"details_{symbol}"):
+            with st.container(border=True):
+                st.write("**Company Description**:")
+                st.write(description)
+    
+    st.info("💡 K-line chart feature will be added in future versions")
+
+
+@st.fragment
+def _quick_delete_fragment(portfolio_name: str):
+    """Render the quick delete button and its confirmation step."""
+    manager = get_portfolio_manager()
+    
+    st.divider()
+    st.subheader("🗑️ Quick Delete")
+    st.caption("Delete this entire portfolio")
+    
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        if st.button("Delete Portfolio", type="secondary", use_container_width=True):
+            st.session_state.show_delete_confirm = True
+    
+    with col2:
+        if hasattr(st.session_state, 'show_delete_confirm') and st.session_state.show_delete_confirm:
+            if st.button("✅ Confirm Delete", type="primary"):
+                try:
+                    success = manager.delete_portfolio(portfolio_name)
+                    if success:
+                        st.success(f"✅ Portfolio '{portfolio_name}' deleted!")
+                        st.session_state.show_delete_confirm = False
+                        st.session_state.pop("edit_portfolio_select", None)
+                        st.rerun()
+                    else:
+                        st.error("❌ Failed to delete portfolio")
+                except Exception as e:
+                    st.error(f"❌ Error: {e}")
+            
+            if st.button("❌ Cancel"):
+                st.session_state.show_delete_confirm = False
+                st.rerun(scope="fragment")
+
+
 def show_portfolio_management():
     """Show portfolio management page."""
     st.markdown('<h1 class="main-header">💼 Portfolio Management</h1>', unsafe_allow_html=True)
     
-    manager = st.session_state.portfolio_manager
+    manager = get_portfolio_manager()
     
     # Tabs for different management functions
     tab1, tab2, tab3 = st.tabs(["📝 Create Portfolio", "✏️ Edit Portfolio", "📊 Portfolio Details"])
@@ -401,7 +770,7 @@ def show_portfolio_management():
                 portfolio_name = st.text_input("Portfolio Name", placeholder="e.g., Tech Growth Portfolio")
                 strategy = st.selectbox(
                     "Investment Strategy",
-                    options=[StrategyType.CONSERVATIVE, StrategyType.BALANCED, StrategyType.AGGRESSIVE, StrategyType.CUSTOM],
+                    options=STRATEGY_OPTIONS,
                     format_func=lambda x: x.value.title()
                 )
             
@@ -463,8 +832,8 @@ def show_portfolio_management():
                     with col2:
                         new_strategy = st.selectbox(
                             "Strategy",
-                            options=[StrategyType.CONSERVATIVE, StrategyType.BALANCED, StrategyType.AGGRESSIVE, StrategyType.CUSTOM],
-                            index=[StrategyType.CONSERVATIVE, StrategyType.BALANCED, StrategyType.AGGRESSIVE, StrategyType.CUSTOM].index(portfolio.strategy_type),
+                            options=STRATEGY_OPTIONS,
+                            index=STRATEGY_INDEX[portfolio.strategy_type],
                             format_func=lambda x: x.value.title()
                         )
                     
@@ -488,161 +857,42 @@ def show_portfolio_management():
                 # Add new stock
                 st.write("**Add New Stock**")
                 
-                # Use dynamic stock selector
-                selected_symbol, stock_info = create_dynamic_stock_selector(
-                    key=f"add_stock_{selected_portfolio_name}",
-                    placeholder="Search stock symbol or company name... (e.g. AAPL, Apple)",
-                    help_text="Enter stock symbol or company name for real-time search"
-                )
-                
-                # If stock is selected, show weight settings and add button
-                if selected_symbol and stock_info:
-                    st.markdown("---")
-                    
-                    with st.form(f"add_stock_form_{selected_symbol}"):
-                        st.markdown(f"### 🎯 Add **{selected_symbol}** to Portfolio")
-                        
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            weight = st.number_input(
-                                "Weight (%)", 
-                                min_value=0.1, 
-                                max_value=100.0, 
-                                value=10.0, 
-                                step=0.1,
-                                help="Weight percentage of this stock in the portfolio"
-                            )
-                        
-                        with col2:
-                            target_weight = st.number_input(
-                                "Target Weight (%)", 
-                                min_value=0.1, 
-                                max_value=100.0, 
-                                value=weight, 
-                                step=0.1,
-                                help="Ideal target weight (optional)"
-                            )
-                        
-                        notes = st.text_area(
-                            "Investment Notes (optional)", 
-                            placeholder="Record investment rationale or analysis...",
-                            help="You can record reasons for selecting this stock"
-                        )
-                        
-                        # Display current stock price information
-                        if stock_info.get("current_price"):
-                            st.info(f"💰 Current Price: ${stock_info['current_price']:.2f} | "
-                                   f"📊 Weight: {weight}% | "
-                                   f"🏢 Sector: {stock_info.get('sector', 'Unknown')}")
-                        
-                        col1, col2, col3 = st.columns([1, 1, 1])
-                        
-                        with col2:
-                            add_stock_submit = st.form_submit_button(
-                                f"✅ Add {selected_symbol}", 
-                                help=f"Add {selected_symbol} to portfolio",
-                                use_container_width=True
-                            )
-                        
-                        if add_stock_submit:
-                            try:
-                                # Save stock information to cache (prepare for future K-line and other features)
-                                if 'portfolio_stock_cache' not in st.session_state:
-                                    st.session_state.portfolio_stock_cache = {}
-                                st.session_state.portfolio_stock_cache[selected_symbol] = stock_info
-                                
-                                # Add stock to portfolio
-                                manager.add_stock(
-                                    selected_portfolio_name,
-                                    selected_symbol,
-                                    weight / 100,
-                                    target_weight=target_weight / 100 if target_weight != weight else None,
-                                    notes=notes if notes else None
-                                )
-                                
-                                st.success(f"🎉 Successfully added {selected_symbol} ({stock_info['name']}) to portfolio!")
-                                st.balloons()  # Add some celebration effects
-                                
-                                # Clean selection state, prepare to add next stock
-                                if f"add_stock_{selected_portfolio_name}_selected" in st.session_state:
-                                    del st.session_state[f"add_stock_{selected_portfolio_name}_selected"]
-                                
-                                st.rerun()
-                                
-                            except Exception as e:
-                                st.error(f"❌ Error adding stock: {e}")
-                else:
-                    st.info("👆 Please search and select a stock to add first")
+                _add_stock_fragment(selected_portfolio_name)
                 
                 # Current holdings
                 if portfolio.holdings:
                     st.write("**Current Holdings**")
                     
                     # Create extended holdings data with cached stock information
-                    holdings_data = []
-                    for holding in portfolio.holdings:
-                        deviation = holding.get_weight_deviation()
-                        
-                        # Get stock information from cache
-                        stock_info = st.session_state.portfolio_stock_cache.get(holding.symbol)
-                        current_price = stock_info.get('current_price') if stock_info else None
-                        company_name = stock_info.get('name', holding.symbol) if stock_info else holding.symbol
-                        sector = stock_info.get('sector', 'Unknown') if stock_info else 'Unknown'
-                        
-                        holdings_data.append({
-                            'Symbol': holding.symbol,
-                            'Company': company_name,
-                            'Sector': sector,
-                            'Current Price': f"${current_price:.2f}" if current_price else "N/A",
-                            'Weight': f"{holding.weight:.1%}",
-                            'Target Weight': f"{holding.target_weight:.1%}" if holding.target_weight else "N/A",
-                            'Deviation': f"{deviation:+.1%}" if deviation else "N/A",
-                            'Notes': holding.notes or ""
-                        })
+                    holdings = get_holdings_frame(portfolio)
+                    stock_infos = pd.DataFrame.from_records(
+                        [st.session_state.portfolio_stock_cache.get(symbol) or {} for symbol in holdings['symbol']],
+                        columns=['name', 'sector', 'current_price']
+                    )
                     
-                    df_holdings = pd.DataFrame(holdings_data)
+                    df_holdings = pd.DataFrame({
+                        'Symbol': holdings['symbol'],
+                        'Company': stock_infos['name'].fillna(holdings['symbol']),
+                        'Sector': stock_infos['sector'].fillna('Unknown'),
+                        'Current Price': stock_infos['current_price'],
+                        'Weight': holdings['weight'],
+                        'Target Weight': holdings['target'],
+                        'Deviation': holdings['deviation'],
+                        'Notes': [h.notes or "" for h in portfolio.holdings]
+                    })
+                    df_holdings['Current Price'] = df_holdings['Current Price'].map(
+                        lambda v: "N/A" if pd.isna(v) or not v else f"${v:.2f}")
+                    df_holdings['Weight'] = df_holdings['Weight'].map('{:.1%}'.format)
+                    df_holdings['Target Weight'] = df_holdings['Target Weight'].map(
+                        lambda v: "N/A" if pd.isna(v) or not v else f"{v:.1%}")
+                    df_holdings['Deviation'] = df_holdings['Deviation'].map(
+                        lambda v: "N/A" if pd.isna(v) or not v else f"{v:+.1%}")
                     st.dataframe(df_holdings, use_container_width=True)
                     
                     # Stock detailed information display
                     st.write("**📊 Detailed Portfolio Information**")
                     
-                    # Create expandable stock information cards
-                    for holding in portfolio.holdings:
-                        expander_label = f"📈 {holding.symbol} Details"
-                        with st.expander(expander_label):
-                            stock_info = st.session_state.portfolio_stock_cache.get(holding.symbol)
-                            if not stock_info:
-                                with st.spinner(f"Getting {holding.symbol} information..."):
-                                    stock_manager = get_stock_manager()
-                                    stock_info = stock_manager.get_stock_info(holding.symbol)
-                                    if stock_info:
-                                        st.session_state.portfolio_stock_cache[holding.symbol] = stock_info
-                                    else:
-                                        st.error(f"Unable to retrieve {holding.symbol} information")
-                                        return
-                            if stock_info:
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("Current Price", f"${stock_info['current_price']:.2f}" if stock_info.get('current_price') else "N/A")
-                                    st.write(f"**Sector**: {stock_info.get('sector', 'Unknown')}")
-                                    st.write(f"**Industry**: {stock_info.get('industry', 'Unknown')}")
-                                with col2:
-                                    if stock_info.get('market_cap'):
-                                        market_cap_b = stock_info['market_cap'] / 1e9
-                                        st.metric("Market Cap", f"${market_cap_b:.1f}B")
-                                    if stock_info.get('pe_ratio'):
-                                        st.metric("P/E Ratio", f"{stock_info['pe_ratio']:.2f}")
-                                with col3:
-                                    if stock_info.get('dividend_yield'):
-                                        dividend_pct = stock_info['dividend_yield'] * 100
-                                        st.metric("Dividend Yield", f"{dividend_pct:.2f}%")
-                                    if stock_info.get('beta'):
-                                        st.metric("Beta Coefficient", f"{stock_info['beta']:.2f}")
-                                if stock_info.get('description'):
-                                    st.write("**Company Description**:")
-                                    st.write(stock_info['description'])
-                                st.info("💡 K-line chart feature will be added in future versions")
+                    _holdings_details_fragment(portfolio)
                     
                     st.markdown("---")
                     
@@ -667,34 +917,7 @@ def show_portfolio_management():
                                 st.error(f"❌ Error removing stock: {e}")
                 
                 # Quick delete option at bottom
-                st.divider()
-                st.subheader("🗑️ Quick Delete")
-                st.caption("Delete this entire portfolio")
-                
-                col1, col2 = st.columns([1, 3])
-                
-                with col1:
-                    if st.button("Delete Portfolio", type="secondary", use_container_width=True):
-                        st.session_state.show_delete_confirm = True
-                
-                with col2:
-                    if hasattr(st.session_state, 'show_delete_confirm') and st.session_state.show_delete_confirm:
-                        if st.button("✅ Confirm Delete", type="primary"):
-                            try:
-                                success = manager.delete_portfolio(selected_portfolio_name)
-                                if success:
-                                    st.success(f"✅ Portfolio '{selected_portfolio_name}' deleted!")
-                                    st.session_state.show_delete_confirm = False
-                                    st.session_state.pop("edit_portfolio_select", None)
-                                    st.rerun()
-                                else:
-                                    st.error("❌ Failed to delete portfolio")
-                            except Exception as e:
-                                st.error(f"❌ Error: {e}")
-                        
-                        if st.button("❌ Cancel"):
-                            st.session_state.show_delete_confirm = False
-                            st.rerun()
+                _quick_delete_fragment(selected_portfolio_name)
     
     with tab3:
         st.subheader("Portfolio Details")
@@ -736,7 +959,7 @@ def show_portfolio_management():
                         st.plotly_chart(fig, use_container_width=True)
                     
                     # Current vs target weights
-                    if any(h.target_weight for h in portfolio.holdings):
+                    if (portfolio.target_weights > 0).any():
                         fig_comparison = create_holdings_comparison_chart(portfolio)
                         if fig_comparison:
                             st.plotly_chart(fig_comparison, use_container_width=True)
@@ -745,12 +968,7 @@ def show_portfolio_management():
                 st.subheader("⚖️ Portfolio Rebalancing")
                 
                 # Check if rebalancing is needed
-                needs_rebalancing = False
-                for holding in portfolio.holdings:
-                    deviation = holding.get_weight_deviation()
-                    if deviation and abs(deviation) > 0.05:  # 5% threshold
-                        needs_rebalancing = True
-                        break
+                needs_rebalancing = portfolio.needs_rebalancing(0.05)  # 5% threshold
                 
                 if needs_rebalancing:
                     st.warning("⚠️ Portfolio may need rebalancing")
@@ -776,6 +994,9 @@ def show_portfolio_management():
                         f"Type '{selected_portfolio_name}' to confirm deletion:",
                         key="delete_confirmation"
                     )
+                    name_confirmed = hmac.compare_digest(
+                        confirmation.encode('utf-8'), selected_portfolio_name.encode('utf-8')
+                    )
                     
                     col1, col2 = st.columns([1, 3])
                     
@@ -783,7 +1004,7 @@ def show_portfolio_management():
                         if st.button(
                             "🗑️ DELETE", 
                             type="secondary", 
-                            disabled=(confirmation != selected_portfolio_name),
+                            disabled=not name_confirmed,
                             key="confirm_delete"
                         ):
                             try:
@@ -800,16 +1021,294 @@ def show_portfolio_management():
                                 st.error(f"❌ Error deleting portfolio: {e}")
                     
                     with col2:
-                        if confirmation and confirmation != selected_portfolio_name:
+                        if confirmation and not name_confirmed:
                             st.warning("⚠️ Portfolio name doesn't match. Please type the exact name.")
 
 
+@st.fragment
+def _automated_trading_fragment(portfolio):
+    """Render the automated trading controls, rerunning only this section on interaction."""
+    manager = get_portfolio_manager()
+    
+    st.markdown("---")
+    st.header("🚀 Automated Trading")
+    
+    # Automated Trading option
+    enable_auto_trading = st.checkbox(
+        "Enable Automated Trading",
+        help="Automatically generate and execute trading recommendations for this portfolio"
+    )
+    
+    # Trading configuration (only show if automated trading is enabled)
+    if enable_auto_trading:
+        st.markdown("### ⚙️ Trading Configuration")
+        
+        # Check if simulation components are available
+        if not SIMULATION_AVAILABLE:
+            st.error("❌ Simulation trading components are not available")
+            enable_auto_trading = False
+        else:
+            init_simulation_state()
+            simulation_manager = st.session_state.simulation_manager
+            automated_trader = st.session_state.automated_trader
+            
+            # Select account
+            user_id = "demo_user"
+            accounts = simulation_manager.get_user_accounts(user_id)
+            
+            if not accounts:
+                st.warning("No simulation accounts available. Create an account in Simulation > Account Management first.")
+                enable_auto_trading = False
+            else:
+                accounts_by_id = {acc.account_id: acc for acc in accounts}
+                account_id = st.selectbox(
+                    "Select Trading Account",
+                    list(accounts_by_id),
+                    format_func=lambda x: accounts_by_id[x].account_name,
+                    key="analysis_auto_trade_account"
+                )
+                
+                account = accounts_by_id[account_id]
+                available_balance = float(account.available_balance)
+                
+                # Display account status
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Available Funds", f"${available_balance:,.0f}")
+                with col2:
+                    st.metric("Total Assets", f"${account.total_value:,.0f}")
+                with col3:
+                    st.metric("Return Rate", f"{account.total_return:+.1f}%")
+                
+                # Trading configuration
+                trade_col1, trade_col2, trade_col3 = st.columns(3)
+                
+                with trade_col1:
+                    investment_amount = st.number_input(
+                        "Investment Amount ($)",
+                        min_value=100.0,
+                        max_value=available_balance,
+                        value=min(10000.0, available_balance),
+                        step=100.0,
+                        key="analysis_auto_trade_amount"
+                    )
+                
+                with trade_col2:
+                    risk_level = st.selectbox(
+                        "Risk Level",
+                        ["conservative", "moderate", "aggressive"],
+                        format_func=lambda x: {
+                            "conservative": "Conservative (Low Risk)",
+                            "moderate": "Moderate (Balanced)",
+                            "aggressive": "Aggressive (High Risk)"
+                        }.get(x, x),
+                        key="analysis_auto_trade_risk"
+                    )
+                
+                with trade_col3:
+                    analysis_method = st.selectbox(
+                        "Analysis Method",
+                        ["comprehensive", "technical", "fundamental"],
+                        format_func=lambda x: {
+                            "comprehensive": "Comprehensive",
+                            "technical": "Technical Only",
+                            "fundamental": "Fundamental Only"
+                        }.get(x, x),
+                        key="analysis_auto_trade_analysis"
+                    )
+        
+        # Automated Trading execution (only show if enabled)
+        if enable_auto_trading and SIMULATION_AVAILABLE and 'account' in locals():
+            st.markdown("### 🚀 Execute Trading")
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                st.markdown("**Ready to execute automated trading based on the analysis above.**")
+                st.markdown(f"• **Portfolio:** {portfolio.name} ({len(portfolio.holdings)} stocks)")
+                st.markdown(f"• **Investment:** ${investment_amount:,.0f}")
+                st.markdown(f"• **Risk Level:** {risk_level.title()}")
+                st.markdown(f"• **Analysis Method:** {analysis_method.title()}")
+            
+            with col2:
+                execute_trading = st.button(
+                    "🚀 Execute Automated Trading",
+                    type="primary",
+                    key="execute_analysis_auto_trade",
+                    help="Execute automated trading based on portfolio analysis"
+                )
+            
+            if execute_trading:
+                selected_stocks = [h.symbol for h in portfolio.holdings]
+                
+                with st.spinner("🤖 Analyzing stocks and generating recommendations..."):
+                    try:
+                        progress_bar = st.progress(0)
+                        status_text = st.empty()
+                        
+                        # Generate recommendations
+                        recommendations = generate_trading_recommendations(
+                            selected_stocks,
+                            ANALYSIS_STRATEGY_TYPES.get(analysis_method, "all"),
+                            progress_bar,
+                            status_text
+                        )
+                        
+                        progress_bar.progress(1.0)
+                        status_text.text("✅ Analysis completed!")
+                        
+                        if not recommendations:
+                            st.error("❌ No valid recommendations generated")
+                            return
+                        
+                        # Execute automated trading
+                        status_text.text("💰 Executing automated trades...")
+                        result = automated_trader.execute_portfolio_recommendations(
+                            account.account_id,
+                            recommendations,
+                            available_cash=investment_amount
+                        )
+                        
+                        if result["success"]:
+                            st.success("✅ Automated trading completed successfully!")
+                            
+                            # Display results
+                            col1, col2, col3, col4 = st.columns(4)
+                            with col1:
+                                st.metric("Successful Trades", result["successful_trades"])
+                            with col2:
+                                st.metric("Failed Trades", result["failed_trades_count"])
+                            with col3:
+                                st.metric("Total Invested", f"${result['total_invested']:,.0f}")
+                            with col4:
+                                st.metric("Recommendations", len(recommendations))
+                            
+                            # Show recommendation breakdown
+                            if "recommendation_summary" in result:
+                                rec_summary = result["recommendation_summary"]
+                                st.markdown("**Recommendation Breakdown:**")
+                                col1, col2, col3 = st.columns(3)
+                                with col1:
+                                    st.info(f"🟢 BUY: {rec_summary['buy_recommendations']}")
+                                with col2:
+                                    st.info(f"🔴 SELL: {rec_summary['sell_recommendations']}")
+                                with col3:
+                                    st.info(f"🟡 HOLD: {rec_summary['hold_recommendations']}")
+                                
+                                # Explain if no trades were executed
+                                if result["successful_trades"] == 0 and result["failed_trades_count"] == 0:
+                                    if rec_summary['buy_recommendations'] == 0 and rec_summary['sell_recommendations'] == 0:
+                                        st.warning("⚠️ No BUY or SELL recommendations were generated. All recommendations were HOLD. Consider using different stocks or analysis methods to generate trading signals.")
+                            
+                            # Account status update
+                            if result["account_summary"]:
+                                acc = result["account_summary"]["account"]
+                                st.markdown("### 📊 Account Status Update")
+                                col1, col2, col3 = st.columns(3)
+                                with col1:
+                                    st.metric("Current Balance", f"${acc.current_balance:,.2f}")
+                                with col2:
+                                    st.metric("Total Value", f"${acc.total_value:,.2f}")
+                                with col3:
+                                    st.metric("Total Return", f"{acc.total_return:+.1f}%")
+                            
+                            # Portfolio holdings update
+                            st.markdown("### 📁 Portfolio Holdings Update")
+                            try:
+                                # Get account positions from trading results
+                                account_summary = result.get("account_summary", {})
+                                positions = account_summary.get("positions", {})
+                                
+                                if positions:
+                                    # Portfolio summary
+                                    total_value = sum(pos.market_value for pos in positions.values())
+                                    total_positions = len(positions)
+                                    
+                                    col1, col2, col3, col4 = st.columns(4)
+                                    with col1:
+                                        st.metric("Total Positions", total_positions)
+                                    with col2:
+                                        st.metric("Portfolio Value", f"${total_value:,.2f}")
+                                    with col3:
+                                        st.metric("Account", account.account_name)
+                                    with col4:
+                                        st.metric("Last Updated", datetime.now().strftime("%H:%M:%S"))
+                                    
+                                    # Holdings table
+                                    st.markdown("**Current Positions:**")
+                                    
+                                    holdings_df = pd.DataFrame.from_records(
+                                        ((symbol, position.quantity, position.average_cost, position.current_price,
+                                          position.market_value, position.unrealized_pnl, position.unrealized_pnl_pct)
+                                         for symbol, position in positions.items()),
+                                        columns=["Symbol", "Quantity", "Avg Cost", "Current Price",
+                                                 "Market Value", "Unrealized P&L", "P&L %"]
+                                    )
+                                    st.dataframe(
+                                        holdings_df.style.format({
+                                            "Quantity": "{:,.0f}",
+                                            "Avg Cost": "${:.2f}",
+                                            "Current Price": "${:.2f}",
+                                            "Market Value": "${:,.2f}",
+                                            "Unrealized P&L": "${:+,.2f}",
+                                            "P&L %": "{:+.1f}%"
+                                        }),
+                                        use_container_width=True
+                                    )
+                                    
+                                    # Holdings summary
+                                    st.markdown("**Portfolio Summary:**")
+                                    total_cost = sum(pos.average_cost * pos.quantity for pos in positions.values())
+                                    total_pnl = sum(pos.unrealized_pnl for pos in positions.values())
+                                    total_pnl_pct = (total_pnl / total_cost * 100) if total_cost > 0 else 0
+                                    
+                                    col1, col2, col3 = st.columns(3)
+                                    with col1:
+                                        st.metric("Total Cost Basis", f"${total_cost:,.2f}")
+                                    with col2:
+                                        st.metric("Total P&L", f"${total_pnl:+,.2f}")
+                                    with col3:
+                                        st.metric("Total P&L %", f"{total_pnl_pct:+.1f}%")
+                                else:
+                                    st.info("No positions in account after trading.")
+                                    
+                            except Exception as e:
+                                st.warning(f"⚠️ Could not refresh account positions: {e}")
+                                # Fallback to portfolio holdings if account positions unavailable
+                                try:
+                                    updated_portfolio = manager.get_portfolio(portfolio.name)
+                                    if updated_portfolio.holdings:
+                                        st.markdown("**Portfolio Holdings (from portfolio data):**")
+                                        holdings_text = ", ".join([f"{h.symbol} ({h.weight:.1f}%)" for h in updated_portfolio.holdings])
+                                        st.info(holdings_text)
+                                except Exception as e2:
+                                    st.warning(f"⚠️ Could not load portfolio data either: {e2}")
+                            
+                            # Executed trade details
+                            if result["executed_trades"]:
+                                st.markdown("### 💼 Executed Trades")
+                                show_executed_trades(result["executed_trades"])
+                            
+                            # Failed trades
+                            if result["failed_trades"]:
+                                st.markdown("### ❌ Failed Trades")
+                                for trade in result["failed_trades"]:
+                                    st.error(f"{trade['action']} {trade['symbol']}: {trade['error']}")
+                        
+                        else:
+                            st.error(f"❌ Automated trading failed: {result.get('error', 'Unknown error')}")
+                        
+                    except Exception as e:
+                        st.error(f"❌ Error during automated trading: {str(e)}")
+                    finally:
+                        progress_bar.empty()
+                        status_text.empty()
+
+
 def show_portfolio_analysis():
     """Show portfolio analysis page."""
     st.markdown('<h1 class="main-header">🔍 Portfolio Analysis</h1>', unsafe_allow_html=True)
     
-    manager = st.session_state.portfolio_manager
-    analyzer = st.session_state.portfolio_analyzer
+    manager = get_portfolio_manager()
     
     portfolios = manager.list_portfolios()
     
@@ -840,7 +1339,7 @@ def show_portfolio_analysis():
     # Perform analysis
     try:
         with st.spinner("Analyzing portfolio..."):
-            analysis = analyzer.analyze_portfolio(portfolio, force_refresh=force_refresh)
+            analysis = analyze_portfolio_cached(portfolio, force_refresh=force_refresh)
         
         # Overall recommendation
         st.subheader("💡 Overall Recommendation")
@@ -891,20 +1390,17 @@ def show_portfolio_analysis():
         individual = analysis['individual_analysis']
         
         # Create a simple holdings table
-        holdings_data = []
-        for symbol, stock_analysis in individual.items():
-            holdings_data.append({
-                'Symbol': symbol,
-                'Weight': f"{stock_analysis['weight']:.1%}",
-                'Recommendation': stock_analysis['recommendation'],
-                'Confidence': f"{stock_analysis['confidence']:.1%}",
-                'Risk Score': f"{stock_analysis['risk_score']:.2f}",
-                'Current Price': f"${stock_analysis.get('current_price', 0):.2f}" if stock_analysis.get('current_price') else "N/A"
-            })
-        
-        if holdings_data:
-            df_holdings = pd.DataFrame(holdings_data)
-            st.dataframe(df_holdings, use_container_width=True)
+        if individual:
+            df_holdings = get_individual_frame(individual)
+            st.dataframe(
+                df_holdings.style.format({
+                    'Weight': '{:.1%}',
+                    'Confidence': '{:.1%}',
+                    'Risk Score': '{:.2f}',
+                    'Current Price': '${:.2f}'
+                }, na_rep="N/A"),
+                use_container_width=True
+            )
         
         # Risk assessment
         st.subheader("⚠️ Risk Assessment")
@@ -932,21 +1428,22 @@ def show_portfolio_analysis():
         rebalance_suggestions = analysis.get('rebalance_suggestions', [])
         
         if rebalance_suggestions:
-            suggestion_data = []
-            for suggestion in rebalance_suggestions:
-                if 'symbol' in suggestion:
-                    suggestion_data.append({
-                        'Stock': suggestion['symbol'],
-                        'Action': suggestion['action'].title(),
-                        'Current Weight': f"{suggestion['current_weight']:.1%}",
-                        'Target Weight': f"{suggestion['target_weight']:.1%}",
-                        'Deviation': f"{suggestion['deviation']:+.1%}",
-                        'Priority': suggestion['priority'].title()
-                    })
+            df_suggestions = pd.DataFrame.from_records(
+                [suggestion for suggestion in rebalance_suggestions if 'symbol' in suggestion],
+                columns=list(SUGGESTION_COLUMNS)
+            ).rename(columns=SUGGESTION_COLUMNS)
             
-            if suggestion_data:
-                df_suggestions = pd.DataFrame(suggestion_data)
-                st.dataframe(df_suggestions, use_container_width=True)
+            if not df_suggestions.empty:
+                df_suggestions['Action'] = df_suggestions['Action'].str.title()
+                df_suggestions['Priority'] = df_suggestions['Priority'].str.title()
+                st.dataframe(
+                    df_suggestions.style.format({
+                        'Current Weight': '{:.1%}',
+                        'Target Weight': '{:.1%}',
+                        'Deviation': '{:+.1%}'
+                    }),
+                    use_container_width=True
+                )
             
             # Rebalance button
             if st.button("Apply Rebalancing", type="primary"):
@@ -992,303 +1489,7 @@ def show_portfolio_analysis():
             st.info("ℹ️ This analysis used cached data. Check 'Force Refresh' for updated analysis.")
         
         # Automated Trading section (moved to bottom of page)
-        st.markdown("---")
-        st.header("🚀 Automated Trading")
-        
-        # Automated Trading option
-        enable_auto_trading = st.checkbox(
-            "Enable Automated Trading",
-            help="Automatically generate and execute trading recommendations for this portfolio"
-        )
-        
-        # Trading configuration (only show if automated trading is enabled)
-        if enable_auto_trading:
-            st.markdown("### ⚙️ Trading Configuration")
-            
-            # Check if simulation components are available
-            if not SIMULATION_AVAILABLE:
-                st.error("❌ Simulation trading components are not available")
-                enable_auto_trading = False
-            else:
-                # Select account
-                user_id = "demo_user"
-                accounts = st.session_state.simulation_manager.get_user_accounts(user_id)
-                
-                if not accounts:
-                    st.warning("No simulation accounts available. Create an account in Simulation > Account Management first.")
-                    enable_auto_trading = False
-                else:
-                    account_id = st.selectbox(
-                        "Select Trading Account",
-                        [acc.account_id for acc in accounts],
-                        format_func=lambda x: next(acc.account_name for acc in accounts if acc.account_id == x),
-                        key="analysis_auto_trade_account"
-                    )
-                    
-                    account = next(acc for acc in accounts if acc.account_id == account_id)
-                    
-                    # Display account status
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Available Funds", f"${account.available_balance:,.0f}")
-                    with col2:
-                        st.metric("Total Assets", f"${account.total_value:,.0f}")
-                    with col3:
-                        st.metric("Return Rate", f"{account.total_return:+.1f}%")
-                    
-                    # Trading configuration
-                    trade_col1, trade_col2, trade_col3 = st.columns(3)
-                    
-                    with trade_col1:
-                        investment_amount = st.number_input(
-                            "Investment Amount ($)",
-                            min_value=100.0,
-                            max_value=float(account.available_balance),
-                            value=min(10000.0, float(account.available_balance)),
-                            step=100.0,
-                            key="analysis_auto_trade_amount"
-                        )
-                    
-                    with trade_col2:
-                        risk_level = st.selectbox(
-                            "Risk Level",
-                            ["conservative", "moderate", "aggressive"],
-                            format_func=lambda x: {
-                                "conservative": "Conservative (Low Risk)",
-                                "moderate": "Moderate (Balanced)",
-                                "aggressive": "Aggressive (High Risk)"
-                            }.get(x, x),
-                            key="analysis_auto_trade_risk"
-                        )
-                    
-                    with trade_col3:
-                        analysis_method = st.selectbox(
-                            "Analysis Method",
-                            ["comprehensive", "technical", "fundamental"],
-                            format_func=lambda x: {
-                                "comprehensive": "Comprehensive",
-                                "technical": "Technical Only",
-                                "fundamental": "Fundamental Only"
-                            }.get(x, x),
-                            key="analysis_auto_trade_analysis"
-                        )
-            
-            # Automated Trading execution (only show if enabled)
-            if enable_auto_trading and SIMULATION_AVAILABLE and 'account' in locals():
-                st.markdown("### 🚀 Execute Trading")
-                
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    st.markdown("**Ready to execute automated trading based on the analysis above.**")
-                    st.markdown(f"• **Portfolio:** {portfolio.name} ({len(portfolio.holdings)} stocks)")
-                    st.markdown(f"• **Investment:** ${investment_amount:,.0f}")
-                    st.markdown(f"• **Risk Level:** {risk_level.title()}")
-                    st.markdown(f"• **Analysis Method:** {analysis_method.title()}")
-                
-                with col2:
-                    execute_trading = st.button(
-                        "🚀 Execute Automated Trading",
-                        type="primary",
-                        key="execute_analysis_auto_trade",
-                        help="Execute automated trading based on portfolio analysis"
-                    )
-                
-                if execute_trading:
-                    selected_stocks = [h.symbol for h in portfolio.holdings]
-                    
-                    with st.spinner("🤖 Analyzing stocks and generating recommendations..."):
-                        try:
-                            # Import required components
-                            from src.engines.recommendation_engine import RecommendationEngine
-                            from src.analyzers.stock_analyzer import StockAnalyzer
-                            from src.languages.config import LanguageConfig
-                            
-                            # Map analysis method to strategy type
-                            strategy_mapping = {
-                                "comprehensive": "all",
-                                "technical": "technical",
-                                "fundamental": "quantitative"
-                            }
-                            strategy_type = strategy_mapping.get(analysis_method, "all")
-                            
-                            # Generate recommendations
-                            recommendations = []
-                            lang_config = LanguageConfig("en")
-                            
-                            progress_bar = st.progress(0)
-                            status_text = st.empty()
-                            
-                            for i, symbol in enumerate(selected_stocks):
-                                try:
-                                    status_text.text(f"🔍 Analyzing {symbol}...")
-                                    progress_bar.progress((i) / len(selected_stocks))
-                                    
-                                    # Create analyzer
-                                    analyzer_instance = StockAnalyzer(symbol)
-                                    analyzer_instance.fetch_data()
-                                    
-                                    # Generate recommendation
-                                    recommendation_engine = RecommendationEngine(analyzer_instance, lang_config)
-                                    recommendation = recommendation_engine.generate_recommendation_for_symbol(
-                                        analyzer_instance, symbol, strategy_type
-                                    )
-                                    
-                                    recommendations.append(recommendation)
-                                    
-                                except Exception as e:
-                                    st.warning(f"⚠️ Failed to analyze {symbol}: {str(e)}")
-                                    continue
-                            
-                            progress_bar.progress(1.0)
-                            status_text.text("✅ Analysis completed!")
-                            
-                            if not recommendations:
-                                st.error("❌ No valid recommendations generated")
-                                return
-                            
-                            # Execute automated trading
-                            status_text.text("💰 Executing automated trades...")
-                            result = st.session_state.automated_trader.execute_portfolio_recommendations(
-                                account.account_id,
-                                recommendations,
-                                available_cash=investment_amount
-                            )
-                            
-                            if result["success"]:
-                                st.success("✅ Automated trading completed successfully!")
-                                
-                                # Display results
-                                col1, col2, col3, col4 = st.columns(4)
-                                with col1:
-                                    st.metric("Successful Trades", result["successful_trades"])
-                                with col2:
-                                    st.metric("Failed Trades", result["failed_trades_count"])
-                                with col3:
-                                    st.metric("Total Invested", f"${result['total_invested']:,.0f}")
-                                with col4:
-                                    st.metric("Recommendations", len(recommendations))
-                                
-                                # Show recommendation breakdown
-                                if "recommendation_summary" in result:
-                                    rec_summary = result["recommendation_summary"]
-                                    st.markdown("**Recommendation Breakdown:**")
-                                    col1, col2, col3 = st.columns(3)
-                                    with col1:
-                                        st.info(f"🟢 BUY: {rec_summary['buy_recommendations']}")
-                                    with col2:
-                                        st.info(f"🔴 SELL: {rec_summary['sell_recommendations']}")
-                                    with col3:
-                                        st.info(f"🟡 HOLD: {rec_summary['hold_recommendations']}")
-                                    
-                                    # Explain if no trades were executed
-                                    if result["successful_trades"] == 0 and result["failed_trades_count"] == 0:
-                                        if rec_summary['buy_recommendations'] == 0 and rec_summary['sell_recommendations'] == 0:
-                                            st.warning("⚠️ No BUY or SELL recommendations were generated. All recommendations were HOLD. Consider using different stocks or analysis methods to generate trading signals.")
-                                
-                                # Account status update
-                                if result["account_summary"]:
-                                    acc = result["account_summary"]["account"]
-                                    st.markdown("### 📊 Account Status Update")
-                                    col1, col2, col3 = st.columns(3)
-                                    with col1:
-                                        st.metric("Current Balance", f"${acc.current_balance:,.2f}")
-                                    with col2:
-                                        st.metric("Total Value", f"${acc.total_value:,.2f}")
-                                    with col3:
-                                        st.metric("Total Return", f"{acc.total_return:+.1f}%")
-                                
-                                # Portfolio holdings update
-                                st.markdown("### 📁 Portfolio Holdings Update")
-                                try:
-                                    # Get account positions from trading results
-                                    account_summary = result.get("account_summary", {})
-                                    positions = account_summary.get("positions", {})
-                                    
-                                    if positions:
-                                        # Portfolio summary
-                                        total_value = sum(pos.market_value for pos in positions.values())
-                                        total_positions = len(positions)
-                                        
-                                        col1, col2, col3, col4 = st.columns(4)
-                                        with col1:
-                                            st.metric("Total Positions", total_positions)
-                                        with col2:
-                                            st.metric("Portfolio Value", f"${total_value:,.2f}")
-                                        with col3:
-                                            st.metric("Account", account.account_name)
-                                        with col4:
-                                            st.metric("Last Updated", datetime.now().strftime("%H:%M:%S"))
-                                        
-                                        # Holdings table
-                                        st.markdown("**Current Positions:**")
-                                        
-                                        holdings_data = []
-                                        for symbol, position in positions.items():
-                                            holdings_data.append({
-                                                "Symbol": symbol,
-                                                "Quantity": f"{position.quantity:,.0f}",
-                                                "Avg Cost": f"${position.average_cost:.2f}",
-                                                "Current Price": f"${position.current_price:.2f}",
-                                                "Market Value": f"${position.market_value:,.2f}",
-                                                "Unrealized P&L": f"${position.unrealized_pnl:+,.2f}",
-                                                "P&L %": f"{position.unrealized_pnl_pct:+.1f}%"
-                                            })
-                                        
-                                        holdings_df = pd.DataFrame(holdings_data)
-                                        st.dataframe(holdings_df, use_container_width=True)
-                                        
-                                        # Holdings summary
-                                        st.markdown("**Portfolio Summary:**")
-                                        total_cost = sum(pos.average_cost * pos.quantity for pos in positions.values())
-                                        total_pnl = sum(pos.unrealized_pnl for pos in positions.values())
-                                        total_pnl_pct = (total_pnl / total_cost * 100) if total_cost > 0 else 0
-                                        
-                                        col1, col2, col3 = st.columns(3)
-                                        with col1:
-                                            st.metric("Total Cost Basis", f"${total_cost:,.2f}")
-                                        with col2:
-                                            st.metric("Total P&L", f"${total_pnl:+,.2f}")
-                                        with col3:
-                                            st.metric("Total P&L %", f"{total_pnl_pct:+.1f}%")
-                                    else:
-                                        st.info("No positions in account after trading.")
-                                        
-                                except Exception as e:
-                                    st.warning(f"⚠️ Could not refresh account positions: {e}")
-                                    # Fallback to portfolio holdings if account positions unavailable
-                                    try:
-                                        updated_portfolio = manager.get_portfolio(portfolio.name)
-                                        if updated_portfolio.holdings:
-                                            st.markdown("**Portfolio Holdings (from portfolio data):**")
-                                            holdings_text = ", ".join([f"{h.symbol} ({h.weight:.1f}%)" for h in updated_portfolio.holdings])
-                                            st.info(holdings_text)
-                                    except Exception as e2:
-                                        st.warning(f"⚠️ Could not load portfolio data either: {e2}")
-                                
-                                # Executed trade details
-                                if result["executed_trades"]:
-                                    st.markdown("### 💼 Executed Trades")
-                                    for trade in result["executed_trades"]:
-                                        with st.expander(f"{trade['action']} {trade['quantity']} {trade['symbol']} @ ${trade['price']:.2f}"):
-                                            st.write(f"Amount: ${trade['amount']:,.2f}")
-                                            if 'recommendation' in trade:
-                                                rec = trade['recommendation']['recommendation']
-                                                st.write(f"AI Recommendation: {rec['action']} (confidence: {rec['confidence']})")
-                                
-                                # Failed trades
-                                if result["failed_trades"]:
-                                    st.markdown("### ❌ Failed Trades")
-                                    for trade in result["failed_trades"]:
-                                        st.error(f"{trade['action']} {trade['symbol']}: {trade['error']}")
-                            
-                            else:
-                                st.error(f"❌ Automated trading failed: {result.get('error', 'Unknown error')}")
-                            
-                        except Exception as e:
-                            st.error(f"❌ Error during automated trading: {str(e)}")
-                        finally:
-                            progress_bar.empty()
-                            status_text.empty()
+        _automated_trading_fragment(portfolio)
     
     except Exception as e:
         st.error(f"❌ Analysis failed: {e}")
@@ -1298,8 +1499,7 @@ def show_portfolio_comparison():
     """Show portfolio comparison page."""
     st.markdown('<h1 class="main-header">🆚 Portfolio Comparison</h1>', unsafe_allow_html=True)
     
-    manager = st.session_state.portfolio_manager
-    analyzer = st.session_state.portfolio_analyzer
+    manager = get_portfolio_manager()
     
     portfolios = manager.list_portfolios()
     
@@ -1308,19 +1508,20 @@ def show_portfolio_comparison():
         return
     
     # Portfolio selection
+    portfolio_names = [p.name for p in portfolios]
     col1, col2 = st.columns(2)
     
     with col1:
         portfolio1_name = st.selectbox(
             "Select First Portfolio",
-            options=[p.name for p in portfolios],
+            options=portfolio_names,
             key="compare_portfolio1"
         )
     
     with col2:
         portfolio2_name = st.selectbox(
             "Select Second Portfolio", 
-            options=[p.name for p in portfolios if p.name != portfolio1_name],
+            options=[name for name in portfolio_names if name != portfolio1_name],
             key="compare_portfolio2"
         )
     
@@ -1334,7 +1535,7 @@ def show_portfolio_comparison():
     # Perform comparison
     try:
         with st.spinner("Comparing portfolios..."):
-            comparison = analyzer.compare_portfolios(portfolio1, portfolio2)
+            comparison = compare_portfolios_cached(portfolio1, portfolio2)
         
         # Comparison header
         st.subheader(f"🔄 Comparing: {portfolio1_name} vs {portfolio2_name}")
@@ -1404,66 +1605,13 @@ def show_portfolio_comparison():
         analysis2 = comparison['portfolio2']['analysis']
         
         # Create comparison table
-        comparison_data = []
-        
-        metrics_to_compare = [
-            ('Expected Return', 'portfolio_metrics', 'expected_return', ':.1%'),
-            ('Risk Score', 'portfolio_metrics', 'risk_score', ':.2f'),
-            ('Diversification', 'portfolio_metrics', 'diversification_score', ':.1%'),
-            ('Risk Level', 'risk_assessment', 'risk_level', ''),
-            ('Recommendation', 'overall_recommendation', 'recommendation', ''),
-            ('Confidence', 'overall_recommendation', 'confidence', ':.1%')
-        ]
-        
-        for metric_name, category, key, format_str in metrics_to_compare:
-            value1 = analysis1[category][key]
-            value2 = analysis2[category][key]
-            
-            if format_str:
-                # Handle None values and ensure proper numeric formatting
-                try:
-                    if value1 is not None and isinstance(value1, (int, float)):
-                        if format_str == ':.1%':
-                            value1_str = f"{value1:.1%}"
-                        elif format_str == ':.2f':
-                            value1_str = f"{value1:.2f}"
-                        else:
-                            value1_str = format(value1, format_str.lstrip(':'))
-                    else:
-                        value1_str = "N/A"
-                except (ValueError, TypeError):
-                    value1_str = "N/A"
-                
-                try:
-                    if value2 is not None and isinstance(value2, (int, float)):
-                        if format_str == ':.1%':
-                            value2_str = f"{value2:.1%}"
-                        elif format_str == ':.2f':
-                            value2_str = f"{value2:.2f}"
-                        else:
-                            value2_str = format(value2, format_str.lstrip(':'))
-                    else:
-                        value2_str = "N/A"
-                except (ValueError, TypeError):
-                    value2_str = "N/A"
-            else:
-                value1_str = str(value1) if value1 is not None else "N/A"
-                value2_str = str(value2) if value2 is not None else "N/A"
-            
-            comparison_data.append({
-                'Metric': metric_name,
-                portfolio1_name: value1_str,
-                portfolio2_name: value2_str
-            })
-        
-        df_comparison = pd.DataFrame(comparison_data)
+        df_comparison = build_comparison_table(analysis1, analysis2, portfolio1_name, portfolio2_name)
         st.dataframe(df_comparison, use_container_width=True)
         
         # Risk-return visualization
         st.subheader("📊 Risk-Return Visualization")
         
-        analyses = [analysis1, analysis2]
-        fig = create_risk_return_chart(analyses)
+        fig = create_risk_return_chart(get_risk_return_points([analysis1, analysis2]))
         
         if fig:
             st.plotly_chart(fig, use_container_width=True)
@@ -1472,6 +1620,15 @@ def show_portfolio_comparison():
         st.error(f"❌ Comparison failed: {e}")
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def count_portfolio_files(portfolio_dir: str) -> Optional[int]:
+    """Count saved portfolio files, or None when the directory does not exist."""
+    if not os.path.isdir(portfolio_dir):
+        return None
+    with os.scandir(portfolio_dir) as entries:
+        return sum(1 for entry in entries if entry.name.endswith('.json'))
+
+
 def show_settings():
     """Show settings and configuration page."""
     st.markdown('<h1 class="main-header">⚙️ Settings</h1>', unsafe_allow_html=True)
@@ -1479,7 +1636,7 @@ def show_settings():
     # Language settings
     st.subheader("🌐 Language Settings")
     
-    current_language = getattr(st.session_state.portfolio_analyzer, 'language', 'en')
+    current_language = st.session_state.analysis_language
     
     new_language = st.selectbox(
         "Analysis Language",
@@ -1489,14 +1646,33 @@ def show_settings():
     )
     
     if new_language != current_language:
-        st.session_state.portfolio_analyzer = PortfolioAnalyzer(language=new_language)
+        st.session_state.analysis_language = new_language
         st.success(f"✅ Language changed to {'English' if new_language == 'en' else 'Chinese'}")
         st.rerun()
     
+    # Performance settings
+    st.subheader("⚡ Performance Settings")
+    
+    # Build the statistics table only while the section is toggled open
+    if st.toggle("Cache Diagnostics", key="cache_diagnostics"):
+        with st.container(border=True):
+            stats = PortfolioAnalyzer.get_stats()
+            if stats:
+                df_stats = pd.DataFrame.from_dict(stats, orient='index').rename_axis('Symbol')
+                st.dataframe(
+                    df_stats.sort_values('time', ascending=False).style.format({'time': '{:,.0f} ms'}),
+                    use_container_width=True
+                )
+                if st.button("Reset Statistics"):
+                    PortfolioAnalyzer.reset_stats()
+                    st.rerun()
+            else:
+                st.info("No analyses recorded yet")
+    
     # Data management
     st.subheader("💾 Data Management")
     
-    manager = st.session_state.portfolio_manager
+    manager = get_portfolio_manager()
     portfolios = manager.list_portfolios()
     
     col1, col2 = st.columns(2)
@@ -1507,16 +1683,24 @@ def show_settings():
         st.markdown(f"• Total Holdings: {sum(len(p.holdings) for p in portfolios)}")
         
         # Storage info
-        portfolio_dir = os.path.expanduser("~/.stock_recommender/portfolios")
-        if os.path.exists(portfolio_dir):
-            json_files = [f for f in os.listdir(portfolio_dir) if f.endswith('.json')]
-            st.markdown(f"• Saved Files: {len(json_files)}")
+        saved_files = count_portfolio_files(os.path.expanduser("~/.stock_recommender/portfolios"))
+        if saved_files is not None:
+            st.markdown(f"• Saved Files: {saved_files}")
     
     with col2:
         st.markdown("**Actions:**")
         
+        held_symbols = sorted({holding.symbol for p in portfolios for holding in p.holdings})
+        symbols_to_evict = st.multiselect("Symbols to refresh", held_symbols)
+        if symbols_to_evict and st.button("Evict Selected Symbols"):
+            evicted = evict_cached_symbols(portfolios, symbols_to_evict)
+            st.success(f"✅ Evicted cached analyses for {evicted} portfolio(s)")
+        
         if st.button("Clear Analysis Cache"):
             st.session_state.analysis_cache = {}
+            _cached_analyze_portfolio.clear()
+            _cached_compare_portfolios.clear()
+            PortfolioAnalyzer.clear_analysis_results()
             st.success("✅ Analysis cache cleared")
         
         if portfolios and st.button("Export All Portfolios"):
@@ -1552,10 +1736,7 @@ def show_simulation():
     """Display simulation trading main page"""
     st.header("🎮 Simulation Trading")
 
-    # Get simulation trading manager
-    simulation_manager = st.session_state.simulation_manager
-    virtual_trader = st.session_state.virtual_trader
-    backtest_engine = st.session_state.backtest_engine
+    init_simulation_state()
     
     # Subpage navigation
     simulation_pages = {
@@ -1575,6 +1756,40 @@ def show_simulation():
     # Execute selected subpage
     simulation_pages[selected_simulation_page]()
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_calculate_positions(account_tokens: tuple, _simulation_manager) -> Dict[str, Dict]:
+    """Calculate positions for (account id, transaction count) pairs, memoized until any account trades."""
+    return _simulation_manager.calculate_positions_bulk([account_id for account_id, _ in account_tokens])
+
+
+def get_accounts_positions(simulation_manager, account_ids: List[str]) -> Dict[str, Dict]:
+    """Get positions for several accounts through the shared positions cache."""
+    account_tokens = tuple(
+        (account_id, simulation_manager.get_transaction_count(account_id)) for account_id in account_ids
+    )
+    return _cached_calculate_positions(account_tokens, simulation_manager)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_positions_frame(account_token: tuple, _simulation_manager) -> pd.DataFrame:
+    """Build an account's positions table for an (account id, transaction count) pair."""
+    account_id = account_token[0]
+    positions = get_accounts_positions(_simulation_manager, [account_id])[account_id]
+    # Keep numeric columns so the table sorts by value; formatting is display-only
+    return pd.DataFrame.from_records(
+        ((symbol, position.quantity, position.average_cost, position.current_price,
+          position.market_value, position.unrealized_pnl, position.unrealized_pnl_pct)
+         for symbol, position in positions.items()),
+        columns=["Stock", "Quantity", "Avg Cost", "Current Price", "Market Value", "P&L", "P&L %"]
+    )
+
+
+def get_positions_frame(simulation_manager, account_id: str) -> pd.DataFrame:
+    """Get an account's positions table, rebuilt only after the account trades."""
+    account_token = (account_id, simulation_manager.get_transaction_count(account_id))
+    return _cached_positions_frame(account_token, simulation_manager)
+
+
 def show_simulation_accounts():
     """Display simulation account management page"""
     st.subheader("🎮 Simulation Accounts")
@@ -1608,6 +1823,9 @@ def show_simulation_accounts():
                     except Exception as e:
                         st.error(f"❌ Failed to create account: {str(e)}")
         else:
+            positions_by_account = get_accounts_positions(
+                simulation_manager, [account.account_id for account in accounts]
+            )
             for account in accounts:
                 with st.expander(f"📊 {account.account_name}", expanded=True):
                     col_a, col_b, col_c = st.columns(3)
@@ -1623,8 +1841,7 @@ def show_simulation_accounts():
                                 delta=f"{pnl_pct:+.1f}%" if pnl_pct else None)
                     
                     with col_c:
-                        positions = simulation_manager.calculate_positions(account.account_id)
-                        st.metric("Positions", len(positions))
+                        st.metric("Positions", len(positions_by_account[account.account_id]))
                         st.metric("Total Return", f"{account.total_return:+.1f}%")
     
     with col2:
@@ -1637,6 +1854,103 @@ def show_simulation_accounts():
             if st.button("📈 View Transaction History", type="secondary"):
                 st.info("Transaction history view coming soon...")
 
+
+@st.fragment
+def show_positions_sync(positions: Dict):
+    """
+    Display the section that syncs virtual trading positions to a portfolio.
+    
+    Runs as a fragment, so picking a target portfolio reruns only this section
+    rather than recomputing the positions and redrawing the whole trading page.
+    """
+    st.markdown("---")
+    st.markdown("### 🔄 Sync to Portfolio")
+    st.markdown("Sync your virtual trading positions to a real portfolio for performance analysis.")
+    
+    # Portfolio selection for sync
+    manager = get_portfolio_manager()
+    portfolios = manager.list_portfolios()
+    
+    if not portfolios:
+        st.warning("No portfolios available. Create a portfolio first to sync positions.")
+    else:
+        selected_portfolio_name = st.selectbox(
+            "Select Portfolio to Sync To",
+            options=[p.name for p in portfolios],
+            format_func=format_portfolio_option,
+            key="sync_portfolio_select"
+        )
+        
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            if st.button("🔄 Sync Positions to Portfolio", type="primary"):
+                try:
+                    if not positions:
+                        st.warning("No positions to sync. Make some virtual trades first.")
+                        return
+                    
+                    # Sync positions to portfolio, writing it to disk once at the end
+                    success_count = 0
+                    error_messages = []
+                    portfolio = manager.get_portfolio(selected_portfolio_name)
+                    total_portfolio_value = sum(p.market_value for p in positions.values())
+                    
+                    with manager.batched_saves():
+                        for symbol, position in positions.items():
+                            try:
+                                # Calculate weight based on position value relative to total portfolio value
+                                weight = position.market_value / total_portfolio_value if total_portfolio_value > 0 else 0
+                                
+                                existing_holding = portfolio.get_holding(symbol)
+                                
+                                if existing_holding:
+                                    # Update existing holding
+                                    manager.update_stock_weight(selected_portfolio_name, symbol, weight)
+                                    # Notes are saved along with the weight change when the batch ends
+                                    existing_holding.notes = f"Updated from virtual trading - {position.quantity} shares @ ${position.average_cost:.2f}"
+                                    existing_holding.last_updated = datetime.now()
+                                else:
+                                    # Add new holding
+                                    manager.add_stock(
+                                        selected_portfolio_name,
+                                        symbol,
+                                        weight,
+                                        notes=f"Synced from virtual trading - {position.quantity} shares @ ${position.average_cost:.2f}"
+                                    )
+                                success_count += 1
+                                
+                            except Exception as e:
+                                error_messages.append(f"Failed to sync {symbol}: {str(e)}")
+                    
+                    if success_count > 0:
+                        sync_message = (f"Synced {success_count} positions to portfolio '{selected_portfolio_name}', "
+                                        f"which now has {len(portfolio.holdings)} holdings")
+                        
+                        # Rerun only on a clean sync; errors would otherwise be lost to the rerun
+                        if not error_messages:
+                            queue_toast(sync_message)
+                            st.rerun()
+                        st.success(f"✅ {sync_message}")
+                    
+                    if error_messages:
+                        for error in error_messages:
+                            st.error(error)
+                            
+                except Exception as e:
+                    st.error(f"❌ Sync failed: {str(e)}")
+        
+        with col2:
+            if st.button("📊 View Synced Portfolio", type="secondary"):
+                if selected_portfolio_name:
+                    # Switch to portfolio analysis page
+                    st.session_state.selected_page = "🔍 Portfolio Analysis"
+                    st.session_state.analysis_portfolio = selected_portfolio_name
+                    st.rerun()
+                else:
+                    st.warning("Please select a portfolio first.")
+
+
 def show_virtual_trading():
     """Display virtual trading page"""
     st.subheader("💹 Virtual Trading")
@@ -1652,13 +1966,19 @@ def show_virtual_trading():
         st.warning("Please create a simulation account first")
         return
     
+    show_queued_toasts()
+    
+    accounts_by_id = {acc.account_id: acc for acc in accounts}
     account_id = st.selectbox(
         "Select Trading Account",
-        [acc.account_id for acc in accounts],
-        format_func=lambda x: next(acc.account_name for acc in accounts if acc.account_id == x)
+        list(accounts_by_id),
+        format_func=lambda x: accounts_by_id[x].account_name
     )
     
-    account = next(acc for acc in accounts if acc.account_id == account_id)
+    account = accounts_by_id[account_id]
+    
+    # Positions are computed once per run and shared by the sell form, table and sync
+    positions = get_accounts_positions(simulation_manager, [account_id])[account_id]
     
     # Display account status
     col1, col2, col3 = st.columns(3)
@@ -1689,12 +2009,8 @@ def show_virtual_trading():
                         account_id, buy_symbol, buy_quantity
                     )
                     
-                    st.success(f"✅ Buy successful!\\n"
-                             f"Stock: {buy_symbol}\\n"
-                             f"Quantity: {buy_quantity}\\n"
-                             f"Price: ${transaction.price:.2f}\\n"
-                             f"Total Amount: ${transaction.total_amount:.2f}")
-                    
+                    queue_toast(f"Bought {buy_quantity} {buy_symbol} @ ${transaction.price:.2f} "
+                                f"(total ${transaction.total_amount:,.2f})")
                     st.rerun()
                 except Exception as e:
                     st.error(f"❌ Trade failed: {str(e)}")
@@ -1702,8 +2018,6 @@ def show_virtual_trading():
     with col2:
         st.markdown("### 📉 Sell Stocks")
         with st.form("sell_form"):
-            # Get current positions
-            positions = simulation_manager.calculate_positions(account_id)
             if positions:
                 sell_symbol = st.selectbox("Select Stock", list(positions.keys()))
                 max_quantity = positions[sell_symbol].quantity
@@ -1718,12 +2032,8 @@ def show_virtual_trading():
                             account_id, sell_symbol, sell_quantity
                         )
                         
-                        st.success(f"✅ Sell successful!\\n"
-                                 f"Stock: {sell_symbol}\\n"
-                                 f"Quantity: {sell_quantity}\\n"
-                                 f"Price: ${transaction.price:.2f}\\n"
-                                 f"Total Amount: ${transaction.total_amount:.2f}")
-                        
+                        queue_toast(f"Sold {sell_quantity} {sell_symbol} @ ${transaction.price:.2f} "
+                                    f"(total ${transaction.total_amount:,.2f})")
                         st.rerun()
                     except Exception as e:
                         st.error(f"❌ Trade failed: {str(e)}")
@@ -1734,205 +2044,46 @@ def show_virtual_trading():
     st.markdown("---")
     st.markdown("### 📊 Current Positions")
     
-    positions = simulation_manager.calculate_positions(account_id)
     if positions:
-        positions_data = []
-        for symbol, position in positions.items():
-            positions_data.append({
-                "Stock": symbol,
-                "Quantity": position.quantity,
-                "Avg Cost": f"${position.average_cost:.2f}",
-                "Current Price": f"${position.current_price:.2f}",
-                "Market Value": f"${position.market_value:.2f}",
-                "P&L": f"${position.unrealized_pnl:+.2f}",
-                "P&L %": f"{position.unrealized_pnl_pct:+.1f}%"
-            })
-        
-        st.dataframe(positions_data, use_container_width=True)
+        positions_df = get_positions_frame(simulation_manager, account_id)
+        st.dataframe(
+            positions_df.style.format({
+                "Avg Cost": "${:.2f}",
+                "Current Price": "${:.2f}",
+                "Market Value": "${:.2f}",
+                "P&L": "${:+.2f}",
+                "P&L %": "{:+.1f}%"
+            }),
+            use_container_width=True
+        )
     else:
         st.info("No positions")
     
     # Sync to Portfolio section
-    st.markdown("---")
-    st.markdown("### 🔄 Sync to Portfolio")
-    st.markdown("Sync your virtual trading positions to a real portfolio for performance analysis.")
-    
-    # Portfolio selection for sync
-    portfolios = st.session_state.portfolio_manager.list_portfolios()
-    
-    if not portfolios:
-        st.warning("No portfolios available. Create a portfolio first to sync positions.")
-    else:
-        portfolio_options = {p.name: f"{p.name} ({len(p.holdings)} stocks)" for p in portfolios}
-        selected_portfolio_name = st.selectbox(
-            "Select Portfolio to Sync To",
-            options=list(portfolio_options.keys()),
-            format_func=lambda x: portfolio_options[x],
-            key="sync_portfolio_select"
-        )
-        
-        col1, col2 = st.columns([1, 1])
-        
-        with col1:
-            if st.button("🔄 Sync Positions to Portfolio", type="primary"):
-                try:
-                    # Get current positions
-                    current_positions = simulation_manager.calculate_positions(account_id)
-                    
-                    if not current_positions:
-                        st.warning("No positions to sync. Make some virtual trades first.")
-                        return
-                    
-                    # Sync positions to portfolio
-                    success_count = 0
-                    error_messages = []
-                    
-                    for symbol, position in current_positions.items():
-                        try:
-                            # Calculate weight based on position value relative to total portfolio value
-                            position_value = position.market_value
-                            total_portfolio_value = sum(p.market_value for p in current_positions.values())
-                            weight = position_value / total_portfolio_value if total_portfolio_value > 0 else 0
-                            
-                            # Check if holding already exists
-                            portfolio = st.session_state.portfolio_manager.get_portfolio(selected_portfolio_name)
-                            existing_holding = portfolio.get_holding(symbol)
-                            
-                            if existing_holding:
-                                # Update existing holding
-                                st.session_state.portfolio_manager.update_stock_weight(
-                                    selected_portfolio_name,
-                                    symbol,
-                                    weight
-                                )
-                                # Update notes separately
-                                existing_holding.notes = f"Updated from virtual trading - {position.quantity} shares @ ${position.average_cost:.2f}"
-                                existing_holding.last_updated = datetime.now()
-                                # Save the portfolio after updating notes
-                                st.session_state.portfolio_manager.file_manager.save_portfolio(portfolio)
-                            else:
-                                # Add new holding
-                                st.session_state.portfolio_manager.add_stock(
-                                    selected_portfolio_name,
-                                    symbol,
-                                    weight,
-                                    notes=f"Synced from virtual trading - {position.quantity} shares @ ${position.average_cost:.2f}"
-                                )
-                            success_count += 1
-                            
-                        except Exception as e:
-                            error_messages.append(f"Failed to sync {symbol}: {str(e)}")
-                    
-                    if success_count > 0:
-                        st.success(f"✅ Successfully synced {success_count} positions to portfolio '{selected_portfolio_name}'")
-                        
-                        # Show updated portfolio summary
-                        updated_portfolio = st.session_state.portfolio_manager.get_portfolio(selected_portfolio_name)
-                        st.info(f"Portfolio now has {len(updated_portfolio.holdings)} holdings")
-                        
-                        st.rerun()
-                    
-                    if error_messages:
-                        for error in error_messages:
-                            st.error(error)
-                            
-                except Exception as e:
-                    st.error(f"❌ Sync failed: {str(e)}")
-        
-        with col2:
-            if st.button("📊 View Synced Portfolio", type="secondary"):
-                if selected_portfolio_name:
-                    # Switch to portfolio analysis page
-                    st.session_state.selected_page = "🔍 Portfolio Analysis"
-                    st.session_state.analysis_portfolio = selected_portfolio_name
-                    st.rerun()
-                else:
-                    st.warning("Please select a portfolio first.")
+    show_positions_sync(positions)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_run_backtest(strategy: str, symbols: tuple, start_date, end_date,
+                         initial_balance: float, _backtest_engine) -> Dict:
+    """Run a backtest, memoized on its parameters for an hour."""
+    return _backtest_engine.run_backtest(
+        strategy_config={"type": strategy},
+        symbols=list(symbols),
+        start_date=pd.to_datetime(start_date),
+        end_date=pd.to_datetime(end_date),
+        initial_balance=initial_balance
+    )
+
+
+def run_backtest_cached(backtest_engine, strategy: str, symbols: List[str], start_date, end_date,
+                        initial_balance: float) -> Dict:
+    """Run a backtest through the parameter cache, so resubmitting the same settings is instant."""
+    result = _cached_run_backtest(strategy, tuple(symbols), start_date, end_date, initial_balance, backtest_engine)
+    if not result.get("success"):
+        # Don't keep failures (e.g. a data outage) around for the next attempt
+        _cached_run_backtest.clear(strategy, tuple(symbols), start_date, end_date, initial_balance, backtest_engine)
+    return result
 
-def show_backtesting():
-    """Display historical backtesting page"""
-    st.subheader("📈 Historical Backtesting")
-    
-    backtest_engine = st.session_state.backtest_engine
-    
-    with st.form("backtest_form"):
-        st.markdown("### Backtest Settings")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            symbols = st.multiselect(
-                "Select Stocks",
-                ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "NVDA"],
-                default=["AAPL", "MSFT"]
-            )
-            
-            strategy = st.selectbox(
-                "Investment Strategy",
-                ["buy_and_hold", "mean_reversion"],
-                format_func=lambda x: {
-                    "buy_and_hold": "Buy and Hold",
-                    "mean_reversion": "Mean Reversion"
-                }.get(x, x)
-            )
-        
-        with col2:
-            start_date = st.date_input("Start Date", value=pd.to_datetime("2023-01-01"))
-            end_date = st.date_input("End Date", value=pd.to_datetime("2023-12-31"))
-            initial_balance = st.number_input("Initial Balance", min_value=1000, value=100000)
-        
-        submitted = st.form_submit_button("Run Backtest", type="primary")
-        
-        if submitted and symbols:
-            with st.spinner("Running historical backtest..."):
-                try:
-                    result = backtest_engine.run_backtest(
-                        strategy_config={"type": strategy},
-                        symbols=symbols,
-                        start_date=pd.to_datetime(start_date),
-                        end_date=pd.to_datetime(end_date),
-                        initial_balance=initial_balance
-                    )
-                    
-                    if result.get("success"):
-                        st.success("✅ Backtest completed!")
-                        
-                        # Display results
-                        perf = result["performance"]
-                        
-                        col1, col2, col3, col4 = st.columns(4)
-                        
-                        with col1:
-                            st.metric("Total Return", f"{perf['total_return']:+.1f}%")
-                        with col2:
-                            st.metric("Annualized Return", f"{perf['annualized_return']:+.1f}%")
-                        with col3:
-                            st.metric("Max Drawdown", f"{perf['max_drawdown']:.1f}%")
-                        with col4:
-                            st.metric("Sharpe Ratio", f"{perf['sharpe_ratio']:.2f}")
-                        
-                        # Display portfolio value curve
-                        portfolio_values = result["portfolio_values"]
-                        if portfolio_values:
-                            chart_data = pd.DataFrame(portfolio_values)
-                            chart_data["date"] = pd.to_datetime(chart_data["date"])
-                            
-                            st.markdown("### 📊 Portfolio Value Chart")
-                            st.line_chart(chart_data.set_index("date")["value"])
-                        
-                        # Display transaction records
-                        transactions = result["transactions"]
-                        if transactions:
-                            st.markdown("### 📋 Transaction History")
-                            txn_df = pd.DataFrame(transactions)
-                            txn_df["timestamp"] = pd.to_datetime(txn_df["timestamp"])
-                            st.dataframe(txn_df, use_container_width=True)
-                    
-                    else:
-                        st.error(f"❌ Backtest failed: {result.get('error', 'Unknown error')}")
-                
-                except Exception as e:
-                    st.error(f"❌ Backtest failed: {str(e)}")
 
 def show_performance_analysis():
     """Display performance analysis page"""
@@ -1945,6 +2096,110 @@ def show_performance_analysis():
     st.markdown("- Monthly/annual performance reports")
 
 
+# Strategy types used by automated trading for each analysis method
+ANALYSIS_STRATEGY_TYPES = {
+    "comprehensive": "all",
+    "technical": "technical",
+    "fundamental": "quantitative"
+}
+
+# Backtests running at once across all sessions
+BACKTEST_MAX_WORKERS = 2
+
+# Most points sent to the browser for a backtest value curve
+CHART_MAX_POINTS = 500
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def get_price_histories(symbols: tuple, period: str = "1y") -> Tuple[Dict[str, pd.DataFrame], Optional[float]]:
+    """
+    Fetch price histories for several stocks, reused for fifteen minutes.
+    
+    All symbols are downloaded in one request. Returns frames keyed by
+    upper-cased symbol, leaving out symbols without data, and the time they
+    were downloaded so later readers can tell how old the last close is.
+    """
+    from src.analyzers.stock_analyzer import StockAnalyzer
+    
+    analyzers = StockAnalyzer.bulk_fetch(list(symbols), period)
+    histories = {symbol: analyzer.data for symbol, analyzer in analyzers.items() if analyzer.data is not None}
+    fetched_at = next((analyzer.fetched_at for analyzer in analyzers.values() if analyzer.data is not None), None)
+    return histories, fetched_at
+
+
+def generate_trading_recommendations(symbols: List[str], strategy_type: str,
+                                     progress_bar, status_text) -> List[Dict]:
+    """
+    Generate trading recommendations for several stocks.
+    
+    Price histories are downloaded in a single request, then one
+    recommendation engine scores every stock in a single batch. Stocks that
+    fail either step are reported and skipped; the rest are returned in the
+    order of ``symbols``.
+    """
+    from src.analyzers.stock_analyzer import StockAnalyzer
+    from src.engines.recommendation_engine import RecommendationEngine
+    
+    if not symbols:
+        return []
+    
+    status_text.text(f"🔍 Fetching price history for {len(symbols)} stocks...")
+    try:
+        histories, fetched_at = get_price_histories(tuple(symbols))
+    except Exception as e:
+        st.warning(f"⚠️ Failed to fetch price history: {str(e)}")
+        return []
+    progress_bar.progress(0.5)
+    
+    # Each call returns fresh frame copies, so every analyzer owns its data
+    analyzers = {}
+    for symbol in symbols:
+        data = histories.get(symbol.upper())
+        if data is None:
+            st.warning(f"⚠️ Failed to analyze {symbol}: no price data found")
+            continue
+        analyzers[symbol] = StockAnalyzer(symbol)
+        analyzers[symbol].data = data
+        # Keep the download time so the trader re-quotes prices served from the cache
+        analyzers[symbol].fetched_at = fetched_at
+    
+    if not analyzers:
+        return []
+    
+    # Scoring is CPU-bound, so one engine and its strategy objects handle every stock
+    status_text.text("🧠 Generating recommendations...")
+    recommendation_engine = RecommendationEngine(next(iter(analyzers.values())), "en")
+    recommendations, errors = recommendation_engine.generate_recommendations_batch(analyzers, strategy_type)
+    for symbol, error in errors.items():
+        st.warning(f"⚠️ Failed to analyze {symbol}: {error}")
+    
+    return list(recommendations.values())
+
+
+def show_executed_trades(trades: List[Dict]):
+    """Display executed automated trades as a single table."""
+    rows = []
+    for trade in trades:
+        rec = trade.get('recommendation', {}).get('recommendation', {})
+        rows.append({
+            'Action': trade['action'],
+            'Symbol': trade['symbol'],
+            'Quantity': trade['quantity'],
+            'Price': trade['price'],
+            'Amount': trade['amount'],
+            'AI Recommendation': rec.get('action', 'N/A'),
+            'Confidence': rec.get('confidence', 'N/A')
+        })
+
+    # One element regardless of trade count, where an expander per trade grew with every order
+    trades_df = pd.DataFrame.from_records(rows)
+    st.dataframe(
+        trades_df.style.format({'Price': '${:.2f}', 'Amount': '${:,.2f}'}),
+        use_container_width=True,
+        hide_index=True
+    )
+
+
 def show_automated_trading():
     """Display automated trading page"""
     st.header("🤖 Automated Trading")
@@ -1954,27 +2209,33 @@ def show_automated_trading():
         st.error("❌ Simulation trading components are not available")
         return
 
+    simulation_manager = st.session_state.simulation_manager
+    automated_trader = st.session_state.automated_trader
+    manager = get_portfolio_manager()
+
     # Select account
     user_id = "demo_user"
-    accounts = st.session_state.simulation_manager.get_user_accounts(user_id)
+    accounts = simulation_manager.get_user_accounts(user_id)
 
     if not accounts:
         st.warning("Please create a simulation account first in Account Management")
         return
 
+    accounts_by_id = {acc.account_id: acc for acc in accounts}
     account_id = st.selectbox(
         "Select Trading Account",
-        [acc.account_id for acc in accounts],
-        format_func=lambda x: next(acc.account_name for acc in accounts if acc.account_id == x),
+        list(accounts_by_id),
+        format_func=lambda x: accounts_by_id[x].account_name,
         key="auto_trade_account"
     )
 
-    account = next(acc for acc in accounts if acc.account_id == account_id)
+    account = accounts_by_id[account_id]
+    available_balance = float(account.available_balance)
 
     # Display account status
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Available Funds", f"${account.available_balance:,.0f}")
+        st.metric("Available Funds", f"${available_balance:,.0f}")
     with col2:
         st.metric("Total Assets", f"${account.total_value:,.0f}")
     with col3:
@@ -1983,21 +2244,20 @@ def show_automated_trading():
     st.markdown("---")
 
     # Portfolio selection for automated trading
-    portfolios = st.session_state.portfolio_manager.list_portfolios()
+    portfolios = manager.list_portfolios()
 
     if not portfolios:
         st.warning("No portfolios available. Create a portfolio first to use automated trading.")
         return
 
-    portfolio_options = {p.name: f"{p.name} ({len(p.holdings)} stocks)" for p in portfolios}
     selected_portfolio_name = st.selectbox(
         "Select Portfolio for Automated Trading",
-        options=list(portfolio_options.keys()),
-        format_func=lambda x: portfolio_options[x],
+        options=[p.name for p in portfolios],
+        format_func=format_portfolio_option,
         key="auto_trade_portfolio"
     )
 
-    selected_portfolio = st.session_state.portfolio_manager.get_portfolio(selected_portfolio_name)
+    selected_portfolio = manager.get_portfolio(selected_portfolio_name)
 
     # Display portfolio information
     st.markdown("### 📁 Selected Portfolio")
@@ -2024,8 +2284,8 @@ def show_automated_trading():
         investment_amount = st.number_input(
             "Investment Amount ($)",
             min_value=100.0,
-            max_value=float(account.available_balance),
-            value=min(10000.0, float(account.available_balance)),
+            max_value=available_balance,
+            value=min(10000.0, available_balance),
             step=100.0,
             key="auto_trade_amount"
         )
@@ -2064,46 +2324,16 @@ def show_automated_trading():
 
         with st.spinner("🤖 Analyzing stocks and generating recommendations..."):
             try:
-                # Import required components
-                from src.engines.recommendation_engine import RecommendationEngine
-                from src.analyzers.stock_analyzer import StockAnalyzer
-                from src.languages.config import LanguageConfig
-
-                # Generate recommendations
-                recommendations = []
-                lang_config = LanguageConfig("en")
-
                 progress_bar = st.progress(0)
                 status_text = st.empty()
 
-                for i, symbol in enumerate(selected_stocks):
-                    try:
-                        status_text.text(f"🔍 Analyzing {symbol}...")
-                        progress_bar.progress((i) / len(selected_stocks))
-
-                        # Create analyzer
-                        analyzer = StockAnalyzer(symbol)
-                        analyzer.fetch_data()
-
-                        # Map analysis method to strategy type
-                        strategy_mapping = {
-                            "comprehensive": "all",
-                            "technical": "technical",
-                            "fundamental": "quantitative"
-                        }
-                        strategy_type = strategy_mapping.get(analysis_method, "all")
-
-                        # Generate recommendation
-                        recommendation_engine = RecommendationEngine(analyzer, lang_config)
-                        recommendation = recommendation_engine.generate_recommendation_for_symbol(
-                            analyzer, symbol, strategy_type
-                        )
-
-                        recommendations.append(recommendation)
-
-                    except Exception as e:
-                        st.warning(f"⚠️ Failed to analyze {symbol}: {str(e)}")
-                        continue
+                # Generate recommendations
+                recommendations = generate_trading_recommendations(
+                    selected_stocks,
+                    ANALYSIS_STRATEGY_TYPES.get(analysis_method, "all"),
+                    progress_bar,
+                    status_text
+                )
 
                 progress_bar.progress(1.0)
                 status_text.text("✅ Analysis completed!")
@@ -2114,7 +2344,7 @@ def show_automated_trading():
 
                 # Execute automated trading
                 status_text.text("💰 Executing automated trades...")
-                result = st.session_state.automated_trader.execute_portfolio_recommendations(
+                result = automated_trader.execute_portfolio_recommendations(
                     account.account_id,
                     recommendations,
                     available_cash=investment_amount
@@ -2149,12 +2379,7 @@ def show_automated_trading():
                     # Executed trade details
                     if result["executed_trades"]:
                         st.markdown("### 💼 Executed Trades")
-                        for trade in result["executed_trades"]:
-                            with st.expander(f"{trade['action']} {trade['quantity']} {trade['symbol']} @ ${trade['price']:.2f}"):
-                                st.write(f"Amount: ${trade['amount']:,.2f}")
-                                if 'recommendation' in trade:
-                                    rec = trade['recommendation']['recommendation']
-                                    st.write(f"AI Recommendation: {rec['action']} (confidence: {rec['confidence']})")
+                        show_executed_trades(result["executed_trades"])
 
                     # Failed trades
                     if result["failed_trades"]:
@@ -2188,10 +2413,92 @@ def show_automated_trading():
         """)
 
 
+@st.cache_resource
+def get_backtest_executor() -> ThreadPoolExecutor:
+    """Get the worker pool that runs backtests for all sessions."""
+    # Kept apart from the shared worker pool so long backtests never hold up quick fetches
+    return ThreadPoolExecutor(max_workers=BACKTEST_MAX_WORKERS, thread_name_prefix="backtest")
+
+
+@st.fragment(run_every=1)
+def _backtest_progress_fragment():
+    """Poll the running backtest, rerunning the page once it finishes."""
+    if st.session_state.backtest_job.done():
+        st.rerun()
+    st.info("⏳ Running historical backtest... You can keep using the app meanwhile.")
+
+
+def downsample_for_chart(series: pd.Series, max_points: int = CHART_MAX_POINTS) -> pd.Series:
+    """Thin a series for plotting, keeping the low and high of each stretch."""
+    if len(series) <= max_points:
+        return series
+    
+    # Plain decimation can skip the drawdown low, so keep each bucket's extremes and the endpoints;
+    # two points per bucket plus the endpoints stays within max_points (at least 4)
+    buckets = np.arange(len(series)) * ((max_points - 2) // 2) // len(series)
+    grouped = pd.Series(series.to_numpy()).groupby(buckets)
+    keep = np.union1d(grouped.idxmin().to_numpy(), grouped.idxmax().to_numpy())
+    return series.iloc[np.union1d(keep, [0, len(series) - 1])]
+
+
+def build_transactions_frame(transactions: List[Dict]) -> pd.DataFrame:
+    """Build a compact table of backtest transactions."""
+    txn_df = pd.DataFrame.from_records(transactions)
+    # Trades share their backtest day's timestamp; a fixed format parses each distinct one once
+    txn_df["timestamp"] = pd.to_datetime(txn_df["timestamp"], format="ISO8601", cache=True)
+    # Few distinct symbols and types: categories go over the wire dictionary-encoded
+    return txn_df.astype({"symbol": "category", "type": "category", "quantity": "int32"})
+
+
+def show_backtest_result(result: Dict):
+    """Display the performance, value curve and transactions of a backtest result."""
+    if not result.get("success"):
+        st.error(f"❌ Backtest failed: {result.get('error', 'Unknown error')}")
+        return
+
+    st.success("✅ Backtest completed!")
+
+    # Display results
+    perf = result["performance"]
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("Total Return", f"{perf['total_return']:+.1f}%")
+    with col2:
+        st.metric("Annualized Return", f"{perf['annualized_return']:+.1f}%")
+    with col3:
+        st.metric("Max Drawdown", f"{perf['max_drawdown']:.1f}%")
+    with col4:
+        st.metric("Sharpe Ratio", f"{perf['sharpe_ratio']:.2f}")
+
+    # Display portfolio value curve
+    portfolio_values = result["portfolio_values"]
+    if portfolio_values:
+        chart_data = pd.Series(portfolio_values, index=result["portfolio_dates"], name="value")
+
+        st.subheader("📊 Portfolio Value Curve")
+        st.line_chart(downsample_for_chart(chart_data))
+
+    # Display transaction records
+    transactions = result["transactions"]
+    if transactions:
+        st.subheader("📋 Transaction Records")
+        # The result stays in session state, so build its table once rather than on every rerun
+        txn_df = result.get("transactions_frame")
+        if txn_df is None:
+            txn_df = result["transactions_frame"] = build_transactions_frame(transactions)
+        st.dataframe(txn_df, use_container_width=True, hide_index=True)
+
+
 def show_backtesting():
     """Display historical backtesting page"""
     st.header("📈 Historical Backtesting")
 
+    backtest_engine = st.session_state.backtest_engine
+    job = st.session_state.get('backtest_job')
+    running = job is not None and not job.done()
+
     with st.form("backtest_form"):
         st.subheader("Backtest Settings")
 
@@ -2218,96 +2525,54 @@ def show_backtesting():
             end_date = st.date_input("End Date", value=pd.to_datetime("2023-12-31"))
             initial_balance = st.number_input("Initial Balance", min_value=1000, value=100000)
 
-        submitted = st.form_submit_button("Start Backtest", type="primary")
-
-        if submitted and symbols:
-            with st.spinner("Running historical backtest..."):
-                try:
-                    result = st.session_state.backtest_engine.run_backtest(
-                        strategy_config={"type": strategy},
-                        symbols=symbols,
-                        start_date=pd.to_datetime(start_date),
-                        end_date=pd.to_datetime(end_date),
-                        initial_balance=initial_balance
-                    )
-
-                    if result.get("success"):
-                        st.success("✅ Backtest completed!")
+        submitted = st.form_submit_button("Start Backtest", type="primary", disabled=running)
 
-                        # Display results
-                        perf = result["performance"]
+    if submitted and symbols and not running:
+        # Run in the background so the page stays responsive; the fragment polls for the result
+        st.session_state.pop('backtest_result', None)
+        job = st.session_state.backtest_job = get_backtest_executor().submit(
+            call_in_script_ctx, get_script_run_ctx(), run_backtest_cached,
+            backtest_engine, strategy, symbols, start_date, end_date, initial_balance
+        )
+        running = True
 
-                        col1, col2, col3, col4 = st.columns(4)
+    if running:
+        _backtest_progress_fragment()
+    elif job is not None:
+        del st.session_state.backtest_job
+        try:
+            st.session_state.backtest_result = job.result()
+        except Exception as e:
+            st.error(f"❌ Backtest failed: {str(e)}")
 
-                        with col1:
-                            st.metric("Total Return", f"{perf['total_return']:+.1f}%")
-                        with col2:
-                            st.metric("Annualized Return", f"{perf['annualized_return']:+.1f}%")
-                        with col3:
-                            st.metric("Max Drawdown", f"{perf['max_drawdown']:.1f}%")
-                        with col4:
-                            st.metric("Sharpe Ratio", f"{perf['sharpe_ratio']:.2f}")
-
-                        # Display portfolio value curve
-                        portfolio_values = result["portfolio_values"]
-                        if portfolio_values:
-                            chart_data = pd.DataFrame(portfolio_values)
-                            chart_data["date"] = pd.to_datetime(chart_data["date"])
-
-                            st.subheader("📊 Portfolio Value Curve")
-                            st.line_chart(chart_data.set_index("date")["value"])
-
-                        # Display transaction records
-                        transactions = result["transactions"]
-                        if transactions:
-                            st.subheader("📋 Transaction Records")
-                            txn_df = pd.DataFrame(transactions)
-                            txn_df["timestamp"] = pd.to_datetime(txn_df["timestamp"])
-                            st.dataframe(txn_df, use_container_width=True)
+    if 'backtest_result' in st.session_state:
+        show_backtest_result(st.session_state.backtest_result)
 
-                    else:
-                        st.error(f"❌ Backtest failed: {result.get('error', 'Unknown error')}")
 
-                except Exception as e:
-                    st.error(f"❌ Backtest failed: {str(e)}")
+# Main application
+# Navigation pages and the functions that render them
+PAGES = {
+    "🏠 Dashboard": show_dashboard,
+    "💼 Portfolio Management": show_portfolio_management,
+    "🔍 Portfolio Analysis": show_portfolio_analysis,
+    "🆚 Portfolio Comparison": show_portfolio_comparison,
+    "🎮 Simulation Trading": show_simulation if SIMULATION_AVAILABLE else show_simulation_unavailable,
+    "⚙️ Settings": show_settings
+}
 
 
-# Main application
 def main():
     """Main application entry point."""
     # Initialize session state
     init_session_state()
     
-    # Initialize simulation components
-    if SIMULATION_AVAILABLE:
-        if 'simulation_manager' not in st.session_state:
-            st.session_state.simulation_manager = SimulationAccountManager()
-        if 'virtual_trader' not in st.session_state:
-            st.session_state.virtual_trader = VirtualTrader(st.session_state.simulation_manager)
-        if 'backtest_engine' not in st.session_state:
-            st.session_state.backtest_engine = BacktestEngine()
-        if 'automated_trader' not in st.session_state:
-            st.session_state.automated_trader = AutomatedTrader(
-                st.session_state.simulation_manager,
-                st.session_state.virtual_trader
-            )
-    
     # Sidebar navigation
     st.sidebar.title("📊 Portfolio Manager")
     
-    pages = {
-        "🏠 Dashboard": show_dashboard,
-        "💼 Portfolio Management": show_portfolio_management,
-        "🔍 Portfolio Analysis": show_portfolio_analysis,
-        "🆚 Portfolio Comparison": show_portfolio_comparison,
-        "🎮 Simulation Trading": show_simulation if SIMULATION_AVAILABLE else show_simulation_unavailable,
-        "⚙️ Settings": show_settings
-    }
-    
-    selected_page = st.sidebar.selectbox("Navigation", options=list(pages.keys()))
+    selected_page = st.sidebar.selectbox("Navigation", options=list(PAGES))
     
     # Show portfolio summary in sidebar
-    portfolios = st.session_state.portfolio_manager.list_portfolios()
+    portfolios = get_portfolio_manager().list_portfolios()
     
     if portfolios:
         st.sidebar.subheader("📈 Quick Portfolio Stats")
@@ -2324,7 +2589,7 @@ def main():
         st.sidebar.info("No portfolios yet. Create your first portfolio!")
     
     # Run selected page
-    pages[selected_page]()
+    PAGES[selected_page]()
 
 
 if __name__ == "__main__":
@@ -1,30 +1,90 @@
 """
 Stock analyzer module for fetching and analyzing stock data
 """
+import time
 import yfinance as yf
 import pandas as pd
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from ..languages.config import LanguageConfig
 
+# One HTTP session shared by all analyzers so fetches reuse pooled keep-alive
+# connections. Yahoo expects a browser-impersonating curl_cffi session, which
+# yfinance itself uses; plain requests is the fallback for older installs.
+try:
+    from curl_cffi import requests as _http
+    _SESSION = _http.Session(impersonate="chrome")
+except ImportError:
+    import requests as _http
+    from requests.adapters import HTTPAdapter
+    _SESSION = _http.Session()
+    _SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
 
 class StockAnalyzer:
     """Stock analyzer - responsible for fetching and analyzing stock data"""
     
     def __init__(self, symbol: str, lang_config: Optional[LanguageConfig] = None):
         self.symbol = symbol.upper()
-        self.ticker = yf.Ticker(self.symbol)
+        self.ticker = yf.Ticker(self.symbol, session=_SESSION)
         self.data = None
+        # When `data` was downloaded (epoch seconds); None for data from anywhere else
+        self.fetched_at = None
         self.lang_config = lang_config or LanguageConfig('en')
         
     def fetch_data(self, period: str = "1y") -> pd.DataFrame:
         """Fetch historical stock data"""
         try:
             self.data = self.ticker.history(period=period)
+            self.fetched_at = time.time()
             if self.data.empty:
-                raise ValueError(self.lang_config.get("no_data_found").format(self.symbol))
+                raise ValueError(self.lang_config.t("no_data_found", self.symbol))
             return self.data
         except Exception as e:
-            raise Exception(self.lang_config.get("fetch_data_failed").format(str(e)))
+            raise Exception(self.lang_config.t("fetch_data_failed", str(e)))
+    
+    @classmethod
+    def bulk_fetch(cls, symbols: List[str], period: str = "1y",
+                   lang_config: Optional[LanguageConfig] = None) -> Dict[str, 'StockAnalyzer']:
+        """Fetch historical data for several stocks with a single download request
+        
+        Returns analyzers keyed by upper-cased symbol. Symbols without data keep
+        `data` as None, so analysis on them fails the same way as unfetched data.
+        """
+        lang_config = lang_config or LanguageConfig('en')
+        analyzers = {symbol.upper(): cls(symbol, lang_config) for symbol in symbols}
+        if not analyzers:
+            return analyzers
+        
+        fetched_at = time.time()
+        try:
+            data = yf.download(
+                tickers=" ".join(analyzers),
+                period=period,
+                group_by="ticker",
+                auto_adjust=True,
+                threads=True,
+                progress=False,
+                session=_SESSION
+            )
+        except Exception as e:
+            raise Exception(lang_config.t("fetch_data_failed", str(e)))
+        
+        for symbol, analyzer in analyzers.items():
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                symbol_data = data[symbol]
+            elif len(analyzers) == 1:
+                symbol_data = data
+            else:
+                continue
+            
+            symbol_data = symbol_data.dropna(how="all")
+            if not symbol_data.empty:
+                analyzer.data = symbol_data
+                analyzer.fetched_at = fetched_at
+        
+        return analyzers
     
     def calculate_technical_indicators(self) -> Dict:
         """Calculate technical indicators"""
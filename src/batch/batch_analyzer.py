@@ -67,9 +67,9 @@ class BatchAnalyzer:
         start_time = time.time()
         
         print(self.lang_config.get("batch_analysis_start"))
-        print(self.lang_config.get("batch_stock_count").format(len(symbols)))
-        print(self.lang_config.get("batch_strategy").format(strategy_type))
-        print(self.lang_config.get("batch_period").format(self.period))
+        print(self.lang_config.t("batch_stock_count", len(symbols)))
+        print(self.lang_config.t("batch_strategy", strategy_type))
+        print(self.lang_config.t("batch_period", self.period))
         print("-" * 50)
         
         # Initialize progress tracker
@@ -80,7 +80,7 @@ class BatchAnalyzer:
         
         # Create concurrent configuration
         config = create_optimized_config(len(symbols))
-        print(self.lang_config.get("batch_concurrent_config").format(config.max_workers, config.api_rate_limit))
+        print(self.lang_config.t("batch_concurrent_config", config.max_workers, config.api_rate_limit))
         
         # Execute concurrent analysis
         task_results = []
@@ -174,10 +174,10 @@ class BatchAnalyzer:
         print(f"\n" + "="*50)
         print(self.lang_config.get("batch_analysis_complete"))
         print("="*50)
-        print(self.lang_config.get("batch_total_stocks").format(result.total_stocks))
-        print(self.lang_config.get("batch_success_rate").format(result.successful_count, result.success_rate))
-        print(self.lang_config.get("batch_failed_count").format(result.failed_count))
-        print(self.lang_config.get("batch_total_time").format(result.analysis_time))
+        print(self.lang_config.t("batch_total_stocks", result.total_stocks))
+        print(self.lang_config.t("batch_success_rate", result.successful_count, result.success_rate))
+        print(self.lang_config.t("batch_failed_count", result.failed_count))
+        print(self.lang_config.t("batch_total_time", result.analysis_time))
         
         if result.failed_analyses:
             print(f"\n{self.lang_config.get('batch_failed_details')}")
@@ -191,11 +191,11 @@ class BatchAnalyzer:
         """Format user-friendly error message"""
         # Check for delisted stocks or network errors
         if 'delisted' in error.lower() or 'no data found' in error.lower():
-            return self.lang_config.get("error_stock_delisted").format(symbol)
+            return self.lang_config.t("error_stock_delisted", symbol)
         
         # Check for network-related errors
         if 'timeout' in error.lower() or 'connection' in error.lower():
-            return self.lang_config.get("error_network_issue").format(symbol)
+            return self.lang_config.t("error_network_issue", symbol)
         
         # Default error message
         return f"{symbol}: {error}"
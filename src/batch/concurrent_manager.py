@@ -137,7 +137,7 @@ class ConcurrentManager:
             except Exception as e:
                 # Create failure result
                 if self.lang_config:
-                    error_msg = self.lang_config.get("task_execution_exception").format(str(e))
+                    error_msg = self.lang_config.t("task_execution_exception", str(e))
                 else:
                     error_msg = f"Task execution exception: {str(e)}"
                 error_result = TaskResult(
@@ -67,7 +67,7 @@ class InputParser:
                 # Check command line stock quantity limit
                 if len(raw_symbols) > self.max_command_line_stocks:
                     if self.lang_config:
-                        error_msg = self.lang_config.get("command_line_limit_exceeded").format(self.max_command_line_stocks)
+                        error_msg = self.lang_config.t("command_line_limit_exceeded", self.max_command_line_stocks)
                     else:
                         error_msg = f"Command line input exceeds {self.max_command_line_stocks} stocks, please use file input"
                     result['errors'].append(error_msg)
@@ -98,7 +98,7 @@ class InputParser:
             
         except Exception as e:
             if self.lang_config:
-                error_msg = self.lang_config.get("parsing_failed").format(str(e))
+                error_msg = self.lang_config.t("parsing_failed", str(e))
             else:
                 error_msg = f"Input parsing failed: {str(e)}"
             result['errors'].append(error_msg)
@@ -119,14 +119,14 @@ class InputParser:
         
         if not file_path.exists():
             if self.lang_config:
-                error_msg = self.lang_config.get("file_not_found").format(file_path)
+                error_msg = self.lang_config.t("file_not_found", file_path)
             else:
                 error_msg = f"File does not exist: {file_path}"
             raise FileNotFoundError(error_msg)
         
         if file_path.suffix.lower() not in self.supported_formats:
             if self.lang_config:
-                error_msg = self.lang_config.get("unsupported_file_format").format(file_path.suffix)
+                error_msg = self.lang_config.t("unsupported_file_format", file_path.suffix)
             else:
                 error_msg = f"Unsupported file format: {file_path.suffix}"
             raise ValueError(error_msg)
@@ -140,7 +140,7 @@ class InputParser:
                 symbols = self._parse_csv_file(file_path)
         except Exception as e:
             if self.lang_config:
-                error_msg = self.lang_config.get("file_parsing_failed").format(str(e))
+                error_msg = self.lang_config.t("file_parsing_failed", str(e))
             else:
                 error_msg = f"Failed to parse file: {str(e)}"
             raise Exception(error_msg)
@@ -244,7 +244,7 @@ class ProgressTracker:
         
         # Basic statistics
         if self.lang_config:
-            total_text = self.lang_config.get("batch_total_stocks").format(stats.total_tasks)
+            total_text = self.lang_config.t("batch_total_stocks", stats.total_tasks)
         else:
             total_text = f"Total stocks: {stats.total_tasks}"
         print(f"📊 {total_text}")
@@ -253,14 +253,14 @@ class ProgressTracker:
         print(success_text.format(stats.completed, stats.success_rate))
         
         if self.lang_config:
-            failed_text = self.lang_config.get("batch_failed_count").format(stats.failed)
+            failed_text = self.lang_config.t("batch_failed_count", stats.failed)
         else:
             failed_text = f"❌ Failed: {stats.failed}"
         print(failed_text)
         
         elapsed_duration = self._format_duration(stats.elapsed_time) if stats.elapsed_time else '0s'
         if self.lang_config:
-            time_text = self.lang_config.get("batch_total_time").format(elapsed_duration)
+            time_text = self.lang_config.t("batch_total_time", elapsed_duration)
         else:
             time_text = f"⏱️  Total time: {elapsed_duration}"
         print(time_text)
@@ -282,7 +282,7 @@ class ProgressTracker:
             avg_time = stats.elapsed_time / stats.completed
             avg_duration = self._format_duration(avg_time)
             if self.lang_config:
-                avg_time_text = self.lang_config.get("batch_avg_time").format(avg_duration)
+                avg_time_text = self.lang_config.t("batch_avg_time", avg_duration)
                 print(avg_time_text)
             else:
                 print(f"📈 Average processing time: {avg_duration}")
@@ -1,20 +1,36 @@
 """
 Recommendation engine for generating stock investment recommendations
 """
-from datetime import datetime
-from typing import Dict, List
+import copy
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple, Union
 from ..engines.strategy_manager import StrategyManager
+from ..languages.config import LanguageConfig
+from ..languages.text_ids import TextId
 
 
 class RecommendationEngine:
     """Enhanced recommendation engine with multiple trading strategies"""
     
-    def __init__(self, analyzer, lang_config, strategies: List[str] = None):
+    # Memoized per-symbol recommendations shared across engine instances
+    _recommendation_cache: Dict[Tuple, Dict] = {}
+    _recommendation_cache_size = 512
+    # Engines in several sessions' threads share the memo; every access goes through this lock
+    _recommendation_cache_lock = threading.Lock()
+    
+    def __init__(self, analyzer, lang_config: Union[LanguageConfig, str], strategies: List[str] = None):
         self.analyzer = analyzer
-        self.lang_config = lang_config
-        self.strategy_manager = StrategyManager(lang_config)
+        # Accept a language code and resolve it to the shared config instance
+        self.lang_config = LanguageConfig(lang_config) if isinstance(lang_config, str) else lang_config
+        self.strategy_manager = StrategyManager(self.lang_config)
         self.strategies = strategies or ['all']
     
+    def set_language(self, lang_config: Union[LanguageConfig, str]):
+        """Switch the output language in place, keeping the warm strategy objects"""
+        self.lang_config = LanguageConfig(lang_config) if isinstance(lang_config, str) else lang_config
+        self.strategy_manager.set_language(self.lang_config)
+    
     def generate_recommendation(self, strategy_type: str = 'combined') -> Dict:
         """Generate enhanced investment recommendation using selected strategies"""
         try:
@@ -57,6 +73,8 @@ class RecommendationEngine:
                 },
                 'risk_level': risk_level,
                 'analysis_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                # current_price is the last close of the analyzer's data, so it is only as fresh as the fetch
+                'quote_ts': getattr(self.analyzer, 'fetched_at', None),
                 'strategy_used': recommendation.get('strategy_name', recommendation['strategy']),
                 'key_metrics': {
                     'RSI': round(metrics['rsi'], 2),
@@ -82,11 +100,11 @@ class RecommendationEngine:
         sma_50 = metrics['sma_50']
         
         if current_price > sma_20 > sma_50:
-            return self.lang_config.get("uptrend")
+            return self.lang_config.text(TextId.UPTREND)
         elif current_price < sma_20 < sma_50:
-            return self.lang_config.get("downtrend")
+            return self.lang_config.text(TextId.DOWNTREND)
         else:
-            return self.lang_config.get("sideways")
+            return self.lang_config.text(TextId.SIDEWAYS)
     
     def _analyze_momentum(self, metrics: Dict) -> str:
         """Legacy momentum analysis for display"""
@@ -97,16 +115,16 @@ class RecommendationEngine:
         momentum_signals = []
         
         if rsi > 70:
-            momentum_signals.append(self.lang_config.get("rsi_overbought"))
+            momentum_signals.append(self.lang_config.text(TextId.RSI_OVERBOUGHT))
         elif rsi < 30:
-            momentum_signals.append(self.lang_config.get("rsi_oversold"))
+            momentum_signals.append(self.lang_config.text(TextId.RSI_OVERSOLD))
         else:
-            momentum_signals.append(self.lang_config.get("rsi_neutral"))
+            momentum_signals.append(self.lang_config.text(TextId.RSI_NEUTRAL))
             
         if macd > macd_signal:
-            momentum_signals.append(self.lang_config.get("macd_bullish"))
+            momentum_signals.append(self.lang_config.text(TextId.MACD_BULLISH))
         else:
-            momentum_signals.append(self.lang_config.get("macd_bearish"))
+            momentum_signals.append(self.lang_config.text(TextId.MACD_BEARISH))
         
         return " | ".join(momentum_signals)
     
@@ -118,11 +136,11 @@ class RecommendationEngine:
         volume_ratio = current_volume / avg_volume
         
         if volume_ratio > 1.5:
-            return self.lang_config.get("volume_high")
+            return self.lang_config.text(TextId.VOLUME_HIGH)
         elif volume_ratio < 0.5:
-            return self.lang_config.get("volume_low")
+            return self.lang_config.text(TextId.VOLUME_LOW)
         else:
-            return self.lang_config.get("volume_normal")
+            return self.lang_config.text(TextId.VOLUME_NORMAL)
     
     def _assess_risk(self, metrics: Dict) -> str:
         """Assess risk level"""
@@ -142,36 +160,96 @@ class RecommendationEngine:
             risk_factors += 1
         
         if risk_factors >= 2:
-            return self.lang_config.get("high_risk")
+            return self.lang_config.text(TextId.HIGH_RISK)
         elif risk_factors == 1:
-            return self.lang_config.get("medium_risk")
+            return self.lang_config.text(TextId.MEDIUM_RISK)
         else:
-            return self.lang_config.get("low_risk")
+            return self.lang_config.text(TextId.LOW_RISK)
     
     def _format_confidence(self, confidence: float) -> str:
         """Format confidence level"""
         if confidence >= 0.7:
-            return self.lang_config.get("high")
+            return self.lang_config.text(TextId.HIGH)
         elif confidence >= 0.4:
-            return self.lang_config.get("medium")
+            return self.lang_config.text(TextId.MEDIUM)
         else:
-            return self.lang_config.get("low")
+            return self.lang_config.text(TextId.LOW)
     
     def generate_recommendation_for_symbol(self, analyzer, symbol: str, strategy_type: str = 'combined') -> Dict:
-        """Generate recommendation for a specific symbol"""
+        """Generate recommendation for a specific symbol (memoized per trading day and data snapshot)"""
+        cache_key = self._get_cache_key(analyzer, symbol, strategy_type)
+        if cache_key is not None:
+            with self._recommendation_cache_lock:
+                cached = self._recommendation_cache.get(cache_key)
+            if cached is not None:
+                # Cached entries are never mutated, so copying outside the lock is safe
+                recommendation = copy.deepcopy(cached)
+                # Same data snapshot, so only the time stamps of this request change
+                recommendation['analysis_time'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                recommendation['quote_ts'] = getattr(analyzer, 'fetched_at', None)
+                return recommendation
+        
         try:
-            # Temporarily set the analyzer's symbol
+            # Temporarily point the engine at the given analyzer and symbol
+            original_analyzer = self.analyzer
             original_symbol = getattr(analyzer, 'symbol', None)
+            self.analyzer = analyzer
             analyzer.symbol = symbol
 
-            # Generate recommendation
-            recommendation = self.generate_recommendation(strategy_type)
-
-            # Restore original symbol if it existed
-            if original_symbol is not None:
-                analyzer.symbol = original_symbol
-
-            return recommendation
+            try:
+                # Generate recommendation
+                recommendation = self.generate_recommendation(strategy_type)
+            finally:
+                # Restore original analyzer and symbol
+                self.analyzer = original_analyzer
+                if original_symbol is not None:
+                    analyzer.symbol = original_symbol
 
         except Exception as e:
             raise Exception(f"Recommendation generation failed for {symbol}: {str(e)}")
+        
+        if cache_key is not None:
+            entry = copy.deepcopy(recommendation)
+            cache = self._recommendation_cache
+            with self._recommendation_cache_lock:
+                if cache_key not in cache and len(cache) >= self._recommendation_cache_size:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    cache.pop(next(iter(cache)), None)
+                cache[cache_key] = entry
+        
+        return recommendation
+    
+    def generate_recommendations_batch(self, analyzers: Dict[str, object],
+                                       strategy_type: str = 'combined') -> Tuple[Dict[str, Dict], Dict[str, str]]:
+        """Generate recommendations for several symbols, reusing this engine's strategy objects
+        
+        `analyzers` maps each symbol to an analyzer with fetched data. Returns
+        (recommendations, errors), both keyed by symbol in the input order; one
+        symbol failing does not stop the others.
+        """
+        recommendations = {}
+        errors = {}
+        for symbol, analyzer in analyzers.items():
+            try:
+                recommendations[symbol] = self.generate_recommendation_for_symbol(analyzer, symbol, strategy_type)
+            except Exception as e:
+                errors[symbol] = str(e)
+        return recommendations, errors
+    
+    def _get_cache_key(self, analyzer, symbol: str, strategy_type: str) -> Optional[Tuple]:
+        """Build memoization key, or None when the analyzer has no data to key on"""
+        data = getattr(analyzer, 'data', None)
+        if data is None or data.empty:
+            return None
+        
+        language = getattr(self.lang_config, 'language', id(self.lang_config))
+        return (
+            symbol, strategy_type, language, date.today(),
+            data.index[-1], len(data), float(data['Close'].iloc[-1])
+        )
+    
+    @classmethod
+    def clear_cache(cls):
+        """Clear memoized recommendations"""
+        with cls._recommendation_cache_lock:
+            cls._recommendation_cache.clear()
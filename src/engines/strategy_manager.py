@@ -25,6 +25,12 @@ class StrategyManager:
             'ai': 0.25
         }
     
+    def set_language(self, lang_config):
+        """Switch the language of this manager and its strategies, keeping the strategy objects"""
+        self.lang_config = lang_config
+        for strategy in self.strategies.values():
+            strategy.lang_config = lang_config
+    
     def get_recommendation(self, analyzer, strategy_types: List[str] = None) -> Dict:
         """Get recommendation from specified strategies or all strategies"""
         
@@ -80,7 +86,7 @@ class StrategyManager:
             
             # Add weighted strategy reasons
             strategy_name = self.lang_config.get(f"strategy_{strategy_type}")
-            weight_text = self.lang_config.get(f"strategy_weight_{strategy_type}").format(int(weight * 100))
+            weight_text = self.lang_config.t(f"strategy_weight_{strategy_type}", int(weight * 100))
             all_reasons.extend(result['reasons'])
             all_reasons.append(weight_text)
         
@@ -1,9 +1,44 @@
 """
 Language package for US Stock Recommendation System
 Support English and Chinese localization
+
+Locale modules are imported on first use, so a single-language run only
+builds the text table it needs.
 """
 
-from .en import TEXTS as EN_TEXTS
-from .zh import TEXTS as ZH_TEXTS
+import importlib
+from functools import lru_cache
+from typing import Mapping
+
+from .text_ids import TextId
+
+SUPPORTED_LANGUAGES = ('en', 'zh')
+
+
+@lru_cache(maxsize=None)
+def get_texts(language: str = 'en') -> Mapping[str, str]:
+    """
+    Get the text table for a language, importing its module on first use.
+    
+    Args:
+        language: Language code ('en' or 'zh'), unknown codes fall back to English
+        
+    Returns:
+        Read-only mapping with localized strings
+    """
+    language = language.lower()
+    if language not in SUPPORTED_LANGUAGES:
+        language = 'en'
+    return importlib.import_module(f"{__name__}.{language}").TEXTS
+
+
+def __getattr__(name: str):
+    """Resolve EN_TEXTS/ZH_TEXTS lazily (PEP 562)."""
+    if name == 'EN_TEXTS':
+        return get_texts('en')
+    if name == 'ZH_TEXTS':
+        return get_texts('zh')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ['EN_TEXTS', 'ZH_TEXTS']
+__all__ = ['EN_TEXTS', 'ZH_TEXTS', 'TextId', 'SUPPORTED_LANGUAGES', 'get_texts']
@@ -1,28 +1,115 @@
 """
 Language configuration module for multi-language support
 """
-from typing import Dict
-from .en import TEXTS as EN_TEXTS
-from .zh import TEXTS as ZH_TEXTS
+import re
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+from . import get_texts
+from .text_ids import TextId
+
+
+# Format specs that have an exact printf-style equivalent
+_PRINTF_SPEC = re.compile(r"\.\d+f")
+
+
+def _compile_template(text: str) -> Optional[str]:
+    """Convert a str.format text with auto-numbered fields into a %-style template"""
+    parts = []
+    has_fields = False
+    for literal, field, spec, conversion in Formatter().parse(text):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if field or conversion or (spec and not _PRINTF_SPEC.fullmatch(spec)):
+            return None
+        parts.append("%" + spec if spec else "%s")
+        has_fields = True
+    return "".join(parts) if has_fields else None
+
+
+def _compile_templates(texts: Mapping[str, str]) -> Mapping[str, str]:
+    """Precompile texts with positional placeholders into %-style templates"""
+    templates = {}
+    for key, text in texts.items():
+        try:
+            template = _compile_template(text)
+        except ValueError:
+            template = None
+        if template is not None:
+            templates[key] = template
+    return MappingProxyType(templates)
+
+
+@lru_cache(maxsize=None)
+def get_templates(language: str) -> Mapping[str, str]:
+    """Get the precompiled template table for a language, built on first use"""
+    return _compile_templates(get_texts(language))
+
+
+@lru_cache(maxsize=None)
+def get_values(language: str) -> Tuple[str, ...]:
+    """Get the text values of a language ordered by TextId, built on first use"""
+    texts = get_texts(language)
+    en_texts = get_texts("en")
+    return tuple(texts.get(name, en_texts[name]) for name in (text_id.name.lower() for text_id in TextId))
 
 
 class LanguageConfig:
-    """Multi-language configuration for the stock recommendation system"""
+    """Multi-language configuration for the stock recommendation system
+    
+    Instances are shared per language: LanguageConfig("en") always returns
+    the same object, which references the module-level TEXTS tables.
+    """
+    
+    _INSTANCES: Dict[str, "LanguageConfig"] = {}
+    
+    def __new__(cls, language: str = "en"):
+        key = language.lower()
+        instance = cls._INSTANCES.get(key)
+        if instance is None:
+            instance = cls._INSTANCES.setdefault(key, super().__new__(cls))
+        return instance
     
     def __init__(self, language: str = "en"):
+        if getattr(self, "_initialized", False):
+            return
+        
         self.language = language.lower()
         self.texts = self._load_texts()
+        self.templates = get_templates(self.language)
+        self.values = get_values(self.language)
+        self._initialized = True
     
-    def _load_texts(self) -> Dict:
+    def __reduce__(self):
+        # The text tables are read-only views, so copies and pickles resolve back to the shared instance
+        return (LanguageConfig, (self.language,))
+    
+    def _load_texts(self) -> Mapping[str, str]:
         """Load text translations from resource files"""
-        return ZH_TEXTS if self.language == "zh" else EN_TEXTS
+        return get_texts(self.language)
     
     def get(self, key: str) -> str:
         """Get translated text by key"""
         return self.texts.get(key, key)
+    
+    def text(self, text_id: TextId) -> str:
+        """Get translated text by its integer id"""
+        return self.values[text_id]
+    
+    def t(self, key: str, *args) -> str:
+        """Get translated text by key, formatted with args"""
+        if not args:
+            return self.get(key)
+        
+        template = self.templates.get(key)
+        if template is not None:
+            return template % args
+        return self.get(key).format(*args)
 
 
-def get_language_config(language: str = "en") -> Dict[str, str]:
+def get_language_config(language: str = "en") -> Mapping[str, str]:
     """
     Get language configuration dictionary for the specified language.
     
@@ -30,7 +117,7 @@ def get_language_config(language: str = "en") -> Dict[str, str]:
         language: Language code ('en' or 'zh')
         
     Returns:
-        Dictionary with localized strings
+        Read-only mapping with localized strings
     """
     config = LanguageConfig(language)
     return config.texts
@@ -1,6 +1,8 @@
 """
 English language resources for US Stock Recommendation System
 """
+import sys
+from types import MappingProxyType
 
 # General UI text
 TEXTS = {
@@ -206,3 +208,6 @@ TEXTS = {
     "concurrent_manager_context_required": "ConcurrentManager must be used within a 'with' statement",
     "task_execution_exception": "Task execution exception: {}"
 }
+
+# Freeze as a read-only mapping with interned keys and values
+TEXTS = MappingProxyType({sys.intern(key): sys.intern(value) for key, value in TEXTS.items()})
@@ -0,0 +1,14 @@
+"""
+Dense integer ids for the language text keys
+
+Every key of the text tables gets a stable id 0..N-1 in table order, so
+callers that know the key statically can index a per-language value tuple
+instead of hashing the key string.
+"""
+from enum import IntEnum
+from .en import TEXTS as EN_TEXTS
+
+TextId = IntEnum("TextId", [(key.upper(), index) for index, key in enumerate(EN_TEXTS)])
+TextId.__doc__ = "Integer id of a text key, e.g. TextId.STRONG_BUY"
+
+__all__ = ['TextId']
@@ -2,6 +2,8 @@
 中文语言资源文件 - 美股推荐系统
 Chinese language resources for US Stock Recommendation System
 """
+import sys
+from types import MappingProxyType
 
 # 中文文本资源
 TEXTS = {
@@ -207,3 +209,6 @@ TEXTS = {
     "concurrent_manager_context_required": "ConcurrentManager必须在with语句中使用",
     "task_execution_exception": "任务执行异常: {}"
 }
+
+# 冻结为只读映射并驻留键和值字符串
+TEXTS = MappingProxyType({sys.intern(key): sys.intern(value) for key, value in TEXTS.items()})
@@ -14,9 +14,14 @@ Key Features:
 
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
-import statistics
+import copy
 import sys
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 # Add project root to path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
@@ -38,18 +43,88 @@ except ImportError as e:
     BatchAnalyzer = None
     get_stock_manager = None
 
+# Numba is optional; the numeric kernels below run as plain NumPy without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# English labels used when the language table lacks a risk level entry
+_RISK_LEVEL_DEFAULTS = {
+    'high_risk': 'High Risk',
+    'medium_risk': 'Medium Risk',
+    'low_risk': 'Low Risk',
+}
+
+
+def _jit(func):
+    """Compile a numeric kernel with Numba when it is installed."""
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def weighted_mean(values: np.ndarray, weights: np.ndarray) -> float:
+    """Weighted mean of values, or 0.0 when the weights sum to zero."""
+    total = weights.sum()
+    if total <= 0:
+        return 0.0
+    return (values * weights).sum() / total
+
+
+@_jit
+def sample_stdev(values: np.ndarray) -> float:
+    """Sample standard deviation (matches statistics.stdev), 0.0 for fewer than two values."""
+    n = values.shape[0]
+    if n < 2:
+        return 0.0
+    mean = values.sum() / n
+    return np.sqrt(((values - mean) ** 2).sum() / (n - 1))
+
+
+@_jit
+def diversification_score(weights: np.ndarray) -> float:
+    """Diversification score (0.0 to 1.0) from holding count and weight spread."""
+    n = weights.shape[0]
+    if n == 0:
+        return 0.0
+    
+    # Base score from number of holdings, max score at 10+ holdings
+    holdings_score = min(n / 10.0, 1.0)
+    
+    # Penalize deviation from equal weights
+    avg_deviation = np.abs(weights - 1.0 / n).mean()
+    distribution_score = max(0.0, 1.0 - (avg_deviation * 2))
+    
+    score = (holdings_score * 0.4) + (distribution_score * 0.6)
+    return min(max(score, 0.0), 1.0)
+
 
 class PortfolioAnalyzer:
     """Analyzes portfolios using integrated stock analysis system."""
     
-    def __init__(self, language: str = 'en'):
+    # Full analysis results shared across analyzer instances, keyed by portfolio content
+    _analysis_results: Dict[Tuple, Tuple[datetime, Dict[str, Any]]] = {}
+    _analysis_results_size = 128
+    _analysis_uses: Dict[Tuple, int] = {}
+    _analysis_results_lock = threading.Lock()
+    
+    # Per-symbol cache hit/miss counts and analysis time, shared across analyzer instances
+    _stats: Dict[str, Dict[str, float]] = {}
+    _stats_lock = threading.Lock()
+    
+    def __init__(self, language: str = 'en', max_workers: int = 8):
         """
         Initialize portfolio analyzer.
         
         Args:
             language: Language for analysis results ('en' or 'zh')
+            max_workers: Maximum number of holdings analyzed concurrently
         """
         self.language = language
+        self.max_workers = max_workers
         
         # Initialize existing analysis components if available
         try:
@@ -59,16 +134,10 @@ class PortfolioAnalyzer:
                 self.stock_analyzer_class = None
                 
             if RecommendationEngine:
-                # Get language configuration first
-                try:
-                    lang_config = get_language_config(language)
-                except:
-                    lang_config = self._get_fallback_language_config()
-                
                 # Create recommendation engine with proper parameters
                 self.recommendation_engine = RecommendationEngine(
                     analyzer=None,  # Will be set per stock
-                    lang_config=lang_config
+                    lang_config=language
                 )
             else:
                 self.recommendation_engine = None
@@ -93,6 +162,28 @@ class PortfolioAnalyzer:
             print(f"Warning: Failed to initialize analysis components: {e}")
             self._initialize_fallback_analyzers()
     
+    def set_language(self, language: str):
+        """
+        Switch the analysis language in place.
+        
+        Keeps the recommendation engine, its strategy objects and the shared
+        analysis caches, which are keyed by language, instead of rebuilding them.
+        
+        Args:
+            language: Language for analysis results ('en' or 'zh')
+        """
+        if language == self.language:
+            return
+        
+        self.language = language
+        if self.recommendation_engine:
+            self.recommendation_engine.set_language(language)
+        
+        try:
+            self.lang_config = get_language_config(language)
+        except Exception:
+            self.lang_config = self._get_fallback_language_config()
+    
     def _initialize_fallback_analyzers(self):
         """Initialize fallback analyzers when main components unavailable."""
         self.stock_analyzer_class = None
@@ -101,9 +192,9 @@ class PortfolioAnalyzer:
         self.stock_manager = None
         self.lang_config = self._get_fallback_language_config()
     
-    def _get_fallback_language_config(self) -> Dict[str, str]:
+    def _get_fallback_language_config(self, language: Optional[str] = None) -> Dict[str, str]:
         """Get fallback language configuration."""
-        if self.language == 'zh':
+        if (language or self.language) == 'zh':
             return {
                 'buy': '买入',
                 'sell': '卖出', 
@@ -136,13 +227,28 @@ class PortfolioAnalyzer:
                 'risk_level': 'Risk Level'
             }
     
-    def analyze_portfolio(self, portfolio: Portfolio, force_refresh: bool = False) -> Dict[str, Any]:
+    def can_analyze(self, portfolio: Portfolio) -> bool:
+        """
+        Cheaply check whether a portfolio has anything to analyze.
+        
+        Args:
+            portfolio: Portfolio to check
+            
+        Returns:
+            True if the portfolio holds positions with a positive total weight
+        """
+        return bool(portfolio.holdings) and portfolio.total_weight > 0
+    
+    def analyze_portfolio(self, portfolio: Portfolio, force_refresh: bool = False,
+                          stock_analyzers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Perform comprehensive portfolio analysis.
         
         Args:
             portfolio: Portfolio to analyze
             force_refresh: Whether to ignore cached results
+            stock_analyzers: Stock analyzers with prefetched price history, keyed
+                by upper-cased symbol; downloaded in one batch when omitted
             
         Returns:
             Dict containing comprehensive analysis results
@@ -152,18 +258,28 @@ class PortfolioAnalyzer:
             InsufficientDataError: If insufficient data for analysis
         """
         try:
+            cache_key = self._get_analysis_key(portfolio)
+            
             # Check if we can use cached results
-            if not force_refresh and portfolio.analysis_cache.is_valid(max_age_minutes=30):
-                return self._get_cached_analysis(portfolio)
+            if not force_refresh:
+                cached = self._get_fresh_result(cache_key, record_use=True)
+                if cached is not None:
+                    self._record_hits(portfolio)
+                    return copy.deepcopy(cached)
+                
+                if portfolio.analysis_cache.is_valid(max_age_minutes=30):
+                    self._record_hits(portfolio)
+                    return self._get_cached_analysis(portfolio)
             
             if not portfolio.holdings:
                 raise InsufficientDataError("portfolio holdings", 1)
             
             # Analyze individual stocks
-            individual_analysis = self._analyze_individual_stocks(portfolio, force_refresh)
+            individual_analysis = self._analyze_individual_stocks(portfolio, force_refresh, stock_analyzers)
+            weights = portfolio.weights
             
             # Calculate portfolio-level metrics
-            portfolio_metrics = self._calculate_portfolio_metrics(portfolio, individual_analysis)
+            portfolio_metrics = self._calculate_portfolio_metrics(portfolio, individual_analysis, weights)
             
             # Generate overall recommendation
             overall_recommendation = self._generate_overall_recommendation(
@@ -171,10 +287,10 @@ class PortfolioAnalyzer:
             )
             
             # Assess portfolio risk
-            risk_assessment = self._assess_portfolio_risk(portfolio, individual_analysis)
+            risk_assessment = self._assess_portfolio_risk(portfolio, individual_analysis, weights)
             
             # Generate rebalancing suggestions
-            rebalance_suggestions = self._generate_rebalance_suggestions(portfolio)
+            rebalance_suggestions = self._generate_rebalance_suggestions(portfolio, weights)
             
             # Compile comprehensive results
             analysis_results = {
@@ -196,13 +312,15 @@ class PortfolioAnalyzer:
             
             # Cache the results
             self._update_analysis_cache(portfolio, analysis_results)
+            self._store_analysis_result(cache_key, analysis_results)
             
             return analysis_results
             
         except Exception as e:
             raise AnalysisError("portfolio analysis", str(e))
     
-    def _analyze_individual_stocks(self, portfolio: Portfolio, force_refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+    def _analyze_individual_stocks(self, portfolio: Portfolio, force_refresh: bool = False,
+                                   stock_analyzers: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
         """Analyze individual stocks in the portfolio."""
         individual_analysis = {}
         
@@ -226,25 +344,57 @@ class PortfolioAnalyzer:
             except Exception as e:
                 print(f"Warning: Batch analysis failed: {e}")
                 # Fallback to individual analysis or mock data
-                for holding in portfolio.holdings:
-                    individual_analysis[holding.symbol] = self._create_fallback_analysis(holding, force_refresh)
+                individual_analysis = self._analyze_holdings_concurrently(portfolio.holdings, force_refresh, stock_analyzers)
         else:
             # Analyze stocks individually or use fallback
-            for holding in portfolio.holdings:
-                if self.stock_analyzer_class:
-                    try:
-                        # This would call the actual stock analyzer
-                        # analysis_result = self.stock_analyzer.analyze_stock(holding.symbol)
-                        # For now, create fallback analysis
-                        individual_analysis[holding.symbol] = self._create_fallback_analysis(holding, force_refresh)
-                    except Exception as e:
-                        print(f"Warning: Failed to analyze {holding.symbol}: {e}")
-                        individual_analysis[holding.symbol] = self._create_fallback_analysis(holding, force_refresh)
-                else:
-                    individual_analysis[holding.symbol] = self._create_fallback_analysis(holding, force_refresh)
+            individual_analysis = self._analyze_holdings_concurrently(portfolio.holdings, force_refresh, stock_analyzers)
         
         return individual_analysis
     
+    def _analyze_holdings_concurrently(self, holdings: List[Holding], force_refresh: bool = False,
+                                       stock_analyzers: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze holdings on a thread pool, one task per holding.
+        
+        Stock information and price history are fetched in one batch each up
+        front, so worker threads neither write the shared stock info cache nor
+        issue their own history requests.
+        
+        Args:
+            holdings: Holdings to analyze
+            force_refresh: Whether to ignore cached stock information
+            stock_analyzers: Prefetched stock analyzers keyed by upper-cased symbol
+            
+        Returns:
+            Dict mapping each symbol to its analysis, in holdings order
+        """
+        stock_infos = {}
+        if self.stock_manager:
+            try:
+                stock_infos = self.stock_manager.get_stock_info_batch(
+                    [holding.symbol for holding in holdings], force_refresh=force_refresh
+                )
+            except Exception as e:
+                print(f"Warning: Could not get stock info: {e}")
+        
+        if stock_analyzers is None:
+            stock_analyzers = self._bulk_fetch_history(holding.symbol for holding in holdings)
+        
+        def analyze(holding: Holding) -> Dict[str, Any]:
+            start = time.perf_counter()
+            try:
+                return self._create_fallback_analysis(
+                    holding, force_refresh, stock_infos=stock_infos,
+                    stock_analyzer=stock_analyzers.get(holding.symbol.upper().strip())
+                )
+            finally:
+                self._record_miss(holding.symbol, (time.perf_counter() - start) * 1000)
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(holdings)))) as executor:
+            results = list(executor.map(analyze, holdings))
+        
+        return {holding.symbol: result for holding, result in zip(holdings, results)}
+    
     def _format_stock_analysis(self, symbol: str, analysis_result: Dict[str, Any], 
                              holding: Holding) -> Dict[str, Any]:
         """Format stock analysis result for portfolio context."""
@@ -261,17 +411,42 @@ class PortfolioAnalyzer:
             'notes': holding.notes
         }
     
-    def _create_fallback_analysis(self, holding: Holding, force_refresh: bool = False) -> Dict[str, Any]:
+    def _bulk_fetch_history(self, symbols) -> Dict[str, Any]:
+        """
+        Download price history for several symbols in one request.
+        
+        Args:
+            symbols: Stock symbols to fetch
+            
+        Returns:
+            Stock analyzers keyed by upper-cased symbol, or an empty dict when
+            the batch download is unavailable or fails
+        """
+        symbols = list(dict.fromkeys(symbol.upper().strip() for symbol in symbols))
+        if not symbols or not hasattr(self.stock_analyzer_class, 'bulk_fetch'):
+            return {}
+        try:
+            return self.stock_analyzer_class.bulk_fetch(symbols)
+        except Exception as e:
+            print(f"Warning: Batch history download failed: {e}")
+            return {}
+    
+    def _create_fallback_analysis(self, holding: Holding, force_refresh: bool = False,
+                                  stock_infos: Optional[Dict[str, Dict]] = None,
+                                  stock_analyzer: Optional[Any] = None) -> Dict[str, Any]:
         """Create fallback analysis when real analysis unavailable."""
         symbol = holding.symbol
         
-        # Try to get basic stock information from stock manager
+        # Try to get basic stock information, preferring a prefetched batch
         stock_info = None
-        try:
-            if self.stock_manager:
-                stock_info = self.stock_manager.get_stock_info(symbol, force_refresh=force_refresh)
-        except Exception as e:
-            print(f"Warning: Could not get stock info for {symbol}: {e}")
+        if stock_infos is not None:
+            stock_info = stock_infos.get(symbol.upper().strip())
+        else:
+            try:
+                if self.stock_manager:
+                    stock_info = self.stock_manager.get_stock_info(symbol, force_refresh=force_refresh)
+            except Exception as e:
+                print(f"Warning: Could not get stock info for {symbol}: {e}")
         
         # Mock recommendation based on symbol patterns
         if any(tech in symbol for tech in ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']):
@@ -318,7 +493,7 @@ class PortfolioAnalyzer:
             })
             
             # Try to get market analysis data
-            market_analysis = self._get_market_analysis(symbol, stock_info)
+            market_analysis = self._get_market_analysis(symbol, stock_info, stock_analyzer)
             result.update(market_analysis)
         else:
             # Default values when no stock info available
@@ -344,13 +519,15 @@ class PortfolioAnalyzer:
         
         return result
     
-    def _get_market_analysis(self, symbol: str, stock_info: Dict) -> Dict[str, Any]:
-        """Get market analysis data for a stock."""
+    def _get_market_analysis(self, symbol: str, stock_info: Dict,
+                             analyzer: Optional[Any] = None) -> Dict[str, Any]:
+        """Get market analysis data for a stock, reusing prefetched history when given."""
         try:
             # Try to create stock analyzer and get metrics
             if self.stock_analyzer_class:
-                analyzer = self.stock_analyzer_class(symbol)
-                analyzer.fetch_data()
+                if analyzer is None or analyzer.data is None:
+                    analyzer = self.stock_analyzer_class(symbol)
+                    analyzer.fetch_data()
                 metrics = analyzer.get_current_metrics()
                 
                 # Create recommendation engine for analysis
@@ -464,40 +641,38 @@ class PortfolioAnalyzer:
             pass
         return "Normal"
     
+    def _get_analysis_array(self, portfolio: Portfolio, individual_analysis: Dict[str, Dict[str, Any]],
+                            key: str, default: float) -> np.ndarray:
+        """Get one numeric field of the individual analyses as an array in holdings order."""
+        return np.asarray(
+            [individual_analysis.get(h.symbol, {}).get(key, default) for h in portfolio.holdings],
+            dtype=np.float64
+        )
+    
     def _calculate_portfolio_metrics(self, portfolio: Portfolio, 
-                                   individual_analysis: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+                                   individual_analysis: Dict[str, Dict[str, Any]],
+                                   weights: np.ndarray) -> Dict[str, Any]:
         """Calculate portfolio-level metrics."""
-        total_weight = sum(holding.weight for holding in portfolio.holdings)
+        total_weight = float(weights.sum())
         
         if total_weight == 0:
             return {'error': 'No holdings with positive weights'}
         
         # Calculate weighted averages
-        weighted_expected_return = 0.0
-        weighted_risk_score = 0.0
-        weighted_confidence = 0.0
-        
-        for holding in portfolio.holdings:
-            analysis = individual_analysis.get(holding.symbol, {})
-            weight_ratio = holding.weight / total_weight
-            
-            weighted_expected_return += analysis.get('expected_return', 0.0) * weight_ratio
-            weighted_risk_score += analysis.get('risk_score', 0.5) * weight_ratio
-            weighted_confidence += analysis.get('confidence', 0.5) * weight_ratio
-        
-        # Calculate diversification metrics
-        diversification_score = self._calculate_diversification_score(portfolio)
+        expected_returns = self._get_analysis_array(portfolio, individual_analysis, 'expected_return', 0.0)
+        risk_scores = self._get_analysis_array(portfolio, individual_analysis, 'risk_score', 0.5)
+        confidences = self._get_analysis_array(portfolio, individual_analysis, 'confidence', 0.5)
         
         return {
-            'expected_return': weighted_expected_return,
-            'risk_score': weighted_risk_score,
-            'confidence': weighted_confidence,
-            'diversification_score': diversification_score,
+            'expected_return': float(weighted_mean(expected_returns, weights)),
+            'risk_score': float(weighted_mean(risk_scores, weights)),
+            'confidence': float(weighted_mean(confidences, weights)),
+            'diversification_score': float(diversification_score(weights)),
             'holdings_count': len(portfolio.holdings),
             'total_weight': total_weight,
-            'largest_position': max(h.weight for h in portfolio.holdings) if portfolio.holdings else 0.0,
-            'smallest_position': min(h.weight for h in portfolio.holdings) if portfolio.holdings else 0.0,
-            'weight_balance': statistics.stdev([h.weight for h in portfolio.holdings]) if len(portfolio.holdings) > 1 else 0.0
+            'largest_position': float(weights.max()) if weights.size else 0.0,
+            'smallest_position': float(weights.min()) if weights.size else 0.0,
+            'weight_balance': float(sample_stdev(weights))
         }
     
     def _generate_overall_recommendation(self, portfolio: Portfolio, 
@@ -579,40 +754,33 @@ class PortfolioAnalyzer:
             return f"Weak {recommendation.title()}"
     
     def _assess_portfolio_risk(self, portfolio: Portfolio, 
-                             individual_analysis: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+                             individual_analysis: Dict[str, Dict[str, Any]],
+                             weights: np.ndarray) -> Dict[str, Any]:
         """Assess overall portfolio risk."""
         if not individual_analysis:
-            return {'risk_level': 'Unknown', 'risk_score': 0.5}
+            return {'risk_level': 'Unknown', 'risk_level_key': None, 'risk_score': 0.5}
         
         # Calculate weighted risk metrics
-        total_weight = sum(holding.weight for holding in portfolio.holdings)
-        weighted_risk = 0.0
-        risk_scores = []
-        
-        for holding in portfolio.holdings:
-            analysis = individual_analysis.get(holding.symbol, {})
-            risk_score = analysis.get('risk_score', 0.5)
-            weight_ratio = holding.weight / total_weight if total_weight > 0 else 0
-            
-            weighted_risk += risk_score * weight_ratio
-            risk_scores.append(risk_score)
+        risk_scores = self._get_analysis_array(portfolio, individual_analysis, 'risk_score', 0.5)
+        weighted_risk = float(weighted_mean(risk_scores, weights))
         
         # Calculate risk concentration
-        concentration_risk = max(holding.weight for holding in portfolio.holdings) if portfolio.holdings else 0
+        concentration_risk = float(weights.max()) if weights.size else 0
         
         # Calculate risk distribution
-        risk_std = statistics.stdev(risk_scores) if len(risk_scores) > 1 else 0.0
+        risk_std = float(sample_stdev(risk_scores))
         
         # Determine risk level
         if weighted_risk > 0.7 or concentration_risk > 0.5:
-            risk_level = self.lang_config.get('high_risk', 'High Risk')
+            risk_level_key = 'high_risk'
         elif weighted_risk > 0.4 or concentration_risk > 0.3:
-            risk_level = self.lang_config.get('medium_risk', 'Medium Risk')
+            risk_level_key = 'medium_risk'
         else:
-            risk_level = self.lang_config.get('low_risk', 'Low Risk')
+            risk_level_key = 'low_risk'
         
         return {
-            'risk_level': risk_level,
+            'risk_level': self.lang_config.get(risk_level_key, _RISK_LEVEL_DEFAULTS[risk_level_key]),
+            'risk_level_key': risk_level_key,
             'risk_score': weighted_risk,
             'concentration_risk': concentration_risk,
             'risk_distribution': risk_std,
@@ -650,30 +818,29 @@ class PortfolioAnalyzer:
         
         return risk_factors
     
-    def _generate_rebalance_suggestions(self, portfolio: Portfolio) -> List[Dict[str, Any]]:
+    def _generate_rebalance_suggestions(self, portfolio: Portfolio,
+                                        weights: np.ndarray) -> List[Dict[str, Any]]:
         """Generate portfolio rebalancing suggestions."""
         suggestions = []
         
-        # Check for holdings that deviate from target weights
-        for holding in portfolio.holdings:
-            if holding.target_weight is not None:
-                deviation = holding.get_weight_deviation()
-                if deviation and abs(deviation) > 0.05:  # 5% threshold
-                    action = "reduce" if deviation > 0 else "increase"
-                    suggestions.append({
-                        'symbol': holding.symbol,
-                        'action': action,
-                        'current_weight': holding.weight,
-                        'target_weight': holding.target_weight,
-                        'deviation': deviation,
-                        'suggested_change': abs(deviation),
-                        'priority': 'high' if abs(deviation) > 0.1 else 'medium'
-                    })
+        # Check for holdings that deviate from target weights (5% threshold)
+        for index in np.flatnonzero(portfolio.get_rebalancing_mask(0.05)):
+            holding = portfolio.holdings[index]
+            deviation = holding.get_weight_deviation()
+            action = "reduce" if deviation > 0 else "increase"
+            suggestions.append({
+                'symbol': holding.symbol,
+                'action': action,
+                'current_weight': holding.weight,
+                'target_weight': holding.target_weight,
+                'deviation': deviation,
+                'suggested_change': abs(deviation),
+                'priority': 'high' if abs(deviation) > 0.1 else 'medium'
+            })
         
         # Check overall portfolio balance
         if len(portfolio.holdings) > 0:
-            weights = [h.weight for h in portfolio.holdings]
-            weight_std = statistics.stdev(weights) if len(weights) > 1 else 0.0
+            weight_std = float(sample_stdev(weights))
             
             if weight_std > 0.15:  # High weight imbalance
                 suggestions.append({
@@ -688,30 +855,7 @@ class PortfolioAnalyzer:
     
     def _calculate_diversification_score(self, portfolio: Portfolio) -> float:
         """Calculate portfolio diversification score (0.0 to 1.0)."""
-        if not portfolio.holdings:
-            return 0.0
-        
-        # Simple diversification based on number of holdings and weight distribution
-        num_holdings = len(portfolio.holdings)
-        
-        # Base score from number of holdings
-        holdings_score = min(num_holdings / 10.0, 1.0)  # Max score at 10+ holdings
-        
-        # Weight distribution score (penalize concentration)
-        weights = [h.weight for h in portfolio.holdings]
-        max_weight = max(weights)
-        
-        # Perfect diversification would have equal weights
-        ideal_weight = 1.0 / num_holdings
-        weight_deviations = [abs(w - ideal_weight) for w in weights]
-        avg_deviation = sum(weight_deviations) / len(weight_deviations)
-        
-        distribution_score = max(0.0, 1.0 - (avg_deviation * 2))  # Scale deviation penalty
-        
-        # Combined score
-        diversification_score = (holdings_score * 0.4) + (distribution_score * 0.6)
-        
-        return min(max(diversification_score, 0.0), 1.0)
+        return float(diversification_score(portfolio.weights))
     
     def _analyze_diversification(self, portfolio: Portfolio) -> Dict[str, Any]:
         """Analyze portfolio diversification."""
@@ -798,6 +942,103 @@ class PortfolioAnalyzer:
         
         portfolio.last_analysis_time = datetime.now()
     
+    def _get_analysis_key(self, portfolio: Portfolio) -> Tuple:
+        """Build the memoization key for a portfolio's analysis."""
+        holdings_key = tuple(sorted(
+            (holding.symbol, holding.weight, holding.target_weight)
+            for holding in portfolio.holdings
+        ))
+        return (portfolio.name, portfolio.version, portfolio.strategy_type.value,
+                portfolio.cash_weight, holdings_key, self.language)
+    
+    def _get_fresh_result(self, cache_key: Tuple, record_use: bool = False) -> Optional[Dict[str, Any]]:
+        """Get a memoized analysis result younger than 30 minutes, or None."""
+        with self._analysis_results_lock:
+            cached = self._analysis_results.get(cache_key)
+            if cached is None or datetime.now() - cached[0] >= timedelta(minutes=30):
+                return None
+            if record_use:
+                # Counted under the lock so an entry evicted meanwhile never regains a counter
+                self._analysis_uses[cache_key] = self._analysis_uses.get(cache_key, 0) + 1
+            return cached[1]
+    
+    def _has_fresh_result(self, cache_key: Tuple) -> bool:
+        """Check whether a memoized analysis result younger than 30 minutes exists."""
+        return self._get_fresh_result(cache_key) is not None
+    
+    def _store_analysis_result(self, cache_key: Tuple, analysis_results: Dict[str, Any]):
+        """Store a full analysis result, evicting the least frequently used entry when full."""
+        results = self._analysis_results
+        uses = self._analysis_uses
+        entry = (datetime.now(), copy.deepcopy(analysis_results))
+        with self._analysis_results_lock:
+            results.pop(cache_key, None)
+            if len(results) >= self._analysis_results_size:
+                # Ties go to the oldest entry, since dicts iterate in insertion order
+                coldest = min(results, key=lambda key: uses.get(key, 0))
+                results.pop(coldest)
+                uses.pop(coldest, None)
+            results[cache_key] = entry
+            uses[cache_key] = 0
+    
+    @classmethod
+    def clear_analysis_results(cls):
+        """Clear memoized analysis results for all portfolios."""
+        with cls._analysis_results_lock:
+            cls._analysis_results.clear()
+            cls._analysis_uses.clear()
+    
+    @classmethod
+    def evict_symbols(cls, symbols: List[str]) -> int:
+        """
+        Evict memoized analyses of portfolios holding any of the given symbols.
+        
+        Args:
+            symbols: Stock symbols whose analyses should be recomputed
+            
+        Returns:
+            Number of evicted analysis results
+        """
+        symbols = set(symbols)
+        with cls._analysis_results_lock:
+            # The holdings part of the key is a tuple of (symbol, weight, target_weight)
+            stale = [key for key in cls._analysis_results
+                     if any(holding[0] in symbols for holding in key[4])]
+            for key in stale:
+                cls._analysis_results.pop(key, None)
+                cls._analysis_uses.pop(key, None)
+        return len(stale)
+    
+    def _record_hits(self, portfolio: Portfolio):
+        """Count a cache hit for every symbol of a portfolio served from cache."""
+        with self._stats_lock:
+            for holding in portfolio.holdings:
+                self._stats.setdefault(holding.symbol, {'hits': 0, 'misses': 0, 'time': 0.0})['hits'] += 1
+    
+    def _record_miss(self, symbol: str, elapsed_ms: float):
+        """Count a cache miss for a symbol along with the time spent analyzing it."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(symbol, {'hits': 0, 'misses': 0, 'time': 0.0})
+            stats['misses'] += 1
+            stats['time'] += elapsed_ms
+    
+    @classmethod
+    def get_stats(cls) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-symbol cache statistics.
+        
+        Returns:
+            Dict mapping each symbol to its hits, misses and total analysis time in milliseconds
+        """
+        with cls._stats_lock:
+            return {symbol: dict(stats) for symbol, stats in cls._stats.items()}
+    
+    @classmethod
+    def reset_stats(cls):
+        """Reset per-symbol cache statistics."""
+        with cls._stats_lock:
+            cls._stats.clear()
+    
     def _get_cached_analysis(self, portfolio: Portfolio) -> Dict[str, Any]:
         """Get cached analysis results."""
         cache = portfolio.analysis_cache
@@ -830,10 +1071,58 @@ class PortfolioAnalyzer:
             'language': self.language
         }
     
+    def render(self, analysis: Dict[str, Any], language: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Translate the language-dependent labels of an analysis result.
+        
+        The numeric analysis is language independent, so a result produced
+        once can be rendered for any number of languages without re-running it.
+        
+        Args:
+            analysis: Result returned by analyze_portfolio
+            language: Target language ('en' or 'zh'), defaults to the analyzer's language
+            
+        Returns:
+            Copy of the analysis with risk level and recommendation labels translated
+        """
+        language = language or self.language
+        try:
+            texts = get_language_config(language)
+        except Exception:
+            texts = self._get_fallback_language_config(language)
+        
+        rendered = copy.deepcopy(analysis)
+        
+        risk = rendered.get('risk_assessment', {})
+        risk_level_key = risk.get('risk_level_key')
+        if risk_level_key:
+            risk['risk_level'] = texts.get(risk_level_key, _RISK_LEVEL_DEFAULTS[risk_level_key])
+        
+        overall = rendered.get('overall_recommendation', {})
+        recommendation = overall.get('recommendation')
+        if recommendation:
+            overall['recommendation_label'] = texts.get(recommendation.lower(), recommendation)
+        
+        rendered['language'] = language
+        return rendered
+    
     def compare_portfolios(self, portfolio1: Portfolio, portfolio2: Portfolio) -> Dict[str, Any]:
         """Compare two portfolios across multiple dimensions."""
-        analysis1 = self.analyze_portfolio(portfolio1)
-        analysis2 = self.analyze_portfolio(portfolio2)
+        # Download history for both portfolios' uncached holdings in one request
+        symbols = [
+            holding.symbol
+            for portfolio in (portfolio1, portfolio2)
+            if not self._has_fresh_result(self._get_analysis_key(portfolio))
+            for holding in portfolio.holdings
+        ]
+        stock_analyzers = self._bulk_fetch_history(symbols)
+        
+        # The two analyses are independent, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future1 = executor.submit(self.analyze_portfolio, portfolio1, stock_analyzers=stock_analyzers)
+            future2 = executor.submit(self.analyze_portfolio, portfolio2, stock_analyzers=stock_analyzers)
+            analysis1 = future1.result()
+            analysis2 = future2.result()
         
         return {
             'portfolio1': {
@@ -146,9 +146,16 @@ class FileManager:
                 'file_format': 'json'
             }
             
-            # Write to file
-            with open(target_file, 'w', encoding='utf-8') as f:
-                json.dump(portfolio_data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and swap it in so readers never see a partial file
+            temp_file = target_file.with_name(target_file.name + '.tmp')
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(portfolio_data, f, indent=2, ensure_ascii=False)
+                os.replace(temp_file, target_file)
+            except Exception:
+                # Don't leave a half-written temp file next to the portfolio
+                temp_file.unlink(missing_ok=True)
+                raise
             
             return str(target_file)
             
@@ -12,6 +12,9 @@ Key Features:
 - Error handling and validation
 """
 
+import threading
+from contextlib import contextmanager
+from functools import wraps
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 
@@ -25,6 +28,15 @@ from .exceptions import (
 )
 
 
+def _synchronized(method):
+    """Run a PortfolioManager method while holding the manager's lock."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class PortfolioManager:
     """Manages portfolio CRUD operations and in-memory storage."""
     
@@ -38,6 +50,15 @@ class PortfolioManager:
         self.file_manager = file_manager or FileManager()
         self.portfolios: Dict[str, Portfolio] = {}
         
+        # Name-sorted portfolio list, rebuilt after portfolios are added or removed
+        self._sorted_portfolios: Optional[List[Portfolio]] = None
+        
+        # Names of portfolios awaiting a save while inside batched_saves()
+        self._pending_saves: Optional[Dict[str, None]] = None
+        
+        # One manager serves every app session; mutations and save batches run under this lock
+        self._lock = threading.RLock()
+        
         # Load existing portfolios from disk
         self._load_existing_portfolios()
     
@@ -57,6 +78,66 @@ class PortfolioManager:
         except Exception as e:
             print(f"Warning: Failed to load existing portfolios: {e}")
     
+    @_synchronized
+    def _save_portfolio(self, portfolio: Portfolio):
+        """Persist a portfolio now, or defer it when inside batched_saves()."""
+        if self._pending_saves is not None:
+            self._pending_saves[portfolio.name] = None
+        else:
+            self.file_manager.save_portfolio(portfolio)
+    
+    @contextmanager
+    def batched_saves(self):
+        """
+        Defer portfolio writes until the block exits.
+        
+        Every portfolio modified inside the block is written once on exit,
+        instead of once per operation. The manager lock is held for the whole
+        block, so other threads' changes never join this batch. If the block
+        raises, nothing is written and the original error propagates.
+        
+        Yields:
+            PortfolioManager: This manager instance
+        """
+        with self._lock:
+            if self._pending_saves is not None:
+                # Nested block: the outermost one flushes
+                yield self
+                return
+            
+            self._pending_saves = {}
+            try:
+                yield self
+                # Skip portfolios deleted while their save was pending
+                pending = [name for name in self._pending_saves if name in self.portfolios]
+            finally:
+                self._pending_saves = None
+            
+            # Only a completed batch is flushed, so a failed one never lands on disk half-applied
+            self.save_portfolios(pending)
+    
+    @_synchronized
+    def save_portfolios(self, names: Optional[List[str]] = None) -> List[str]:
+        """
+        Save several portfolios to disk in one pass.
+        
+        Args:
+            names: Portfolio names to save (defaults to all portfolios)
+            
+        Returns:
+            List[str]: Paths of the saved files
+            
+        Raises:
+            PortfolioNotFoundError: If a named portfolio does not exist
+            FileOperationError: If a save operation fails
+        """
+        if names is None:
+            names = list(self.portfolios)
+        
+        portfolios = [self.get_portfolio(name) for name in dict.fromkeys(names)]
+        return [self.file_manager.save_portfolio(portfolio) for portfolio in portfolios]
+    
+    @_synchronized
     def create_portfolio(self, name: str, description: str = "", 
                         strategy_type: StrategyType = StrategyType.BALANCED) -> Portfolio:
         """
@@ -95,7 +176,8 @@ class PortfolioManager:
         
         # Save to memory and disk
         self.portfolios[name] = portfolio
-        self.file_manager.save_portfolio(portfolio)
+        self._sorted_portfolios = None
+        self._save_portfolio(portfolio)
         
         return portfolio
     
@@ -123,6 +205,7 @@ class PortfolioManager:
         
         raise PortfolioNotFoundError(name_or_id)
     
+    @_synchronized
     def list_portfolios(self) -> List[Portfolio]:
         """
         Get list of all portfolios.
@@ -130,8 +213,13 @@ class PortfolioManager:
         Returns:
             List[Portfolio]: All portfolios sorted by name
         """
-        return sorted(self.portfolios.values(), key=lambda p: p.name.lower())
+        sorted_portfolios = self._sorted_portfolios
+        if sorted_portfolios is None or len(sorted_portfolios) != len(self.portfolios):
+            sorted_portfolios = sorted(self.portfolios.values(), key=lambda p: p.name.lower())
+            self._sorted_portfolios = sorted_portfolios
+        return list(sorted_portfolios)
     
+    @_synchronized
     def update_portfolio(self, name: str, description: str = None, 
                         strategy_type: StrategyType = None) -> Portfolio:
         """
@@ -162,10 +250,11 @@ class PortfolioManager:
         portfolio.analysis_cache.clear()
         
         # Save changes
-        self.file_manager.save_portfolio(portfolio)
+        self._save_portfolio(portfolio)
         
         return portfolio
     
+    @_synchronized
     def delete_portfolio(self, name_or_id: str) -> bool:
         """
         Delete a portfolio.
@@ -181,6 +270,7 @@ class PortfolioManager:
             
             # Remove from memory
             del self.portfolios[portfolio.name]
+            self._sorted_portfolios = None
             
             # Delete file
             self.file_manager.delete_portfolio_file(portfolio.name)
@@ -190,6 +280,7 @@ class PortfolioManager:
         except PortfolioNotFoundError:
             return False
     
+    @_synchronized
     def duplicate_portfolio(self, source_name: str, new_name: str, 
                            new_description: str = None) -> Portfolio:
         """
@@ -230,13 +321,16 @@ class PortfolioManager:
                 notes=holding.notes
             )
             new_portfolio.holdings.append(new_holding)
+            new_portfolio.version += 1
         
         # Save new portfolio
         self.portfolios[new_name] = new_portfolio
-        self.file_manager.save_portfolio(new_portfolio)
+        self._sorted_portfolios = None
+        self._save_portfolio(new_portfolio)
         
         return new_portfolio
     
+    @_synchronized
     def add_stock(self, portfolio_name: str, symbol: str, weight: float, 
                   target_weight: Optional[float] = None, notes: str = "") -> Holding:
         """
@@ -260,10 +354,11 @@ class PortfolioManager:
         holding = portfolio.add_holding(symbol, weight, target_weight, notes)
         
         # Save changes
-        self.file_manager.save_portfolio(portfolio)
+        self._save_portfolio(portfolio)
         
         return holding
     
+    @_synchronized
     def remove_stock(self, portfolio_name: str, symbol: str) -> bool:
         """
         Remove a stock from portfolio.
@@ -283,10 +378,11 @@ class PortfolioManager:
         
         if removed:
             # Save changes
-            self.file_manager.save_portfolio(portfolio)
+            self._save_portfolio(portfolio)
         
         return removed
     
+    @_synchronized
     def update_stock_weight(self, portfolio_name: str, symbol: str, 
                            new_weight: float, update_target: bool = False) -> bool:
         """
@@ -313,21 +409,27 @@ class PortfolioManager:
             if holding:
                 holding.target_weight = new_weight
                 holding.last_updated = datetime.now()
+                portfolio.version += 1
         
         if updated:
             # Save changes
-            self.file_manager.save_portfolio(portfolio)
+            self._save_portfolio(portfolio)
         
         return updated
     
+    @_synchronized
     def add_stocks_batch(self, portfolio_name: str, 
-                        stocks_data: List[Tuple[str, float, Optional[float]]]) -> List[Holding]:
+                        stocks_data: List[Tuple]) -> List[Holding]:
         """
         Add multiple stocks to portfolio in batch.
         
+        The batch is all-or-nothing: if any stock fails validation, the
+        holdings already added by this call are removed again.
+        
         Args:
             portfolio_name: Target portfolio name
-            stocks_data: List of (symbol, weight, target_weight) tuples
+            stocks_data: List of (symbol, weight, target_weight) or
+                (symbol, weight, target_weight, notes) tuples
             
         Returns:
             List[Holding]: Created holding instances
@@ -339,15 +441,22 @@ class PortfolioManager:
         portfolio = self.get_portfolio(portfolio_name)
         created_holdings = []
         
-        for symbol, weight, target_weight in stocks_data:
-            holding = portfolio.add_holding(symbol, weight, target_weight)
-            created_holdings.append(holding)
+        try:
+            for symbol, weight, target_weight, *notes in stocks_data:
+                holding = portfolio.add_holding(symbol, weight, target_weight,
+                                                notes[0] if notes else "")
+                created_holdings.append(holding)
+        except Exception:
+            for holding in created_holdings:
+                portfolio.remove_holding(holding.symbol)
+            raise
         
         # Save changes once after all additions
-        self.file_manager.save_portfolio(portfolio)
+        self._save_portfolio(portfolio)
         
         return created_holdings
     
+    @_synchronized
     def update_weights_batch(self, portfolio_name: str, 
                             weight_updates: Dict[str, float]) -> List[str]:
         """
@@ -372,10 +481,11 @@ class PortfolioManager:
         
         # Save changes once after all updates
         if updated_symbols:
-            self.file_manager.save_portfolio(portfolio)
+            self._save_portfolio(portfolio)
         
         return updated_symbols
     
+    @_synchronized
     def rebalance_portfolio(self, portfolio_name: str, method: str = 'target') -> Portfolio:
         """
         Rebalance portfolio weights.
@@ -403,7 +513,7 @@ class PortfolioManager:
             raise ValidationError("method", method, f"Unknown rebalancing method: {method}")
         
         # Save changes
-        self.file_manager.save_portfolio(portfolio)
+        self._save_portfolio(portfolio)
         
         return portfolio
     
@@ -422,6 +532,7 @@ class PortfolioManager:
         portfolio.cash_weight = 0.0
         portfolio.updated_time = datetime.now()
         portfolio.analysis_cache.clear()
+        portfolio.version += 1
     
     def validate_all_portfolios(self) -> Dict[str, List[str]]:
         """
@@ -469,14 +580,16 @@ class PortfolioManager:
         """
         portfolio = self.get_portfolio(portfolio_name)
         
+        rebalancing_mask = portfolio.get_rebalancing_mask()
+        
         holdings_info = []
-        for holding in portfolio.holdings:
+        for holding, needs_rebalancing in zip(portfolio.holdings, rebalancing_mask.tolist()):
             holdings_info.append({
                 'symbol': holding.symbol,
                 'weight': holding.weight,
                 'target_weight': holding.target_weight,
                 'deviation': holding.get_weight_deviation(),
-                'needs_rebalancing': holding.needs_rebalancing(),
+                'needs_rebalancing': needs_rebalancing,
                 'recommendation': holding.recommendation,
                 'confidence': holding.confidence,
                 'notes': holding.notes,
@@ -497,7 +610,7 @@ class PortfolioManager:
             'validation': {
                 'weights_valid': portfolio.validate_weights()[0],
                 'total_weight': portfolio.total_weight,
-                'rebalancing_needed': any(h.needs_rebalancing() for h in portfolio.holdings)
+                'rebalancing_needed': bool(rebalancing_mask.any())
             },
             'analysis_cache': {
                 'has_cached_analysis': portfolio.analysis_cache.is_valid(),
@@ -531,6 +644,7 @@ class PortfolioManager:
         else:
             raise ValidationError("format", format, f"Unsupported export format: {format}")
     
+    @_synchronized
     def import_portfolio_from_file(self, file_path: str) -> Portfolio:
         """
         Import portfolio from file.
@@ -551,5 +665,6 @@ class PortfolioManager:
         
         # Add to memory
         self.portfolios[portfolio.name] = portfolio
+        self._sorted_portfolios = None
         
         return portfolio
\ No newline at end of file
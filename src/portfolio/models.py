@@ -17,6 +17,9 @@ from enum import Enum
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field, asdict
 
+import numpy as np
+import pandas as pd
+
 from .exceptions import ValidationError, InvalidWeightError
 
 
@@ -182,6 +185,16 @@ class Portfolio:
     # Analysis cache
     analysis_cache: AnalysisCache = field(default_factory=AnalysisCache)
     
+    # In-memory mutation counter used to key memoized analysis (not persisted)
+    version: int = field(default=0, repr=False, compare=False)
+    
+    # Struct-of-arrays view of holdings, rebuilt lazily when version changes
+    _arrays_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _symbols: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _weights: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _targets: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _holdings_weight: float = field(default=0.0, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate portfolio data after initialization."""
         if not self.name.strip():
@@ -194,10 +207,74 @@ class Portfolio:
             raise ValidationError("cash_weight", self.cash_weight,
                                 "Cash weight must be between 0.0 and 1.0")
     
+    def _refresh_arrays(self):
+        """Rebuild the holdings arrays if holdings changed since they were built."""
+        if (self._arrays_version == self.version and self._weights is not None
+                and len(self._weights) == len(self.holdings)):
+            return
+        
+        count = len(self.holdings)
+        self._symbols = np.array([h.symbol for h in self.holdings], dtype=object)
+        self._weights = np.fromiter((h.weight for h in self.holdings), dtype=np.float64, count=count)
+        self._targets = np.fromiter(
+            (np.nan if h.target_weight is None else h.target_weight for h in self.holdings),
+            dtype=np.float64, count=count
+        )
+        for array in (self._symbols, self._weights, self._targets):
+            array.flags.writeable = False
+        self._holdings_weight = float(self._weights.sum())
+        self._arrays_version = self.version
+    
+    @property
+    def symbols_array(self) -> np.ndarray:
+        """Read-only array of holding symbols."""
+        self._refresh_arrays()
+        return self._symbols
+    
+    @property
+    def weights(self) -> np.ndarray:
+        """Read-only array of holding weights."""
+        self._refresh_arrays()
+        return self._weights
+    
+    @property
+    def target_weights(self) -> np.ndarray:
+        """Read-only array of holding target weights (NaN where unset)."""
+        self._refresh_arrays()
+        return self._targets
+    
+    def get_weight_deviations(self) -> np.ndarray:
+        """Deviation of each holding from its target weight (NaN where unset)."""
+        self._refresh_arrays()
+        return self._weights - self._targets
+    
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Build a column-oriented frame with one row per holding.
+        
+        Returns:
+            DataFrame with symbol, weight, target (NaN where unset) and deviation columns
+        """
+        return pd.DataFrame({
+            'symbol': self.symbols_array,
+            'weight': self.weights,
+            'target': self.target_weights,
+            'deviation': self.get_weight_deviations()
+        })
+    
+    def get_rebalancing_mask(self, threshold: float = 0.05) -> np.ndarray:
+        """Boolean mask of holdings deviating from their target by more than threshold."""
+        return np.abs(self.get_weight_deviations()) > threshold
+    
+    def needs_rebalancing(self, threshold: float = 0.05) -> bool:
+        """Check if any holding needs rebalancing based on threshold."""
+        return bool(self.get_rebalancing_mask(threshold).any())
+    
     @property
     def total_weight(self) -> float:
-        """Calculate total weight of all holdings."""
-        return sum(holding.weight for holding in self.holdings) + self.cash_weight
+        """Calculate total weight of all holdings, summing them once per version."""
+        self._refresh_arrays()
+        return self._holdings_weight + self.cash_weight
     
     @property
     def stock_symbols(self) -> List[str]:
@@ -228,6 +305,7 @@ class Portfolio:
         self.holdings.append(holding)
         self.updated_time = datetime.now()
         self.analysis_cache.clear()
+        self.version += 1
         
         return holding
     
@@ -240,6 +318,7 @@ class Portfolio:
                 del self.holdings[i]
                 self.updated_time = datetime.now()
                 self.analysis_cache.clear()
+                self.version += 1
                 return True
         
         return False
@@ -267,6 +346,7 @@ class Portfolio:
         holding.last_updated = datetime.now()
         self.updated_time = datetime.now()
         self.analysis_cache.clear()
+        self.version += 1
         
         return True
     
@@ -292,6 +372,7 @@ class Portfolio:
         self.cash_weight = 0.0
         self.updated_time = datetime.now()
         self.analysis_cache.clear()
+        self.version += 1
     
     def rebalance_to_targets(self):
         """Rebalance portfolio to target weights."""
@@ -311,6 +392,7 @@ class Portfolio:
         
         self.updated_time = datetime.now()
         self.analysis_cache.clear()
+        self.version += 1
     
     def get_holdings_summary(self) -> Dict[str, Any]:
         """Get summary information about all holdings."""
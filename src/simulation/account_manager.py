@@ -5,8 +5,10 @@ Simulation Trading System - Account Management Module
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from dataclasses import dataclass, asdict
+from contextlib import contextmanager
 import json
 import os
+import threading
 from .models import SimulationAccount, VirtualTransaction, VirtualPosition
 
 class SimulationAccountManager:
@@ -17,6 +19,10 @@ class SimulationAccountManager:
         self.accounts_file = os.path.join(self.data_dir, "accounts.json")
         self.transactions_file = os.path.join(self.data_dir, "transactions.json")
 
+        # Guards account/transaction updates; saves are deferred inside batched_writes()
+        self._lock = threading.RLock()
+        self._batching = False
+
         os.makedirs(self.data_dir, exist_ok=True)
         self._load_data()
 
@@ -43,6 +49,9 @@ class SimulationAccountManager:
 
     def _save_data(self):
         """Save data"""
+        if self._batching:
+            return
+
         # Save account data
         accounts_data = [asdict(account) for account in self.accounts.values()]
         with open(self.accounts_file, 'w', encoding='utf-8') as f:
@@ -52,6 +61,22 @@ class SimulationAccountManager:
         with open(self.transactions_file, 'w', encoding='utf-8') as f:
             json.dump(self.transactions, f, indent=2, default=str)
 
+    @contextmanager
+    def batched_writes(self):
+        """Hold the account lock for a block of updates and save once on exit"""
+        with self._lock:
+            if self._batching:
+                # Nested block: the outermost one saves
+                yield self
+                return
+
+            self._batching = True
+            try:
+                yield self
+            finally:
+                self._batching = False
+                self._save_data()
+
     def create_account(self, user_id: str, account_name: str = "Default Simulation Account",
                       initial_balance: float = 100000.0) -> SimulationAccount:
         """Create simulation account"""
@@ -101,6 +126,10 @@ class SimulationAccountManager:
         self.transactions[account_id].append(asdict(transaction))
         self._save_data()
 
+    def get_transaction_count(self, account_id: str) -> int:
+        """Get number of recorded transactions, which changes whenever positions can change"""
+        return len(self.transactions.get(account_id, ()))
+
     def get_transaction_history(self, account_id: str, limit: int = 100) -> List[VirtualTransaction]:
         """Get transaction history"""
         if account_id not in self.transactions:
@@ -124,16 +153,24 @@ class SimulationAccountManager:
         if not transactions:
             return {}
 
-        # Group by stock
+        # Group by stock in one pass, keeping each stock's transactions in order
+        transactions_by_symbol: Dict[str, List[VirtualTransaction]] = {}
+        for txn in transactions:
+            transactions_by_symbol.setdefault(txn.symbol, []).append(txn)
+
         positions = {}
-        for symbol in set(txn.symbol for txn in transactions):
-            symbol_transactions = [t for t in transactions if t.symbol == symbol]
+        for symbol, symbol_transactions in transactions_by_symbol.items():
             position = VirtualPosition.from_transactions(account_id, symbol, symbol_transactions)
             if position and position.quantity > 0:
                 positions[symbol] = position
 
         return positions
 
+    def calculate_positions_bulk(self, account_ids: List[str]) -> Dict[str, Dict[str, VirtualPosition]]:
+        """Calculate positions for several accounts in one call under a single lock acquisition"""
+        with self._lock:
+            return {account_id: self.calculate_positions(account_id) for account_id in account_ids}
+
     def get_account_summary(self, account_id: str) -> Dict[str, Any]:
         """Get account summary"""
         account = self.get_account(account_id)
@@ -4,13 +4,19 @@ Simulation Trading System - Automated Trading Engine
 Automatically executes trades based on portfolio analysis and recommendations
 """
 
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
+import numpy as np
 from .account_manager import SimulationAccountManager
 from .trader import VirtualTrader
 from .models import TransactionType, OrderType
 
 
+# Recommendation quotes younger than this are traded on without re-quoting
+QUOTE_MAX_AGE_SECONDS = 60
+
+
 class AutomatedTrader:
     """Automated trading engine based on portfolio recommendations"""
 
@@ -69,40 +75,46 @@ class AutomatedTrader:
         print(f"📊 Recommendations: {len(buy_recommendations)} BUY, {len(sell_recommendations)} SELL, {len(hold_recommendations)} HOLD")
 
         # Execute SELL orders first (free up cash)
-        for rec in sell_recommendations:
-            symbol = rec.get('symbol')
-            if symbol in current_positions:
-                position = current_positions[symbol]
-                quantity = position.quantity
-
-                try:
-                    transaction = self.virtual_trader.execute_sell_order(
-                        account_id, symbol, quantity, OrderType.MARKET
-                    )
-                    executed_trades.append({
-                        "symbol": symbol,
-                        "action": "SELL",
-                        "quantity": quantity,
-                        "price": transaction.price,
-                        "amount": transaction.total_amount,
-                        "recommendation": rec
-                    })
-                    available_cash += transaction.total_amount - transaction.fee
-                    print(f"✅ SOLD {quantity} shares of {symbol} @ ${transaction.price:.2f}")
-                except Exception as e:
-                    failed_trades.append({
-                        "symbol": symbol,
-                        "action": "SELL",
-                        "error": str(e),
-                        "recommendation": rec
-                    })
-                    print(f"❌ Failed to sell {symbol}: {e}")
+        sell_orders = [
+            {
+                "action": "SELL",
+                "symbol": rec.get('symbol'),
+                "quantity": current_positions[rec.get('symbol')].quantity,
+                "price": self._get_fresh_quote(rec),
+                "recommendation": rec
+            }
+            for rec in sell_recommendations if rec.get('symbol') in current_positions
+        ]
+
+        for result in self.virtual_trader.submit_orders(account_id, sell_orders):
+            order = result["order"]
+            symbol = order["symbol"]
+            transaction = result["transaction"]
+            if transaction:
+                executed_trades.append({
+                    "symbol": symbol,
+                    "action": "SELL",
+                    "quantity": order["quantity"],
+                    "price": transaction.price,
+                    "amount": transaction.total_amount,
+                    "recommendation": order["recommendation"]
+                })
+                available_cash += transaction.total_amount - transaction.fee
+                print(f"✅ SOLD {order['quantity']} shares of {symbol} @ ${transaction.price:.2f}")
+            else:
+                failed_trades.append({
+                    "symbol": symbol,
+                    "action": "SELL",
+                    "error": result["error"],
+                    "recommendation": order["recommendation"]
+                })
+                print(f"❌ Failed to sell {symbol}: {result['error']}")
 
         # Execute BUY orders
         if buy_recommendations:
-            # Calculate cash allocation per buy recommendation
-            cash_per_buy = available_cash / len(buy_recommendations)
-
+            # Resolve prices, re-quoting only recommendations without one
+            priced_recommendations = []
+            prices = []
             for rec in buy_recommendations:
                 symbol = rec.get('symbol')
                 current_price = rec.get('current_price', 0)
@@ -120,40 +132,57 @@ class AutomatedTrader:
                         })
                         continue
 
-                # Calculate quantity to buy (use up to 90% of allocated cash)
-                max_quantity = int((cash_per_buy * 0.9) / current_price)
+                priced_recommendations.append(rec)
+                prices.append(current_price)
 
-                if max_quantity > 0:
-                    try:
-                        transaction = self.virtual_trader.execute_buy_order(
-                            account_id, symbol, max_quantity, OrderType.MARKET
-                        )
-                        executed_trades.append({
-                            "symbol": symbol,
-                            "action": "BUY",
-                            "quantity": max_quantity,
-                            "price": transaction.price,
-                            "amount": transaction.total_amount,
-                            "recommendation": rec
-                        })
-                        total_invested += transaction.total_amount + transaction.fee
-                        print(f"✅ BOUGHT {max_quantity} shares of {symbol} @ ${transaction.price:.2f}")
-                    except Exception as e:
-                        failed_trades.append({
-                            "symbol": symbol,
-                            "action": "BUY",
-                            "error": str(e),
-                            "recommendation": rec
-                        })
-                        print(f"❌ Failed to buy {symbol}: {e}")
+            # Size all positions at once: equal cash split, using up to 90% of each allocation
+            weights = np.full(len(prices), 1.0 / len(buy_recommendations))
+            quantities = np.floor(
+                (available_cash * weights * 0.9) / np.asarray(prices, dtype=np.float64)
+            ).astype(np.int64)
+
+            buy_orders = []
+            for rec, quantity in zip(priced_recommendations, quantities.tolist()):
+                if quantity > 0:
+                    buy_orders.append({
+                        "action": "BUY",
+                        "symbol": rec.get('symbol'),
+                        "quantity": quantity,
+                        "price": self._get_fresh_quote(rec),
+                        "recommendation": rec
+                    })
                 else:
                     failed_trades.append({
-                        "symbol": symbol,
+                        "symbol": rec.get('symbol'),
                         "action": "BUY",
                         "error": "Insufficient cash for minimum purchase",
                         "recommendation": rec
                     })
 
+            for result in self.virtual_trader.submit_orders(account_id, buy_orders):
+                order = result["order"]
+                symbol = order["symbol"]
+                transaction = result["transaction"]
+                if transaction:
+                    executed_trades.append({
+                        "symbol": symbol,
+                        "action": "BUY",
+                        "quantity": order["quantity"],
+                        "price": transaction.price,
+                        "amount": transaction.total_amount,
+                        "recommendation": order["recommendation"]
+                    })
+                    total_invested += transaction.total_amount + transaction.fee
+                    print(f"✅ BOUGHT {order['quantity']} shares of {symbol} @ ${transaction.price:.2f}")
+                else:
+                    failed_trades.append({
+                        "symbol": symbol,
+                        "action": "BUY",
+                        "error": result["error"],
+                        "recommendation": order["recommendation"]
+                    })
+                    print(f"❌ Failed to buy {symbol}: {result['error']}")
+
         # Update account summary
         account_summary = self.account_manager.get_account_summary(account_id)
 
@@ -183,6 +212,14 @@ class AutomatedTrader:
         print(f"🎯 Execution completed: {len(executed_trades)} successful, {len(failed_trades)} failed")
         return result
 
+    def _get_fresh_quote(self, recommendation: Dict[str, Any]) -> Optional[float]:
+        """Return the recommendation's price if it was quoted recently, else None to re-quote"""
+        price = recommendation.get('current_price')
+        quote_ts = recommendation.get('quote_ts')
+        if price and price > 0 and quote_ts and time.time() - quote_ts <= QUOTE_MAX_AGE_SECONDS:
+            return float(price)
+        return None
+
     def get_portfolio_recommendations(self, portfolio_holdings: List[Dict[str, Any]],
                                     recommendation_engine) -> List[Dict[str, Any]]:
         """
@@ -288,17 +325,10 @@ class AutomatedTrader:
         executed_trades = []
         failed_trades = []
 
-        for trade in trades_to_execute:
-            try:
-                if trade["action"] == "BUY":
-                    transaction = self.virtual_trader.execute_buy_order(
-                        account_id, trade["symbol"], trade["quantity"], OrderType.MARKET
-                    )
-                else:
-                    transaction = self.virtual_trader.execute_sell_order(
-                        account_id, trade["symbol"], trade["quantity"], OrderType.MARKET
-                    )
-
+        for result in self.virtual_trader.submit_orders(account_id, trades_to_execute):
+            trade = result["order"]
+            transaction = result["transaction"]
+            if transaction:
                 executed_trades.append({
                     "symbol": trade["symbol"],
                     "action": trade["action"],
@@ -309,13 +339,13 @@ class AutomatedTrader:
 
                 print(f"✅ {trade['action']} {trade['quantity']} shares of {trade['symbol']} @ ${transaction.price:.2f}")
 
-            except Exception as e:
+            else:
                 failed_trades.append({
                     "symbol": trade["symbol"],
                     "action": trade["action"],
-                    "error": str(e)
+                    "error": result["error"]
                 })
-                print(f"❌ Failed to {trade['action']} {trade['symbol']}: {e}")
+                print(f"❌ Failed to {trade['action']} {trade['symbol']}: {result['error']}")
 
         return {
             "success": True,
@@ -64,9 +64,9 @@ class BacktestEngine:
 
         current_balance = initial_balance
 
-        for date in historical_data.index:
-            # Get daily prices
-            daily_prices = historical_data.loc[date]
+        # Walk plain per-day price dicts; a .loc row lookup per day builds a Series each time
+        daily_rows = historical_data.to_dict('records')
+        for date, daily_prices in zip(historical_data.index, daily_rows):
 
             # Execute strategy
             trades = self._execute_strategy(strategy_config, positions, daily_prices, current_balance)
@@ -95,7 +95,8 @@ class BacktestEngine:
             portfolio_values.append(portfolio_value)
 
         # Calculate performance metrics
-        performance = self._calculate_performance(portfolio_values, [self._transaction_to_dict(txn) for txn in transactions])
+        transaction_dicts = [self._transaction_to_dict(txn) for txn in transactions]
+        performance = self._calculate_performance(portfolio_values, transaction_dicts)
 
         return {
             "backtest_id": backtest_id,
@@ -109,7 +110,8 @@ class BacktestEngine:
             "final_balance": portfolio_values[-1] if portfolio_values else initial_balance,
             "performance": performance,
             "portfolio_values": portfolio_values,
-            "transactions": [self._transaction_to_dict(txn) for txn in transactions],
+            "portfolio_dates": historical_data.index,
+            "transactions": transaction_dicts,
             "total_trades": len(transactions)
         }
 
@@ -194,7 +196,7 @@ class BacktestEngine:
         return df
 
     def _execute_strategy(self, strategy_config: Dict[str, Any],
-                         positions: Dict[str, int], daily_prices: pd.Series,
+                         positions: Dict[str, int], daily_prices: Dict[str, float],
                          current_balance: float) -> List[Dict[str, Any]]:
         """Execute strategy"""
         trades = []
@@ -204,7 +206,7 @@ class BacktestEngine:
             # Buy and hold strategy: buy if no positions and have cash
             if not positions and current_balance > 1000:
                 # Buy the cheapest stock
-                cheapest_symbol = daily_prices.idxmin()
+                cheapest_symbol = min(daily_prices, key=daily_prices.get)
                 price = daily_prices[cheapest_symbol]
                 quantity = int((current_balance * 0.9) / price)  # Use 90% of cash
 
@@ -2,7 +2,7 @@
 Simulation Trading System - Virtual Trading Engine
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from .models import VirtualTransaction, TransactionType, OrderType, VirtualPosition
 from .account_manager import SimulationAccountManager
@@ -15,14 +15,15 @@ class VirtualTrader:
         self.transaction_fee_rate = 0.001  # 0.1% transaction fee
 
     def execute_buy_order(self, account_id: str, symbol: str,
-                         quantity: int, order_type: OrderType = OrderType.MARKET) -> VirtualTransaction:
-        """Execute buy order"""
+                         quantity: int, order_type: OrderType = OrderType.MARKET,
+                         price: Optional[float] = None) -> VirtualTransaction:
+        """Execute buy order (at the given fresh quote price, if provided)"""
         account = self.account_manager.get_account(account_id)
         if not account:
             raise ValueError("Account does not exist")
 
         # Get current price
-        current_price = self._get_current_price(symbol)
+        current_price = price if price else self._get_current_price(symbol)
         total_amount = quantity * current_price
         fee = total_amount * self.transaction_fee_rate
 
@@ -53,8 +54,9 @@ class VirtualTrader:
         return transaction
 
     def execute_sell_order(self, account_id: str, symbol: str,
-                          quantity: int, order_type: OrderType = OrderType.MARKET) -> VirtualTransaction:
-        """Execute sell order"""
+                          quantity: int, order_type: OrderType = OrderType.MARKET,
+                          price: Optional[float] = None) -> VirtualTransaction:
+        """Execute sell order (at the given fresh quote price, if provided)"""
         account = self.account_manager.get_account(account_id)
         if not account:
             raise ValueError("Account does not exist")
@@ -66,7 +68,7 @@ class VirtualTrader:
             raise ValueError(f"Insufficient position. Holding: {available_qty} shares, Selling: {quantity} shares")
 
         # Get current price
-        current_price = self._get_current_price(symbol)
+        current_price = price if price else self._get_current_price(symbol)
         total_amount = quantity * current_price
         fee = total_amount * self.transaction_fee_rate
 
@@ -92,6 +94,32 @@ class VirtualTrader:
 
         return transaction
 
+    def submit_orders(self, account_id: str, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute a batch of orders under one account lock with a single save
+
+        Args:
+            account_id: Simulation account ID
+            orders: Order dicts with "action" ("BUY"/"SELL"), "symbol", "quantity"
+                and an optional fresh quote "price"
+
+        Returns:
+            One result dict per order with "order", "transaction" and "error"
+        """
+        results = []
+        with self.account_manager.batched_writes():
+            for order in orders:
+                execute = self.execute_buy_order if order["action"] == "BUY" else self.execute_sell_order
+                try:
+                    transaction = execute(account_id, order["symbol"], order["quantity"],
+                                          order.get("order_type", OrderType.MARKET),
+                                          price=order.get("price"))
+                    results.append({"order": order, "transaction": transaction, "error": None})
+                except Exception as e:
+                    results.append({"order": order, "transaction": None, "error": str(e)})
+
+        return results
+
     def _get_current_price(self, symbol: str) -> float:
         """Get current stock price from real market data"""
         try:
@@ -199,19 +199,23 @@ def show_virtual_trading():
 
     positions = simulation_manager.calculate_positions(account_id)
     if positions:
-        positions_data = []
-        for symbol, position in positions.items():
-            positions_data.append({
-                "Stock": symbol,
-                "Quantity": position.quantity,
-                "Average Cost": f"${position.average_cost:.2f}",
-                "Current Price": f"${position.current_price:.2f}",
-                "Market Value": f"${position.market_value:.2f}",
-                "P&L": f"${position.unrealized_pnl:+.2f}",
-                "P&L %": f"{position.unrealized_pnl_pct:+.1f}%"
-            })
-
-        st.dataframe(positions_data, use_container_width=True)
+        # Keep numeric columns so the table sorts by value; formatting is display-only
+        positions_df = pd.DataFrame.from_records(
+            ((symbol, position.quantity, position.average_cost, position.current_price,
+              position.market_value, position.unrealized_pnl, position.unrealized_pnl_pct)
+             for symbol, position in positions.items()),
+            columns=["Stock", "Quantity", "Average Cost", "Current Price", "Market Value", "P&L", "P&L %"]
+        )
+        st.dataframe(
+            positions_df.style.format({
+                "Average Cost": "${:.2f}",
+                "Current Price": "${:.2f}",
+                "Market Value": "${:.2f}",
+                "P&L": "${:+.2f}",
+                "P&L %": "{:+.1f}%"
+            }),
+            use_container_width=True
+        )
     else:
         st.info("No positions")
 
@@ -279,18 +283,18 @@ def show_backtesting():
                         # Display portfolio value curve
                         portfolio_values = result["portfolio_values"]
                         if portfolio_values:
-                            chart_data = pd.DataFrame(portfolio_values)
-                            chart_data["date"] = pd.to_datetime(chart_data["date"])
+                            chart_data = pd.Series(portfolio_values, index=result["portfolio_dates"], name="value")
 
                             st.subheader("📊 Portfolio Value Curve")
-                            st.line_chart(chart_data.set_index("date")["value"])
+                            st.line_chart(chart_data)
 
                         # Display transaction records
                         transactions = result["transactions"]
                         if transactions:
                             st.subheader("📋 Transaction Records")
-                            txn_df = pd.DataFrame(transactions)
-                            txn_df["timestamp"] = pd.to_datetime(txn_df["timestamp"])
+                            txn_df = pd.DataFrame.from_records(transactions)
+                            # Trades share their backtest day's timestamp; a fixed format parses each distinct one once
+                            txn_df["timestamp"] = pd.to_datetime(txn_df["timestamp"], format="ISO8601", cache=True)
                             st.dataframe(txn_df, use_container_width=True)
 
                     else:
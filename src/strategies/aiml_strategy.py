@@ -112,7 +112,7 @@ class AIMLStrategy(TradingStrategy):
     
     def _format_reason(self, key: str, *args) -> str:
         """Format reason using language configuration"""
-        return self.lang_config.get(key).format(*args) if args else self.lang_config.get(key)
+        return self.lang_config.t(key, *args)
     
     def _generate_recommendation(self, score: int, reasons: List[str], strategy_name: str) -> Dict:
         """Generate final recommendation based on score"""
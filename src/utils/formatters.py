@@ -2,52 +2,56 @@
 Utility functions for formatting reports and other helper functions
 """
 from typing import Dict
+from ..languages.text_ids import TextId
 
 
 def format_recommendation_report(recommendation: Dict, lang_config) -> str:
     """Format recommendation report based on selected language"""
     
     separator = '='*60
+    text = lang_config.text
+    key_metrics = text(TextId.KEY_METRICS)
+    sma_label = key_metrics.split(':')[0] if ':' in key_metrics else 'SMA'
     
     report = f"""
 {separator}
-           {lang_config.get('report_title')}
+           {text(TextId.REPORT_TITLE)}
 {separator}
 
-{lang_config.get('stock_code')}: {recommendation['symbol']}
-{lang_config.get('current_price')}: ${recommendation['current_price']:.2f}
-{lang_config.get('price_change')}: ${recommendation['price_change']:+.2f} ({recommendation['price_change_pct']:+.2f}%)
-{lang_config.get('analysis_time')}: {recommendation['analysis_time']}
+{text(TextId.STOCK_CODE)}: {recommendation['symbol']}
+{text(TextId.CURRENT_PRICE)}: ${recommendation['current_price']:.2f}
+{text(TextId.PRICE_CHANGE)}: ${recommendation['price_change']:+.2f} ({recommendation['price_change_pct']:+.2f}%)
+{text(TextId.ANALYSIS_TIME)}: {recommendation['analysis_time']}
 
 {separator}
-{lang_config.get('technical_analysis')}
+{text(TextId.TECHNICAL_ANALYSIS)}
 {separator}
-{lang_config.get('trend_analysis')}: {recommendation['trend']}
-{lang_config.get('momentum_indicators')}: {recommendation['momentum']}
-{lang_config.get('volume_analysis')}: {recommendation['volume']}
+{text(TextId.TREND_ANALYSIS)}: {recommendation['trend']}
+{text(TextId.MOMENTUM_INDICATORS)}: {recommendation['momentum']}
+{text(TextId.VOLUME_ANALYSIS)}: {recommendation['volume']}
 
-{lang_config.get('key_metrics')}:
+{key_metrics}:
 - RSI: {recommendation['key_metrics']['RSI']}
 - MACD: {recommendation['key_metrics']['MACD']:.4f}
-- {lang_config.get('key_metrics').split(':')[0] if ':' in lang_config.get('key_metrics') else 'SMA'} 20: ${recommendation['key_metrics']['SMA20']:.2f}
-- {lang_config.get('key_metrics').split(':')[0] if ':' in lang_config.get('key_metrics') else 'SMA'} 50: ${recommendation['key_metrics']['SMA50']:.2f}
+- {sma_label} 20: ${recommendation['key_metrics']['SMA20']:.2f}
+- {sma_label} 50: ${recommendation['key_metrics']['SMA50']:.2f}
 
 {separator}
-{lang_config.get('investment_advice')}
+{text(TextId.INVESTMENT_ADVICE)}
 {separator}
-{lang_config.get('recommended_action')}: {recommendation['recommendation']['action']}
-{lang_config.get('confidence_level')}: {recommendation['recommendation']['confidence']}
-{lang_config.get('risk_rating')}: {recommendation['risk_level']}
-{lang_config.get('composite_score')}: {recommendation['recommendation']['score']}/100
+{text(TextId.RECOMMENDED_ACTION)}: {recommendation['recommendation']['action']}
+{text(TextId.CONFIDENCE_LEVEL)}: {recommendation['recommendation']['confidence']}
+{text(TextId.RISK_RATING)}: {recommendation['risk_level']}
+{text(TextId.COMPOSITE_SCORE)}: {recommendation['recommendation']['score']}/100
 
-{lang_config.get('analysis_basis')}:
+{text(TextId.ANALYSIS_BASIS)}:
 """
     
     for i, signal in enumerate(recommendation['recommendation']['signals'], 1):
         report += f"{i}. {signal}\n"
     
     report += f"\n{separator}\n"
-    report += f"{lang_config.get('disclaimer')}\n"
+    report += f"{text(TextId.DISCLAIMER)}\n"
     report += separator
     
     return report
@@ -8,6 +8,8 @@ import streamlit as st
 from typing import Dict, List, Optional, Tuple
 import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 class StockInfoManager:
@@ -17,6 +19,8 @@ class StockInfoManager:
         self.stock_cache_file = os.path.expanduser("~/.stock_recommender/stock_info_cache.json")
         self.ensure_cache_dir()
         self.stock_info_cache = self._load_cache()
+        # Shared by every app session: cache updates and saves run under this lock
+        self._cache_lock = threading.RLock()
     
     def ensure_cache_dir(self):
         """Ensure cache directory exists"""
@@ -37,7 +41,7 @@ class StockInfoManager:
     def _save_cache(self):
         """Save stock information cache"""
         try:
-            with open(self.stock_cache_file, 'w', encoding='utf-8') as f:
+            with self._cache_lock, open(self.stock_cache_file, 'w', encoding='utf-8') as f:
                 json.dump(self.stock_info_cache, f, ensure_ascii=False, indent=2)
         except Exception as e:
             print(f"Failed to save cache: {e}")
@@ -84,6 +88,53 @@ class StockInfoManager:
         if not force_refresh and cache_key in self.stock_info_cache:
             return self.stock_info_cache[cache_key]
         
+        stock_info = self._fetch_stock_info(symbol)
+        if stock_info:
+            # Cache the result
+            with self._cache_lock:
+                self.stock_info_cache[cache_key] = stock_info
+                self._save_cache()
+        
+        return stock_info
+    
+    def get_stock_info_batch(self, symbols: List[str], force_refresh: bool = False,
+                             max_workers: int = 8) -> Dict[str, Dict]:
+        """
+        Get detailed stock information for several symbols at once
+        Args:
+            symbols: Stock symbols
+            force_refresh: Whether to ignore cache
+            max_workers: Maximum number of concurrent fetches
+        Returns:
+            Dictionary mapping each symbol to its information (failed symbols are omitted)
+        """
+        date_suffix = datetime.now().strftime('%Y-%m-%d')
+        results = {}
+        missing = []
+        
+        for symbol in dict.fromkeys(s.upper().strip() for s in symbols):
+            cache_key = f"{symbol}_{date_suffix}"
+            if not force_refresh and cache_key in self.stock_info_cache:
+                results[symbol] = self.stock_info_cache[cache_key]
+            else:
+                missing.append(symbol)
+        
+        if missing:
+            # Fetch uncached symbols concurrently and persist the cache once
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+                fetched = dict(zip(missing, executor.map(self._fetch_stock_info, missing)))
+            
+            with self._cache_lock:
+                for symbol, stock_info in fetched.items():
+                    if stock_info:
+                        self.stock_info_cache[f"{symbol}_{date_suffix}"] = stock_info
+                        results[symbol] = stock_info
+                self._save_cache()
+        
+        return results
+    
+    def _fetch_stock_info(self, symbol: str) -> Optional[Dict]:
+        """Fetch stock information from yfinance without touching the cache"""
         try:
             # Get data from yfinance
             ticker = yf.Ticker(symbol)
@@ -123,10 +174,6 @@ class StockInfoManager:
                 "description": info.get("longBusinessSummary", "")[:200] + "..." if info.get("longBusinessSummary") else ""
             }
             
-            # Cache the result
-            self.stock_info_cache[cache_key] = stock_info
-            self._save_cache()
-            
             return stock_info
             
         except Exception as e:
@@ -146,7 +193,7 @@ class StockInfoManager:
         else:
             return f"{symbol} - {name} ({sector})"
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+@st.cache_resource
 def get_stock_manager():
-    """Get stock information manager instance"""
+    """Get the stock information manager instance shared by all sessions"""
     return StockInfoManager()
\ No newline at end of file
@@ -75,13 +75,13 @@ def main():
             return 1
             
     except Exception as e:
-        print(lang_config.get("error").format(str(e)))
+        print(lang_config.t("error", str(e)))
         return 1
 
 
 def run_single_stock_analysis(args, lang_config):
     """Run single stock analysis (original functionality)"""
-    print(lang_config.get("analyzing").format(args.symbol))
+    print(lang_config.t("analyzing", args.symbol))
     
     # Create analyzer and recommendation engine
     analyzer = StockAnalyzer(args.symbol, lang_config)
@@ -103,9 +103,8 @@ def display_batch_recommendations(result, lang_config):
         print(lang_config.get("no_successful_analysis"))
         return
     
-    print(f"\n" + "="*80)
-    print(lang_config.get("stock_recommendation_results"))
-    print("="*80)
+    # Collect the report and write it to stdout in one go
+    lines = [f"\n" + "="*80, lang_config.get("stock_recommendation_results"), "="*80]
     
     # Categorize by recommendation action
     buy_stocks = []
@@ -144,39 +143,41 @@ def display_batch_recommendations(result, lang_config):
     
     # Display buy recommendations
     if buy_stocks:
-        print(f"\n{lang_config.get('buy_recommendations').format(len(buy_stocks))}")
+        lines.append(f"\n{lang_config.t('buy_recommendations', len(buy_stocks))}")
         for stock in buy_stocks:
-            print(f"   📈 {lang_config.get('stock_score_confidence').format(stock['symbol'], stock['score'], stock['confidence'])}")
+            lines.append(f"   📈 {lang_config.t('stock_score_confidence', stock['symbol'], stock['score'], stock['confidence'])}")
     
     # Display sell recommendations
     if sell_stocks:
-        print(f"\n{lang_config.get('sell_recommendations').format(len(sell_stocks))}")
+        lines.append(f"\n{lang_config.t('sell_recommendations', len(sell_stocks))}")
         for stock in sell_stocks:
-            print(f"   📉 {lang_config.get('stock_score_confidence').format(stock['symbol'], stock['score'], stock['confidence'])}")
+            lines.append(f"   📉 {lang_config.t('stock_score_confidence', stock['symbol'], stock['score'], stock['confidence'])}")
     
     # Display short recommendations
     if short_stocks:
-        print(f"\n{lang_config.get('short_recommendations').format(len(short_stocks))}")
+        lines.append(f"\n{lang_config.t('short_recommendations', len(short_stocks))}")
         for stock in short_stocks:
-            print(f"   📉 {lang_config.get('stock_score_confidence').format(stock['symbol'], stock['score'], stock['confidence'])}")
+            lines.append(f"   📉 {lang_config.t('stock_score_confidence', stock['symbol'], stock['score'], stock['confidence'])}")
     
     # Display hold recommendations
     if hold_stocks:
-        print(f"\n{lang_config.get('hold_recommendations').format(len(hold_stocks))}")
+        lines.append(f"\n{lang_config.t('hold_recommendations', len(hold_stocks))}")
         for stock in hold_stocks:
-            print(f"   ⏸️  {lang_config.get('stock_score_confidence').format(stock['symbol'], stock['score'], stock['confidence'])}")
+            lines.append(f"   ⏸️  {lang_config.t('stock_score_confidence', stock['symbol'], stock['score'], stock['confidence'])}")
     
     # Display portfolio suggestions
-    print(f"\n{lang_config.get('portfolio_title')}")
+    lines.append(f"\n{lang_config.get('portfolio_title')}")
     if buy_stocks:
         top_buys = buy_stocks[:min(5, len(buy_stocks))]
-        print(f"   {lang_config.get('portfolio_top_picks').format(len(top_buys), ', '.join([s['symbol'] for s in top_buys]))}")
+        lines.append(f"   {lang_config.t('portfolio_top_picks', len(top_buys), ', '.join([s['symbol'] for s in top_buys]))}")
     
     if sell_stocks or short_stocks:
         risk_stocks = (sell_stocks + short_stocks)[:5]
-        print(f"   {lang_config.get('risk_stocks').format(', '.join([s['symbol'] for s in risk_stocks]))}")
+        lines.append(f"   {lang_config.t('risk_stocks', ', '.join([s['symbol'] for s in risk_stocks]))}")
     
-    print("="*80)
+    lines.append("="*80)
+    
+    print("\n".join(lines))
 
 
 def run_multi_stock_analysis(args, lang_config):
@@ -206,7 +207,7 @@ def run_multi_stock_analysis(args, lang_config):
             print(lang_config.get("no_valid_stock_symbols"))
             return 1
         
-        print(lang_config.get("parsing_summary").format(parse_result['valid_count'], parse_result['original_count']))
+        print(lang_config.t("parsing_summary", parse_result['valid_count'], parse_result['original_count']))
         
         # Create batch analyzer
         batch_analyzer = BatchAnalyzer(lang_config, period=args.period)
@@ -224,7 +225,7 @@ def run_multi_stock_analysis(args, lang_config):
         return 0
         
     except Exception as e:
-        print(lang_config.get("multi_stock_analysis_failed").format(str(e)))
+        print(lang_config.t("multi_stock_analysis_failed", str(e)))
         return 1
 
 
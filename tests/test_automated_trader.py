@@ -0,0 +1,84 @@
+"""
+Unit tests for the automated trading engine
+"""
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+from src.simulation.account_manager import SimulationAccountManager
+from src.simulation.trader import VirtualTrader
+from src.simulation.automated_trader import AutomatedTrader, QUOTE_MAX_AGE_SECONDS
+
+
+def make_buy_recommendation(symbol, price, quote_ts):
+    """Build a minimal BUY recommendation as produced by the recommendation engine"""
+    return {
+        'symbol': symbol,
+        'current_price': price,
+        'quote_ts': quote_ts,
+        'recommendation': {'action': 'BUY', 'confidence': 'High'}
+    }
+
+
+class TestAutomatedTrader(unittest.TestCase):
+    """Test automated trade sizing and quote reuse"""
+
+    def setUp(self):
+        """Set up an isolated account with offline prices"""
+        data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(data_dir.cleanup)
+        self.account_manager = SimulationAccountManager(data_dir.name)
+        self.account = self.account_manager.create_account("test_user", "Test", 10000.0)
+        self.trader = AutomatedTrader(self.account_manager, VirtualTrader(self.account_manager))
+
+        # Live quotes come back at a price no recommendation uses
+        quote_patcher = patch.object(VirtualTrader, '_get_current_price', return_value=50.0)
+        self.live_quote = quote_patcher.start()
+        self.addCleanup(quote_patcher.stop)
+        position_patcher = patch('src.simulation.models.VirtualPosition._get_current_price', return_value=50.0)
+        position_patcher.start()
+        self.addCleanup(position_patcher.stop)
+
+    def execute(self, recommendations):
+        """Execute recommendations against the test account and return the executed trades"""
+        result = self.trader.execute_portfolio_recommendations(self.account.account_id, recommendations)
+        self.assertTrue(result['success'])
+        return {trade['symbol']: trade for trade in result['executed_trades']}
+
+    def test_buy_quantities_split_cash_equally(self):
+        """Test each buy gets an equal cash share, of which up to 90% is spent"""
+        now = time.time()
+        trades = self.execute([
+            make_buy_recommendation('AAA', 100.0, now),
+            make_buy_recommendation('BBB', 30.0, now),
+            make_buy_recommendation('CCC', 6000.0, now),
+        ])
+
+        # 10000 / 3 * 0.9 = 3000 per symbol
+        self.assertEqual(trades['AAA']['quantity'], 30)
+        self.assertEqual(trades['BBB']['quantity'], 100)
+        self.assertNotIn('CCC', trades)
+        self.assertIsInstance(trades['AAA']['quantity'], int)
+
+    def test_fresh_quote_is_reused(self):
+        """Test a recently fetched price fills the order without re-quoting"""
+        trades = self.execute([make_buy_recommendation('AAA', 100.0, time.time())])
+
+        self.assertEqual(trades['AAA']['price'], 100.0)
+        self.live_quote.assert_not_called()
+
+    def test_stale_or_unknown_quote_is_requoted(self):
+        """Test prices from old or untimed data fill at a live quote instead"""
+        stale_ts = time.time() - QUOTE_MAX_AGE_SECONDS - 1
+        trades = self.execute([
+            make_buy_recommendation('AAA', 100.0, stale_ts),
+            make_buy_recommendation('BBB', 100.0, None),
+        ])
+
+        self.assertEqual(trades['AAA']['price'], 50.0)
+        self.assertEqual(trades['BBB']['price'], 50.0)
+        self.assertEqual(self.live_quote.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 Unit tests for recommendation engine and strategy manager
 """
 import unittest
+from unittest.mock import patch
 from tests.test_utils import MockStockAnalyzer, MockStockData, assert_recommendation_structure, assert_valid_recommendation_values
 from src.languages.config import LanguageConfig
 from src.engines.recommendation_engine import RecommendationEngine
@@ -224,6 +225,68 @@ class TestRecommendationEngine(unittest.TestCase):
         # RSI should be between 0 and 100
         self.assertGreaterEqual(metrics['RSI'], 0)
         self.assertLessEqual(metrics['RSI'], 100)
+    
+    def test_set_language_keeps_strategy_objects(self):
+        """Test switching language in place reuses the strategy instances"""
+        strategies = dict(self.engine.strategy_manager.strategies)
+        en_trend = self.engine.generate_recommendation('technical')['trend']
+        
+        self.engine.set_language('zh')
+        self.addCleanup(self.engine.set_language, self.lang_config)
+        
+        self.assertEqual(self.engine.strategy_manager.strategies, strategies)
+        for strategy in strategies.values():
+            self.assertIs(strategy.lang_config, self.engine.lang_config)
+        self.assertNotEqual(self.engine.generate_recommendation('technical')['trend'], en_trend)
+    
+    def test_generate_recommendation_for_symbol_is_memoized(self):
+        """Test repeated symbol recommendations are served from the memo cache"""
+        RecommendationEngine.clear_cache()
+        self.addCleanup(RecommendationEngine.clear_cache)
+        
+        with patch.object(self.engine.strategy_manager, 'get_recommendation',
+                          wraps=self.engine.strategy_manager.get_recommendation) as mocked:
+            first = self.engine.generate_recommendation_for_symbol(self.analyzer, "TEST", 'technical')
+            first['recommendation']['score'] = None
+            # Age the memoized entry; a hit is stamped with the time of the request
+            next(iter(RecommendationEngine._recommendation_cache.values()))['analysis_time'] = '2000-01-01 00:00:00'
+            second = self.engine.generate_recommendation_for_symbol(self.analyzer, "TEST", 'technical')
+            self.assertEqual(mocked.call_count, 1)
+            
+            # New data invalidates the cached entry
+            self.analyzer.data = MockStockData.create_sample_data(120)
+            self.engine.generate_recommendation_for_symbol(self.analyzer, "TEST", 'technical')
+            self.assertEqual(mocked.call_count, 2)
+        
+        self.assertIsNotNone(second['recommendation']['score'])
+        self.assertNotEqual(second['analysis_time'], '2000-01-01 00:00:00')
+    
+    def test_quote_ts_follows_data_fetch_time(self):
+        """Test quote timestamps come from when the data was fetched, including memo hits"""
+        RecommendationEngine.clear_cache()
+        self.addCleanup(RecommendationEngine.clear_cache)
+        
+        self.assertIsNone(self.engine.generate_recommendation_for_symbol(self.analyzer, "TEST")['quote_ts'])
+        
+        self.analyzer.fetched_at = 1234.5
+        self.addCleanup(delattr, self.analyzer, 'fetched_at')
+        self.assertEqual(self.engine.generate_recommendation_for_symbol(self.analyzer, "TEST")['quote_ts'], 1234.5)
+    
+    def test_generate_recommendations_batch(self):
+        """Test batch recommendations keep input order and isolate failures"""
+        analyzers = {
+            "AAA": MockStockAnalyzer("AAA", MockStockData.create_sample_data(100)),
+            "BAD": MockStockAnalyzer("BAD", MockStockData.create_sample_data(100).iloc[0:0]),
+            "BBB": MockStockAnalyzer("BBB", MockStockData.create_sample_data(110)),
+        }
+        
+        recommendations, errors = self.engine.generate_recommendations_batch(analyzers, 'technical')
+        
+        self.assertEqual(list(recommendations), ["AAA", "BBB"])
+        self.assertEqual(list(errors), ["BAD"])
+        for recommendation in recommendations.values():
+            assert_recommendation_structure(self, recommendation)
+        self.assertIs(self.engine.analyzer, self.analyzer)
 
 
 if __name__ == '__main__':
@@ -1,9 +1,12 @@
 """
 Unit tests for language configuration
 """
+import copy
+import pickle
 import unittest
 from tests.test_utils import TestConfig
 from src.languages.config import LanguageConfig
+from src.languages.text_ids import TextId
 
 
 class TestLanguageConfig(unittest.TestCase):
@@ -38,6 +41,42 @@ class TestLanguageConfig(unittest.TestCase):
         self.assertIn('{}', en_analyzing)  # Should have placeholder
         self.assertIn('{}', zh_analyzing)  # Should have placeholder
     
+    def test_instances_are_shared_per_language(self):
+        """Test that configs are interned per language"""
+        self.assertIs(LanguageConfig('en'), self.en_config)
+        self.assertIs(LanguageConfig('ZH'), self.zh_config)
+        self.assertIsNot(self.en_config, self.zh_config)
+    
+    def test_copy_and_pickle_return_shared_instance(self):
+        """Test that copying or pickling a config yields the shared instance for its language"""
+        for config in (self.en_config, self.zh_config):
+            self.assertIs(copy.deepcopy(config), config)
+            self.assertIs(pickle.loads(pickle.dumps(config)), config)
+    
+    def test_text_ids_match_keys(self):
+        """Test that id-based lookup returns the same text as key lookup"""
+        for config in (self.en_config, self.zh_config):
+            for text_id in TextId:
+                self.assertEqual(config.text(text_id), config.get(text_id.name.lower()))
+    
+    def test_texts_are_read_only(self):
+        """Test that shared text tables cannot be mutated"""
+        for config in (self.en_config, self.zh_config):
+            with self.assertRaises(TypeError):
+                config.texts['analyzing'] = 'changed'
+    
+    def test_t_matches_str_format(self):
+        """Test that t() renders the same text as get().format()"""
+        cases = [('analyzing', ('AAPL',)), ('batch_success_rate', (3, 75.0)),
+                 ('stock_score_confidence', ('AAPL', 42, 'High')),
+                 ('strategy_momentum_strong', (1.234, 5.678)), ('error', ('100%',))]
+        for config in (self.en_config, self.zh_config):
+            for key, args in cases:
+                with self.subTest(language=config.language, key=key):
+                    self.assertEqual(config.t(key, *args), config.get(key).format(*args))
+        
+        self.assertEqual(self.en_config.t('analyzing'), self.en_config.get('analyzing'))
+    
     def test_common_keys_exist(self):
         """Test that common keys exist in both languages"""
         common_keys = [
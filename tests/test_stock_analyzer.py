@@ -2,10 +2,12 @@
 Unit tests for stock analyzer
 """
 import unittest
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
 from datetime import datetime
 from tests.test_utils import MockStockData, MockStockAnalyzer, TestConfig
+from src.analyzers.stock_analyzer import StockAnalyzer
 
 
 class TestStockAnalyzer(unittest.TestCase):
@@ -142,6 +144,22 @@ class TestStockAnalyzer(unittest.TestCase):
         # SMA50 should be NaN with only 10 days of data
         self.assertTrue(pd.isna(metrics['sma_50']) or metrics['sma_50'] is None)
 
+    
+    def test_bulk_fetch_splits_download_per_symbol(self):
+        """Test bulk fetch splits one multi-ticker download into per-symbol data"""
+        sample = MockStockData.create_sample_data(30)
+        frames = {'AAPL': sample, 'MSFT': sample * 2}
+        downloaded = pd.concat(frames, axis=1)
+        
+        with patch('src.analyzers.stock_analyzer.yf.download', return_value=downloaded) as download:
+            analyzers = StockAnalyzer.bulk_fetch(['aapl', 'MSFT', 'NONE'])
+        
+        download.assert_called_once()
+        self.assertEqual(list(analyzers), ['AAPL', 'MSFT', 'NONE'])
+        pd.testing.assert_frame_equal(analyzers['AAPL'].data, frames['AAPL'], check_freq=False)
+        pd.testing.assert_frame_equal(analyzers['MSFT'].data, frames['MSFT'], check_freq=False)
+        self.assertIsNone(analyzers['NONE'].data)
+
 
 if __name__ == '__main__':
     unittest.main()